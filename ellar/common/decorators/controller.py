@@ -14,6 +14,7 @@ from ellar.constants import (
 from ellar.core import ControllerBase
 from ellar.core.controller import ControllerType
 from ellar.di import RequestScope, injectable
+from ellar.di.scopes import DIScope, ScopeDecorator, TransientScope
 from ellar.exceptions import ImproperConfiguration
 from ellar.reflect import reflect
 
@@ -62,6 +63,7 @@ def Controller(
     version: t.Union[t.Tuple, str] = (),
     guards: t.List[t.Union[t.Type["GuardCanActivate"], "GuardCanActivate"]] = None,
     include_in_schema: bool = True,
+    scope: t.Union[t.Type[DIScope], ScopeDecorator] = RequestScope,
 ) -> t.Union[t.Type[ControllerBase], t.Callable[..., t.Any], t.Any]:  # pragma: no cover
     ...
 
@@ -77,7 +79,12 @@ def Controller(
     version: t.Union[t.Tuple, str] = (),
     guards: t.List[t.Union[t.Type["GuardCanActivate"], "GuardCanActivate"]] = None,
     include_in_schema: bool = True,
+    scope: t.Union[t.Type[DIScope], ScopeDecorator] = RequestScope,
 ) -> t.Union[t.Type[ControllerBase], t.Callable[..., t.Any], t.Any]:
+    """
+    `scope` is the controller injection scope. With `SingletonScope`, the controller
+    is created once and shared by all requests, `self.context` stays request specific
+    """
     _prefix: t.Optional[t.Any] = prefix if prefix is not None else NOT_SET
     if prefix and isinstance(prefix, type):
         _prefix = NOT_SET
@@ -129,7 +136,14 @@ def Controller(
         if not reflect.get_metadata(CONTROLLER_WATERMARK, _controller_type):
             reflect.define_metadata(CONTROLLER_WATERMARK, True, _controller_type)
             reflect_all_controller_type_routes(_controller_type)
-            injectable(RequestScope)(cls)
+            injectable(scope)(cls)
+            _scope = scope.scope if isinstance(scope, ScopeDecorator) else scope
+            # instances outliving a request keep their context in a ContextVar
+            if not (
+                isinstance(_scope, type)
+                and issubclass(_scope, (RequestScope, TransientScope))
+            ):
+                _controller_type.create_context_var()
 
             for key in CONTROLLER_METADATA.keys:
                 reflect.define_metadata(key, kwargs[key], _controller_type)
@@ -168,6 +168,7 @@ def Body(
     *,
     embed: bool = False,
     media_type: str = "application/json",
+    max_size: t.Optional[int] = None,
     alias: t.Optional[str] = None,
     title: t.Optional[str] = None,
     description: t.Optional[str] = None,
@@ -186,6 +187,7 @@ def Body(
         default,
         embed=embed,
         media_type=media_type,
+        max_size=max_size,
         alias=alias,
         title=title,
         description=description,
@@ -206,6 +208,7 @@ def Form(
     default: t.Any = ...,
     *,
     media_type: str = "application/x-www-form-urlencoded",
+    max_size: t.Optional[int] = None,
     alias: t.Optional[str] = None,
     title: t.Optional[str] = None,
     description: t.Optional[str] = None,
@@ -223,6 +226,7 @@ def Form(
     return params.Form(
         default,
         media_type=media_type,
+        max_size=max_size,
         alias=alias,
         title=title,
         description=description,
@@ -243,6 +247,10 @@ def File(
     default: t.Any = ...,
     *,
     media_type: str = "multipart/form-data",
+    max_size: t.Optional[int] = None,
+    spool_max_size: t.Optional[int] = None,
+    spool_dir: t.Optional[str] = None,
+    hash_algorithm: t.Optional[str] = None,
     alias: t.Optional[str] = None,
     title: t.Optional[str] = None,
     description: t.Optional[str] = None,
@@ -260,6 +268,10 @@ def File(
     return params.File(
         default,
         media_type=media_type,
+        max_size=max_size,
+        spool_max_size=spool_max_size,
+        spool_dir=spool_dir,
+        hash_algorithm=hash_algorithm,
         alias=alias,
         title=title,
         description=description,
@@ -1,5 +1,6 @@
 from .cache_properties import cached_property
 from .contextmanager import asynccontextmanager
+from .contextvars import ContextVar, Token
 from .dict import AttributeDict, AttributeDictAccessMixin, DataMapper
 from .emails import EmailStr
 
@@ -9,5 +10,7 @@ __all__ = [
     "AttributeDictAccessMixin",
     "DataMapper",
     "asynccontextmanager",
+    "ContextVar",
+    "Token",
     "AttributeDict",
 ]
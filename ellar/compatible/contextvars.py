@@ -0,0 +1,3 @@
+# `contextvars` is in the standard library from python 3.7,
+# on python 3.6 it is provided by the `contextvars` backport package
+from contextvars import ContextVar as ContextVar, Token as Token  # noqa
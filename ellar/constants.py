@@ -42,6 +42,7 @@ SCOPE_SERVICE_PROVIDER = "service_provider"
 SCOPE_EXECUTION_CONTEXT_PROVIDER = "service_execution_context_provider"
 SCOPE_API_VERSIONING_RESOLVER = "api_versioning_resolver"
 SCOPE_API_VERSIONING_SCHEME = "api_versioning_scheme"
+SCOPE_API_ROUTE_VERSION = "api_route_version"
 ELLAR_CONFIG_MODULE = "ELLAR_CONFIG_MODULE"
 INJECTABLE_ATTRIBUTE = "__di_scope__"
 
@@ -0,0 +1,85 @@
+import email.message
+import json
+import typing as t
+from abc import ABC, abstractmethod
+from functools import lru_cache
+
+from .response import JSONResponse, ORJSONResponse, UJSONResponse
+
+try:
+    import ujson
+except ImportError:  # pragma: nocover
+    ujson = None  # type: ignore
+
+
+try:
+    import orjson
+except ImportError:  # pragma: nocover
+    orjson = None  # type: ignore
+
+__all__ = [
+    "BaseJSONCodec",
+    "JSONCodec",
+    "UJSONCodec",
+    "ORJSONCodec",
+    "is_json_content_type",
+]
+
+
+@lru_cache(maxsize=128)
+def is_json_content_type(content_type: t.Optional[bytes]) -> bool:
+    """
+    Checks a raw `content-type` header value. A missing value is treated as JSON
+    """
+    if not content_type:
+        return True
+    message = email.message.Message()
+    message["content-type"] = content_type.decode("latin-1")
+    if message.get_content_maintype() != "application":
+        return False
+    subtype = message.get_content_subtype()
+    return subtype == "json" or subtype.endswith("+json")
+
+
+class BaseJSONCodec(ABC):
+    """
+    Decodes JSON request bodies and websocket frames.
+    `response_class` is the JSON response used by the exception handlers
+    when `JSON_CODEC_EXCEPTION_RESPONSES` is enabled
+    """
+
+    decode_error: t.Type[Exception] = ValueError
+    response_class: t.Type[JSONResponse] = JSONResponse
+
+    @abstractmethod
+    def loads(self, data: t.Union[str, bytes]) -> t.Any:
+        """Decodes `data`. Raises `decode_error` for malformed data"""
+
+
+class JSONCodec(BaseJSONCodec):
+    decode_error = json.JSONDecodeError
+
+    def loads(self, data: t.Union[str, bytes]) -> t.Any:
+        return json.loads(data)
+
+
+class UJSONCodec(BaseJSONCodec):
+    response_class = UJSONResponse
+
+    def __init__(self) -> None:
+        assert ujson is not None, "ujson must be installed to use UJSONCodec"
+        self.decode_error = ujson.JSONDecodeError
+
+    def loads(self, data: t.Union[str, bytes]) -> t.Any:
+        return ujson.loads(data)
+
+
+class ORJSONCodec(BaseJSONCodec):
+    response_class = ORJSONResponse
+
+    def __init__(self) -> None:
+        assert orjson is not None, "orjson must be installed to use ORJSONCodec"
+        self.decode_error = orjson.JSONDecodeError
+
+    def loads(self, data: t.Union[str, bytes]) -> t.Any:
+        return orjson.loads(data)
@@ -5,6 +5,7 @@ from pydantic.json import ENCODERS_BY_TYPE
 from starlette.middleware import Middleware
 from starlette.responses import JSONResponse
 
+from ellar.core.codecs import BaseJSONCodec, JSONCodec
 from ellar.core.events import EventHandler
 from ellar.core.versioning import BaseAPIVersioning, DefaultAPIVersioning
 from ellar.serializer import Serializer, SerializerFilter
@@ -24,6 +25,20 @@ class TVersioning(BaseAPIVersioning):
         return v
 
 
+class TJSONCodec(BaseJSONCodec):
+    @classmethod
+    def __get_validators__(
+        cls: t.Type["TJSONCodec"],
+    ) -> t.Iterable[t.Callable[..., t.Any]]:
+        yield cls.validate
+
+    @classmethod
+    def validate(cls: t.Type["BaseJSONCodec"], v: t.Any) -> t.Any:
+        if not isinstance(v, BaseJSONCodec):
+            raise ValueError(f"Expected BaseJSONCodec, received: {type(v)}")
+        return v
+
+
 class TMiddleware(Middleware):
     @classmethod
     def __get_validators__(
@@ -68,11 +83,15 @@ class ConfigValidationSchema(Serializer):
 
     DEBUG: bool = False
     DEFAULT_JSON_CLASS: t.Type[JSONResponse] = JSONResponse
+    JSON_CODEC: TJSONCodec = Field(JSONCodec())
+    JSON_CODEC_EXCEPTION_RESPONSES: bool = False
 
     TEMPLATES_AUTO_RELOAD: t.Optional[bool] = None
     VERSIONING_SCHEME: TVersioning = Field(DefaultAPIVersioning())
 
     REDIRECT_SLASHES: bool = False
+    ROUTE_MATCH_CACHE_SIZE: int = 0
+    MAX_REQUEST_BODY_SIZE: t.Optional[int] = None
     STATIC_FOLDER_PACKAGES: t.Optional[t.List[t.Union[str, t.Tuple[str]]]] = []
 
     MIDDLEWARE: t.List[TMiddleware] = []
@@ -94,6 +113,8 @@ class ConfigValidationSchema(Serializer):
     TEMPLATE_FILTERS: t.Dict[str, t.Callable[..., t.Any]] = {}
     TEMPLATE_GLOBAL_FILTERS: t.Dict[str, t.Callable[..., t.Any]] = {}
     INJECTOR_AUTO_BIND: bool = False
+    INJECTOR_WARM_UP_SINGLETONS: bool = False
+    INJECTOR_WARM_UP_IN_THREADS: bool = False
 
     @root_validator(pre=True)
     def pre_root_validate(cls, values: t.Any) -> t.Any:
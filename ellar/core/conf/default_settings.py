@@ -7,6 +7,7 @@ from starlette.responses import JSONResponse
 from starlette.types import ASGIApp
 from starlette.websockets import WebSocketClose
 
+from ellar.core.codecs import BaseJSONCodec, JSONCodec
 from ellar.core.exception_handlers import (
     api_exception_handler,
     request_validation_exception_handler,
@@ -22,17 +23,33 @@ if t.TYPE_CHECKING:  # pragma: no cover
 DEBUG: bool = False
 
 DEFAULT_JSON_CLASS: t.Type[JSONResponse] = JSONResponse
+# decodes JSON request bodies and websocket messages, e.g `ORJSONCodec()` or `UJSONCodec()`
+JSON_CODEC: BaseJSONCodec = JSONCodec()
+# exception handlers respond with the `JSON_CODEC.response_class` instead of `DEFAULT_JSON_CLASS`
+JSON_CODEC_EXCEPTION_RESPONSES: bool = False
 SECRET_KEY: str = "your-secret-key"
 
 # injector auto_bind = True allows you to resolve types that are not registered on the container
 # For more info, read: https://injector.readthedocs.io/en/latest/index.html
 INJECTOR_AUTO_BIND = False
 
+# instantiates all singleton services and awaits their `on_init` hook on application startup
+INJECTOR_WARM_UP_SINGLETONS: bool = False
+# builds singletons with synchronous constructors in worker threads during the warm-up,
+# so independent services are also constructed concurrently
+INJECTOR_WARM_UP_IN_THREADS: bool = False
+
 TEMPLATES_AUTO_RELOAD: t.Optional[bool] = None
 
 VERSIONING_SCHEME: BaseAPIVersioning = DefaultAPIVersioning()
 REDIRECT_SLASHES: bool = False
 
+# maximum request body size in bytes, larger bodies are rejected with 413
+MAX_REQUEST_BODY_SIZE: t.Optional[int] = None
+
+# number of path match results kept by the application router, 0 disables the cache
+ROUTE_MATCH_CACHE_SIZE: int = 0
+
 STATIC_FOLDER_PACKAGES: t.Optional[t.List[t.Union[str, t.Tuple[str]]]] = []
 STATIC_MOUNT_PATH: str = "/static"
 
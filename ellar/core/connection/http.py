@@ -1,5 +1,6 @@
 import typing as t
 
+from starlette.exceptions import HTTPException
 from starlette.requests import (
     HTTPConnection as StarletteHTTPConnection,
     Request as StarletteRequest,
@@ -21,4 +22,30 @@ class HTTPConnection(StarletteHTTPConnection):
 
 
 class Request(StarletteRequest, HTTPConnection):
-    pass
+    # body size limit of the current operation, `MAX_REQUEST_BODY_SIZE` config is used when None
+    max_body_size: t.Optional[int] = None
+
+    def get_max_body_size(self) -> t.Optional[int]:
+        if self.max_body_size is not None:
+            return self.max_body_size
+        config = getattr(self.scope.get("app"), "config", None)
+        return t.cast(t.Optional[int], getattr(config, "MAX_REQUEST_BODY_SIZE", None))
+
+    async def stream(self) -> t.AsyncGenerator[bytes, None]:
+        max_body_size = self.get_max_body_size()
+        if max_body_size is None:
+            async for chunk in super().stream():
+                yield chunk
+            return
+
+        content_length = self.headers.get("content-length")
+        if content_length and content_length.isdigit():
+            if int(content_length) > max_body_size:
+                raise HTTPException(status_code=413)
+
+        received = 0
+        async for chunk in super().stream():
+            received += len(chunk)
+            if received > max_body_size:
+                raise HTTPException(status_code=413)
+            yield chunk
@@ -3,7 +3,7 @@ import typing as t
 from starlette.background import BackgroundTasks
 
 from ellar.compatible import cached_property
-from ellar.constants import CONTROLLER_CLASS_KEY
+from ellar.constants import CONTROLLER_CLASS_KEY, SCOPE_SERVICE_PROVIDER
 from ellar.core.connection import HTTPConnection, Request, WebSocket
 from ellar.core.response import Response
 from ellar.services.reflector import Reflector
@@ -38,21 +38,27 @@ class ExecutionContext(IExecutionContext):
         receive: TReceive,
         send: TSend,
         operation_handler: t.Callable = None,
+        operation: t.Optional["RouteOperationBase"] = None,
     ) -> None:
         self.scope = scope
         self.receive = receive
         self.send = send
+        self._operation = operation
         self._operation_handler = operation_handler
         self._response: t.Optional[Response] = None
 
     def set_operation(self, operation: t.Optional["RouteOperationBase"] = None) -> None:
         if operation:
+            self._operation = operation
             self._operation_handler = operation.endpoint
 
     def get_handler(self) -> t.Callable:
         assert self._operation_handler, "Operation is not available yet."
         return self._operation_handler
 
+    def get_operation(self) -> t.Optional["RouteOperationBase"]:
+        return self._operation
+
     def get_class(self) -> t.Optional[t.Type["ControllerBase"]]:
         reflector = self.get_service_provider().get(Reflector)
         result: t.Optional[t.Type["ControllerBase"]] = reflector.get(
@@ -119,11 +125,12 @@ class ExecutionContext(IExecutionContext):
         send: TSend,
         operation: t.Optional["RouteOperationBase"] = None,
     ) -> "ExecutionContext":
-        connection = HTTPConnection(scope=scope)
-        context = t.cast(
-            ExecutionContext,
-            fail_silently(connection.service_provider.get, interface=ExecutionContext),
-        )
+        context: t.Optional[ExecutionContext] = None
+        # only look up a provider already created, so none is created for the request
+        if dict.__contains__(scope, SCOPE_SERVICE_PROVIDER):
+            context = fail_silently(
+                scope[SCOPE_SERVICE_PROVIDER].get, interface=ExecutionContext
+            )
         if context:
             context.set_operation(operation)
             return context
@@ -132,4 +139,5 @@ class ExecutionContext(IExecutionContext):
             receive=receive,
             send=send,
             operation_handler=operation.endpoint if operation else None,
+            operation=operation,
         )
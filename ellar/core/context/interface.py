@@ -52,5 +52,8 @@ class IExecutionContext(ABC, metaclass=ABCMeta):
     def get_handler(self) -> t.Callable:
         """Gets operation handler"""
 
+    def get_operation(self) -> t.Optional["RouteOperationBase"]:
+        """Gets route operation"""
+
     def get_class(self) -> t.Optional[t.Type["ControllerBase"]]:
         """Gets operation handler class"""
@@ -1,5 +1,6 @@
 import typing as t
 
+from ellar.compatible import ContextVar, Token
 from ellar.core.context import ExecutionContext
 
 
@@ -25,5 +26,46 @@ class ControllerType(type):
 
 class ControllerBase(metaclass=ControllerType):
     # `context` variable will change based on the route function called on the APIController
-    # that way we can get some specific items things that belong the route function during execution
-    context: t.Optional[ExecutionContext] = None
+    # that way we can get some specific items things that belong the route function during execution.
+    # Controllers shared between requests (e.g. singletons) keep it in a ContextVar of their class,
+    # so concurrent requests don't override each other's context
+    _context_var: t.ClassVar[
+        t.Optional["ContextVar[t.Optional[ExecutionContext]]"]
+    ] = None
+    _context: t.Optional[ExecutionContext] = None
+
+    @classmethod
+    def create_context_var(cls) -> None:
+        """Keeps the `context` of the controller instances in a ContextVar of the controller class"""
+        cls._context_var = ContextVar(f"{cls.__name__}_context", default=None)
+
+    @property
+    def context(self) -> t.Optional[ExecutionContext]:
+        if self._context_var is not None:
+            context: t.Optional[ExecutionContext] = self._context_var.get()
+            return context
+        return self._context
+
+    @context.setter
+    def context(self, value: t.Optional[ExecutionContext]) -> None:
+        if self._context_var is not None:
+            raise AttributeError(
+                f"{type(self).__name__} is shared between requests, "
+                "its context is set with `bind_context`"
+            )
+        self._context = value
+
+    def bind_context(
+        self, context: ExecutionContext
+    ) -> t.Optional["Token[t.Optional[ExecutionContext]]"]:
+        """Sets `context` for the route function call, returns a token for `unbind_context`"""
+        if self._context_var is not None:
+            return self._context_var.set(context)
+        self._context = context
+        return None
+
+    def unbind_context(
+        self, token: t.Optional["Token[t.Optional[ExecutionContext]]"]
+    ) -> None:
+        if token is not None and self._context_var is not None:
+            self._context_var.reset(token)
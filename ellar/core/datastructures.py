@@ -1,5 +1,11 @@
+import hashlib
+import mmap
+import os
+import shutil
+import tempfile
 import typing as t
 
+from starlette.concurrency import run_in_threadpool
 from starlette.datastructures import (
     URL as URL,
     Address as Address,
@@ -18,12 +24,130 @@ __all__ = [
     "Headers",
     "QueryParams",
     "UploadFile",
+    "UploadFileOptions",
     "URLPath",
     "State",
 ]
 
 
+class UploadFileOptions(t.NamedTuple):
+    # uploads larger than this are moved out of memory, Starlette already writes
+    # uploads larger than `UploadFile.spool_max_size` to disk while receiving them
+    spool_max_size: t.Optional[int] = None
+    # directory of the temporary files of the upload
+    spool_dir: t.Optional[str] = None
+    # hashlib algorithm of the upload content, e.g `sha256`
+    hash_algorithm: t.Optional[str] = None
+
+
 class UploadFile(StarletteUploadFile):
+    # size of the chunks read when hashing or copying an upload
+    chunk_size: int = 1024 * 1024
+
+    def __init__(
+        self,
+        filename: str,
+        file: t.Optional[t.BinaryIO] = None,
+        content_type: str = "",
+        *,
+        headers: t.Optional[Headers] = None,
+        options: t.Optional[UploadFileOptions] = None,
+    ) -> None:
+        self.options = options or UploadFileOptions()
+        if file is None:
+            file = t.cast(
+                t.BinaryIO,
+                tempfile.SpooledTemporaryFile(
+                    max_size=self.spool_max_size
+                    if self.options.spool_max_size is None
+                    else self.options.spool_max_size,
+                    dir=self.options.spool_dir,
+                ),
+            )
+        super().__init__(filename, file, content_type, headers=headers)
+        self._hash = (
+            hashlib.new(self.options.hash_algorithm)
+            if self.options.hash_algorithm
+            else None
+        )
+
+    @classmethod
+    async def from_upload(
+        cls, upload: StarletteUploadFile, options: t.Optional[UploadFileOptions] = None
+    ) -> "UploadFile":
+        """
+        Upload sharing the file of an upload parsed by Starlette, with `options` applied to it.
+        The content received is hashed and moved out of memory in a worker thread when required
+        """
+        upload_file = cls(
+            upload.filename,
+            upload.file,
+            upload.content_type,
+            headers=upload.headers,
+            options=options,
+        )
+        if upload_file._hash is not None or upload_file.options.spool_max_size:
+            await run_in_threadpool(upload_file._apply_options)
+        return upload_file
+
+    def _apply_options(self) -> None:
+        self.file.seek(0)
+        if self._hash is not None:
+            for chunk in iter(lambda: self.file.read(self.chunk_size), b""):
+                self._hash.update(chunk)
+        self.file.seek(0, os.SEEK_END)
+        spool_max_size = self.options.spool_max_size
+        if (
+            spool_max_size
+            and self.file.tell() > spool_max_size
+            and isinstance(self.file, tempfile.SpooledTemporaryFile)
+        ):
+            self.file.rollover()
+        self.file.seek(0)
+
+    async def write(self, data: bytes) -> None:
+        if self._hash is not None:
+            self._hash.update(data)
+        await super().write(data)
+
+    def hexdigest(self) -> t.Optional[str]:
+        """Hash of the upload content, when a `hash_algorithm` is set"""
+        return self._hash.hexdigest() if self._hash is not None else None
+
+    @property
+    def path(self) -> t.Optional[str]:
+        """Path of the upload file, None unless the upload is stored in a named file"""
+        name = getattr(self.file, "name", None)
+        return name if isinstance(name, str) else None
+
+    async def get_path(self) -> str:
+        """Copies the upload to a named temporary file when needed and returns its path"""
+        if self.path is None:
+            await run_in_threadpool(self._copy_to_named_file)
+        return t.cast(str, self.path)
+
+    def _copy_to_named_file(self) -> None:
+        named_file = tempfile.NamedTemporaryFile(dir=self.options.spool_dir)
+        position = self.file.tell()
+        self.file.seek(0)
+        shutil.copyfileobj(self.file, named_file, self.chunk_size)
+        named_file.flush()
+        named_file.seek(position)
+        self.file.close()
+        self.file = t.cast(t.BinaryIO, named_file)
+
+    def memory_view(self) -> memoryview:
+        """
+        Read only view of the upload content mapped from its file, without copying it.
+        Uploads still in memory are written to their temporary file first
+        """
+        fileno = self.file.fileno()
+        self.file.flush()
+        if os.fstat(fileno).st_size == 0:
+            return memoryview(b"")
+        # the mapping is closed once the view is released
+        return memoryview(mmap.mmap(fileno, 0, access=mmap.ACCESS_READ))
+
     @classmethod
     def __get_validators__(
         cls: t.Type["UploadFile"],
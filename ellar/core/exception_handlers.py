@@ -2,15 +2,25 @@ import typing as t
 
 from starlette import status
 
+from ellar.core.codecs import BaseJSONCodec
 from ellar.core.connection import Request
 from ellar.core.response import JSONResponse
 from ellar.exceptions import APIException, RequestValidationError
 from ellar.serializer import serialize_object
 
+if t.TYPE_CHECKING:  # pragma: no cover
+    from ellar.core.main import App
+
+
+def get_json_response_type(app: "App") -> t.Type[JSONResponse]:
+    if app.config.JSON_CODEC_EXCEPTION_RESPONSES:
+        json_codec = t.cast(BaseJSONCodec, app.config.JSON_CODEC)
+        return json_codec.response_class
+    return t.cast(t.Type[JSONResponse], app.config.DEFAULT_JSON_CLASS)
+
 
 async def api_exception_handler(request: Request, exc: APIException) -> JSONResponse:
-    app = request.app
-    json_response_type = t.cast(t.Type[JSONResponse], app.config.DEFAULT_JSON_CLASS)
+    json_response_type = get_json_response_type(request.app)
 
     headers = getattr(exc, "headers", {})
     if isinstance(exc.detail, (list, dict)):
@@ -25,8 +35,7 @@ async def api_exception_handler(request: Request, exc: APIException) -> JSONResp
 async def request_validation_exception_handler(
     request: Request, exc: RequestValidationError
 ) -> JSONResponse:
-    app = request.app
-    json_response_type = t.cast(t.Type[JSONResponse], app.config.DEFAULT_JSON_CLASS)
+    json_response_type = get_json_response_type(request.app)
 
     return json_response_type(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
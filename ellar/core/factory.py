@@ -4,6 +4,7 @@ from uuid import uuid4
 
 from starlette.routing import Host, Mount
 
+from ellar.compatible import asynccontextmanager
 from ellar.constants import (
     MODULE_METADATA,
     MODULE_WATERMARK,
@@ -89,8 +90,32 @@ class AppFactory:
         cls._run_module_application_ready(
             modules=injector.get_templating_modules(), app=app
         )
+        app.prepare_route_guards(app.routes)
+        injector.container.compile_resolution_plans()
+        if config.INJECTOR_WARM_UP_SINGLETONS:
+            # wraps the lifespan, so custom `lifespan` handlers warm up singletons too
+            app.router.lifespan_context = cls._warm_up_lifespan(
+                app.router.lifespan_context,
+                injector=injector,
+                run_sync_in_threads=t.cast(bool, config.INJECTOR_WARM_UP_IN_THREADS),
+            )
         return app
 
+    @classmethod
+    def _warm_up_lifespan(
+        cls,
+        lifespan_context: t.Callable[[t.Any], t.AsyncContextManager],
+        injector: EllarInjector,
+        run_sync_in_threads: bool,
+    ) -> t.Callable[[t.Any], t.AsyncContextManager]:
+        @asynccontextmanager
+        async def _lifespan(app: t.Any) -> t.AsyncIterator[None]:
+            await injector.warm_up_singletons(run_sync_in_threads=run_sync_in_threads)
+            async with lifespan_context(app):
+                yield
+
+        return t.cast(t.Callable[[t.Any], t.AsyncContextManager], _lifespan)
+
     @classmethod
     def create_app(
         cls,
@@ -1,3 +1,4 @@
+import hashlib
 import typing as t
 from abc import ABC, ABCMeta, abstractmethod
 
@@ -9,6 +10,8 @@ from ellar.core.connection import HTTPConnection
 from ellar.core.context import ExecutionContext
 from ellar.exceptions import APIException
 
+from .cache import AuthResultCache
+
 
 class GuardCanActivate(ABC, metaclass=ABCMeta):
     _exception_class: t.Type[HTTPException] = HTTPException
@@ -25,6 +28,13 @@ class GuardCanActivate(ABC, metaclass=ABCMeta):
 
 class BaseAuthGuard(GuardCanActivate, ABC, metaclass=ABCMeta):
     openapi_scope: t.List = []
+    # Authentication results are cached for `auth_cache_ttl` seconds when it is set.
+    # Failed authentications are cached for `auth_cache_negative_ttl` seconds.
+    # The cache is kept per guard class, so request scoped and transient guards share it.
+    auth_cache_ttl: t.Optional[float] = None
+    auth_cache_negative_ttl: float = 5.0
+    auth_cache_max_size: int = 1024
+    _auth_cache: t.Optional[AuthResultCache] = None
 
     @abstractmethod
     async def handle_request(self, *, connection: HTTPConnection) -> t.Optional[t.Any]:
@@ -35,6 +45,59 @@ class BaseAuthGuard(GuardCanActivate, ABC, metaclass=ABCMeta):
     def get_guard_scheme(cls) -> t.Dict:
         pass
 
+    @classmethod
+    def get_auth_cache(cls) -> t.Optional[AuthResultCache]:
+        if cls.auth_cache_ttl is None:
+            return None
+        # not inherited, subclasses have their own cache
+        cache: t.Optional[AuthResultCache] = cls.__dict__.get("_auth_cache")
+        if cache is None:
+            cache = AuthResultCache(
+                max_size=cls.auth_cache_max_size,
+                ttl=cls.auth_cache_ttl,
+                negative_ttl=cls.auth_cache_negative_ttl,
+                on_evict=cls.on_auth_cache_evict,
+            )
+            cls._auth_cache = cache
+        return cache
+
+    def get_credentials_cache_key(self, credentials: t.Any) -> str:
+        value = (
+            credentials.json() if isinstance(credentials, BaseModel) else credentials
+        )
+        return hashlib.sha256(str(value).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def on_auth_cache_evict(cls, key: str, identity: t.Any) -> None:
+        """Called when an authentication result is removed from the cache"""
+
+    def invalidate_credentials(self, credentials: t.Any) -> None:
+        cache = self.get_auth_cache()
+        if cache is not None:
+            cache.invalidate(self.get_credentials_cache_key(credentials))
+
+    def clear_auth_cache(self) -> None:
+        cache = self.get_auth_cache()
+        if cache is not None:
+            cache.clear()
+
+    async def run_authentication(
+        self,
+        authenticate: t.Callable[
+            [HTTPConnection, t.Any], t.Awaitable[t.Optional[t.Any]]
+        ],
+        connection: HTTPConnection,
+        credentials: t.Any,
+    ) -> t.Optional[t.Any]:
+        cache = self.get_auth_cache()
+        if cache is None:
+            return await authenticate(connection, credentials)
+
+        return await cache.get_or_authenticate(
+            self.get_credentials_cache_key(credentials),
+            lambda: authenticate(connection, credentials),
+        )
+
     async def can_activate(self, context: ExecutionContext) -> bool:
         connection = context.switch_to_http_connection()
         result = await self.handle_request(connection=connection)
@@ -69,7 +132,7 @@ class BaseAPIKey(BaseAuthGuard, ABC, metaclass=ABCMeta):
             raise APIException(
                 status_code=HTTP_403_FORBIDDEN, detail="Not authenticated"
             )
-        return await self.authenticate(connection, key)
+        return await self.run_authentication(self.authenticate, connection, key)
 
     @abstractmethod
     def _get_key(self, connection: HTTPConnection) -> t.Optional[t.Any]:
@@ -115,7 +178,7 @@ class BaseHttpAuth(BaseAuthGuard, ABC, metaclass=ABCMeta):
 
     async def handle_request(self, connection: HTTPConnection) -> t.Optional[t.Any]:
         credentials = self._get_credentials(connection)
-        return await self.authenticate(connection, credentials)
+        return await self.run_authentication(self.authenticate, connection, credentials)
 
     @abstractmethod
     def _get_credentials(
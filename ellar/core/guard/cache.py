@@ -0,0 +1,121 @@
+import time
+import typing as t
+
+import anyio
+
+from ellar.helper.lru import LRUCache, LRUCacheInfo
+
+__all__ = ["AuthResultCache", "AuthResultCacheInfo"]
+
+TAuthCacheValue = t.Tuple[t.Any, float]
+
+AuthResultCacheInfo = LRUCacheInfo
+
+
+def _is_expired(value: TAuthCacheValue) -> bool:
+    return value[1] <= time.monotonic()
+
+
+class _PendingAuthentication:
+    __slots__ = ("event", "completed", "identity", "error")
+
+    def __init__(self) -> None:
+        self.event = anyio.Event()
+        self.completed = False
+        self.identity: t.Any = None
+        self.error: t.Optional[Exception] = None
+
+
+class AuthResultCache:
+    """
+    Size bounded LRU cache of authentication results.
+
+    Each entry holds the authenticated identity and its expiry time.
+    Failed authentications (falsy identities) expire after `negative_ttl`.
+    `on_evict` is called with the key and identity of every entry removed from the cache.
+    """
+
+    __slots__ = ("ttl", "negative_ttl", "on_evict", "_entries", "_pending")
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        negative_ttl: float = 0,
+        on_evict: t.Optional[t.Callable[[str, t.Any], None]] = None,
+    ) -> None:
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.on_evict = on_evict
+        self._entries: LRUCache[str, TAuthCacheValue] = LRUCache(
+            max_size, on_evict=self._on_entry_evict, is_stale=_is_expired
+        )
+        self._pending: t.Dict[str, _PendingAuthentication] = {}
+
+    @property
+    def max_size(self) -> int:
+        return self._entries.max_size
+
+    def get(self, key: str) -> t.Tuple[bool, t.Any]:
+        """Returns a `(found, identity)` tuple"""
+        value = self._entries.get(key)
+        if value is None:
+            return False, None
+        return True, value[0]
+
+    def set(self, key: str, identity: t.Any) -> None:
+        ttl = self.ttl if identity else self.negative_ttl
+        if ttl > 0:
+            self._entries.set(key, (identity, time.monotonic() + ttl))
+
+    async def get_or_authenticate(
+        self, key: str, authenticate: t.Callable[[], t.Awaitable[t.Any]]
+    ) -> t.Any:
+        """
+        Returns the cached identity of `key`, or caches the identity `authenticate` returns.
+        Concurrent misses of the same key wait for the first `authenticate` call,
+        they share its result and errors, and retry if it is cancelled.
+        """
+        while True:
+            found, identity = self.get(key)
+            if found:
+                return identity
+
+            pending = self._pending.get(key)
+            if pending is None:
+                break
+            await pending.event.wait()
+            if pending.completed:
+                if pending.error is not None:
+                    raise pending.error
+                return pending.identity
+
+        pending = _PendingAuthentication()
+        self._pending[key] = pending
+        try:
+            identity = await authenticate()
+            self.set(key, identity)
+            pending.identity = identity
+            pending.completed = True
+            return identity
+        except Exception as ex:
+            pending.error = ex
+            pending.completed = True
+            raise
+        finally:
+            del self._pending[key]
+            pending.event.set()
+
+    def invalidate(self, key: str) -> None:
+        if key in self._entries:
+            self._entries.pop(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def info(self) -> AuthResultCacheInfo:
+        return self._entries.info()
+
+    def _on_entry_evict(self, key: str, value: TAuthCacheValue) -> None:
+        if self.on_evict is not None:
+            self.on_evict(key, value[0])
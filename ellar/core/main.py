@@ -1,6 +1,6 @@
 import typing as t
 
-from starlette.routing import BaseRoute, Mount
+from starlette.routing import BaseRoute, Host, Mount
 
 from ellar.core.conf import Config
 from ellar.core.context import ExecutionContext, IExecutionContext
@@ -15,7 +15,8 @@ from ellar.core.middleware import (
 )
 from ellar.core.modules import ModuleBase, ModuleTemplateRef
 from ellar.core.modules.ref import create_module_ref_factor
-from ellar.core.routing import ApplicationRouter
+from ellar.core.routing import ApplicationRouter, RouteOperationBase
+from ellar.core.routing.base import TGuard
 from ellar.core.templating import AppTemplating, Environment
 from ellar.core.versioning import VERSIONING, BaseAPIVersioning
 from ellar.di.injector import EllarInjector
@@ -24,6 +25,16 @@ from ellar.services.reflector import Reflector
 from ellar.types import ASGIApp, T, TReceive, TScope, TSend
 
 
+def _get_route_operations(
+    routes: t.Sequence[BaseRoute],
+) -> t.Iterator[RouteOperationBase]:
+    for route in routes:
+        if isinstance(route, RouteOperationBase):
+            yield route
+        elif isinstance(route, (Mount, Host)):
+            yield from _get_route_operations(route.routes or [])
+
+
 class App(AppTemplating):
     def __init__(
         self,
@@ -52,6 +63,7 @@ class App(AppTemplating):
         self._injector: EllarInjector = injector
 
         self._global_guards = [] if global_guards is None else list(global_guards)
+        self._resolved_global_guards: t.Optional[t.Tuple[TGuard, ...]] = None
         self._exception_handlers = dict(t.cast(dict, self.config.EXCEPTION_HANDLERS))
         self._user_middleware = list(t.cast(list, self.config.MIDDLEWARE))
 
@@ -71,6 +83,7 @@ class App(AppTemplating):
         self.router = ApplicationRouter(
             routes=self._get_module_routes(),
             redirect_slashes=t.cast(bool, self.config.REDIRECT_SLASHES),
+            match_cache_size=t.cast(int, self.config.ROUTE_MATCH_CACHE_SIZE),
             on_startup=[self.on_startup.async_run],
             on_shutdown=[self.on_shutdown.async_run],
             default=self.config.DEFAULT_NOT_FOUND_HANDLER,  # type: ignore
@@ -131,6 +144,7 @@ class App(AppTemplating):
             self.router.extend(module_ref.routes)
             self.reload_static_app()
             module_ref.run_application_ready(self)
+            self.prepare_route_guards(module_ref.routes)
 
         return t.cast(T, module_ref.get_module_instance())
 
@@ -139,6 +153,32 @@ class App(AppTemplating):
 
     def use_global_guards(self, *guards: "GuardCanActivate") -> None:
         self._global_guards.extend(guards)
+        RouteOperationBase.register_guards(self.injector, guards)
+        self._resolved_global_guards = None
+
+    def get_resolved_guards(self) -> t.Tuple[TGuard, ...]:
+        """Returns the global guards with singleton guard types replaced by their instances"""
+        if self._resolved_global_guards is None:
+            self._resolved_global_guards = RouteOperationBase.resolve_guards(
+                self.injector, self._global_guards
+            )
+        return self._resolved_global_guards
+
+    def prepare_route_guards(self, routes: t.Sequence[BaseRoute]) -> None:
+        """
+        Registers the guard types of the application and of every route operation
+        in `routes` before resolving them, so that requests do not change the container.
+        """
+        operations = list(_get_route_operations(routes))
+        RouteOperationBase.register_guards(self.injector, self._global_guards)
+        for operation in operations:
+            RouteOperationBase.register_guards(
+                self.injector, operation.route_metadata.guards
+            )
+
+        self.get_resolved_guards()
+        for operation in operations:
+            operation.get_route_guards(self)
 
     @property
     def injector(self) -> EllarInjector:
@@ -1,17 +1,55 @@
 import typing as t
 
-from injector import CallableProvider
 from starlette.middleware.errors import ServerErrorMiddleware
 
 from ellar.constants import SCOPE_EXECUTION_CONTEXT_PROVIDER, SCOPE_SERVICE_PROVIDER
 from ellar.core.connection import HTTPConnection, Request, WebSocket
 from ellar.core.context import ExecutionContext, IExecutionContext
 from ellar.core.response import Response
+from ellar.di.injector import RequestServiceProviderFactory
 from ellar.types import ASGIApp, TReceive, TScope, TSend
 
 if t.TYPE_CHECKING:  # pragma: no cover
     from ellar.di.injector import EllarInjector
 
+# request services resolved from the request ExecutionContext
+REQUEST_CONTEXT_TEMPLATE: t.Dict[t.Type, t.Callable[[ExecutionContext], t.Any]] = {
+    IExecutionContext: lambda context: context,
+    HTTPConnection: lambda context: context.switch_to_http_connection(),
+    WebSocket: lambda context: context.switch_to_websocket(),
+    Request: lambda context: context.switch_to_request(),
+    Response: lambda context: context.get_response(),
+}
+
+
+class _RequestScope(dict):
+    """
+    ASGI scope creating the request service provider on first access to its key.
+    Copying the scope, `dict(scope)` or `{**scope}`, only copies the provider once created.
+    """
+
+    __slots__ = ("request_provider_factory",)
+
+    def __init__(self, scope: TScope) -> None:
+        super().__init__(scope)
+        self.request_provider_factory: t.Optional[RequestServiceProviderFactory] = None
+
+    def __contains__(self, key: object) -> bool:
+        return super().__contains__(key) or (
+            key == SCOPE_SERVICE_PROVIDER and self.request_provider_factory is not None
+        )
+
+    def get(self, key: str, default: t.Any = None) -> t.Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def __missing__(self, key: str) -> t.Any:
+        if key != SCOPE_SERVICE_PROVIDER or self.request_provider_factory is None:
+            raise KeyError(key)
+        value = self[key] = self.request_provider_factory()
+        return value
+
 
 class RequestServiceProviderMiddleware(ServerErrorMiddleware):
     def __init__(
@@ -32,25 +70,16 @@ class RequestServiceProviderMiddleware(ServerErrorMiddleware):
             await super().__call__(scope, receive, send)
             return
 
-        async with self.injector.create_request_service_provider() as request_provider:
-            execute_context = ExecutionContext(scope=scope, receive=receive, send=send)
-            request_provider.update_context(
-                t.cast(t.Type, IExecutionContext), execute_context
-            )
-
-            request_provider.update_context(
-                HTTPConnection,
-                CallableProvider(execute_context.switch_to_http_connection),
-            )
-            request_provider.update_context(
-                WebSocket, CallableProvider(execute_context.switch_to_websocket)
-            )
-            request_provider.update_context(
-                Request, CallableProvider(execute_context.switch_to_request)
-            )
-            request_provider.update_context(
-                Response, CallableProvider(execute_context.get_response)
-            )
-            scope[SCOPE_SERVICE_PROVIDER] = request_provider
-            scope[SCOPE_EXECUTION_CONTEXT_PROVIDER] = execute_context
-            await super().__call__(scope, receive, send)
+        request_scope = _RequestScope(scope)
+        execute_context = ExecutionContext(
+            scope=request_scope, receive=receive, send=send
+        )
+        request_scope[SCOPE_EXECUTION_CONTEXT_PROVIDER] = execute_context
+        async with self.injector.create_request_service_provider_factory(
+            context_template=REQUEST_CONTEXT_TEMPLATE, context_source=execute_context
+        ) as request_provider_factory:
+            request_scope.request_provider_factory = request_provider_factory
+            try:
+                await super().__call__(request_scope, receive, send)
+            finally:
+                request_scope.request_provider_factory = None
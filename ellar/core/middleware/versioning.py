@@ -2,7 +2,7 @@ import typing as t
 
 from starlette.types import ASGIApp
 
-from ellar.constants import SCOPE_API_VERSIONING_RESOLVER
+from ellar.constants import SCOPE_API_ROUTE_VERSION, SCOPE_API_VERSIONING_RESOLVER
 from ellar.core.versioning import BaseAPIVersioning
 from ellar.types import TReceive, TScope, TSend
 
@@ -27,4 +27,6 @@ class RequestVersioningMiddleware:
             version_scheme_resolver = scheme.get_version_resolver(scope)
             version_scheme_resolver.resolve()
             scope[SCOPE_API_VERSIONING_RESOLVER] = version_scheme_resolver
+            # selects the version route table used by the `ApplicationRouter`
+            scope[SCOPE_API_ROUTE_VERSION] = version_scheme_resolver.get_route_version()
         await self.app(scope, receive, send)
@@ -24,7 +24,9 @@ from .resolvers import (
     BaseRouteParameterResolver,
     NonFieldRouteParameterResolver,
     ParameterInjectable,
+    RouteParameterModelField,
     RouteParameterResolver,
+    TParameterAccessor,
     WsBodyParameterResolver,
 )
 
@@ -85,6 +87,7 @@ def get_parameter_field(
         alias=alias,
         required=required,
         field_info=field_info,
+        model_field_class=RouteParameterModelField,
     )
     field.required = required
 
@@ -120,6 +123,8 @@ class EndpointArgsModel:
         "body_resolver",
         "endpoint_signature",
         "_route_models",
+        "_route_accessors",
+        "_awaited_route_models",
         "param_converters",
         "_extra_endpoint_args",
     )
@@ -141,6 +146,8 @@ class EndpointArgsModel:
         self.endpoint_signature = self.get_typed_signature(endpoint)
         self.body_resolver: t.Optional[t.Union[t.Any, RouteParameterResolver]] = None
         self._route_models: t.List[BaseRouteParameterResolver] = []
+        self._route_accessors: t.List[TParameterAccessor] = []
+        self._awaited_route_models: t.List[BaseRouteParameterResolver] = []
         self._extra_endpoint_args: t.List[ExtraEndpointArg] = (
             list(extra_endpoint_args) if extra_endpoint_args else []
         )
@@ -202,6 +209,26 @@ class EndpointArgsModel:
             + self._computation_models[params.Cookie.in_.value]
             + self._computation_models[NonFieldRouteParameterResolver.in_]
         )
+        self.compile_route_models()
+
+    def compile_route_models(self) -> None:
+        """
+        Splits route models into synchronous accessors, resolved in a single pass,
+        followed by resolvers that must be awaited. Route models order is kept.
+        :return: None
+        """
+        self._route_accessors = []
+        self._awaited_route_models = []
+        for index, parameter_resolver in enumerate(self._route_models):
+            accessor = (
+                parameter_resolver.create_accessor()
+                if isinstance(parameter_resolver, RouteParameterResolver)
+                else None
+            )
+            if accessor is None:
+                self._awaited_route_models = self._route_models[index:]
+                break
+            self._route_accessors.append(accessor)
 
     def compute_route_parameter_list(
         self, body_field_class: t.Type[FieldInfo] = params.Body
@@ -407,18 +434,25 @@ class EndpointArgsModel:
         if self.body_resolver:
             await self.resolve_body(ctx, values, errors)
 
-        if not errors:
-            for parameter_resolver in self._route_models:
-                value_, value_errors = await parameter_resolver.resolve(ctx=ctx)
-                if value_:
-                    values.update(value_)
-                if value_errors:
-                    _errors = (
-                        value_errors
-                        if isinstance(value_errors, list)
-                        else [value_errors]
-                    )
-                    errors += _errors
+        if errors:
+            return values, errors
+
+        for accessor in self._route_accessors:
+            value_, value_errors = accessor(ctx)
+            if value_:
+                values.update(value_)
+            if value_errors:
+                errors += value_errors
+
+        for parameter_resolver in self._awaited_route_models:
+            value_, value_errors = await parameter_resolver.resolve(ctx=ctx)
+            if value_:
+                values.update(value_)
+            if value_errors:
+                _errors = (
+                    value_errors if isinstance(value_errors, list) else [value_errors]
+                )
+                errors += _errors
         return values, errors
 
     def compute_extra_route_args(self) -> None:
@@ -476,6 +510,8 @@ class RequestEndpointArgsModel(EndpointArgsModel):
         "body_resolver",
         "endpoint_signature",
         "_route_models",
+        "_route_accessors",
+        "_awaited_route_models",
         "param_converters",
         "_extra_endpoint_args",
     )
@@ -535,6 +571,11 @@ class RequestEndpointArgsModel(EndpointArgsModel):
                 body_field_info = klass
                 media_type = getattr(field_info, "media_type", media_type)
 
+            max_sizes: t.List[int] = []
+            for body_field in body_model_field.__fields__.values():
+                max_size = getattr(body_field.field_info, "max_size", None)
+                if max_size is not None:
+                    max_sizes.append(max_size)
             final_field = create_model_field(
                 name="body",
                 type_=body_model_field,
@@ -542,6 +583,7 @@ class RequestEndpointArgsModel(EndpointArgsModel):
                 alias="body",
                 field_info=body_field_info(
                     media_type=media_type,
+                    max_size=min(max_sizes) if max_sizes else None,
                     default=None,
                     **{MULTI_RESOLVER_KEY: body_resolvers},  # type:ignore
                 ),
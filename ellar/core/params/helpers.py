@@ -1,9 +1,40 @@
-from pydantic import BaseModel
+import copy
+import typing as t
+from datetime import date, time, timedelta
+from decimal import Decimal
+from enum import Enum, IntEnum
+from uuid import UUID
+
+from pydantic import BaseConfig, BaseModel
 from pydantic.fields import SHAPE_SINGLETON, ModelField
 from pydantic.utils import lenient_issubclass
+from pydantic.validators import (
+    bool_validator,
+    enum_member_validator,
+    float_validator,
+    int_validator,
+    str_validator,
+    uuid_validator,
+)
 
 from ellar.constants import sequence_shapes, sequence_types
 
+IMMUTABLE_DEFAULT_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    Decimal,
+    Enum,
+    UUID,
+    date,
+    time,
+    timedelta,
+)
+
 
 def is_scalar_sequence_field(field: ModelField) -> bool:
     if (field.shape in sequence_shapes) and not lenient_issubclass(
@@ -35,3 +66,80 @@ def is_scalar_field(field: ModelField) -> bool:
         if not all(is_scalar_field(f) for f in field.sub_fields):
             return False
     return True
+
+
+def get_scalar_validator(field: ModelField) -> t.Optional[t.Callable[[t.Any], t.Any]]:
+    """
+    Returns a validator for plain `int`, `float`, `bool`, `str`, `UUID` and `Enum` fields.
+    It applies the same pydantic validators as `field.validate` for a not None value.
+    Returns None for constrained, complex or customized fields.
+    """
+    if (
+        field.shape != SHAPE_SINGLETON
+        or field.sub_fields
+        or field.class_validators
+        or field.pre_validators
+        or field.post_validators
+    ):
+        return None
+
+    type_ = field.type_
+    config = field.model_config
+    if type_ is int:
+        return int_validator
+    if type_ is bool:
+        return bool_validator
+    if type_ is float and getattr(config, "allow_inf_nan", True):
+        return float_validator
+    if type_ is str and not (
+        config.anystr_strip_whitespace
+        or config.anystr_upper
+        or config.anystr_lower
+        or config.min_anystr_length
+        or config.max_anystr_length
+    ):
+        return str_validator
+    if type_ is UUID:
+        return lambda value: uuid_validator(value, field)
+    if (
+        lenient_issubclass(type_, Enum)
+        and type_ not in (Enum, IntEnum)
+        and not hasattr(type_, "__get_validators__")
+    ):
+        # pydantic validators receive the config class, typed as a config instance
+        enum_config = t.cast(BaseConfig, config)
+        if issubclass(type_, IntEnum):
+            return lambda value: enum_member_validator(
+                int_validator(value), field, enum_config
+            )
+        return lambda value: enum_member_validator(value, field, enum_config)
+    return None
+
+
+def is_immutable_default(value: t.Any) -> bool:
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_immutable_default(item) for item in value)
+    return isinstance(value, IMMUTABLE_DEFAULT_TYPES)
+
+
+def get_default_factory(field: ModelField) -> t.Callable[[], t.Any]:
+    """
+    Returns a function creating the default value of `field` for a missing parameter.
+    Immutable defaults are returned as is, mutable defaults are copied.
+    """
+    if field.default_factory is not None:
+        return field.default_factory
+
+    default = field.default
+    if is_immutable_default(default):
+        return lambda: default
+
+    if isinstance(default, (list, set)) and all(
+        is_immutable_default(item) for item in default
+    ):
+        return default.copy
+    if isinstance(default, dict) and all(
+        is_immutable_default(item) for item in default.values()
+    ):
+        return default.copy
+    return lambda: copy.deepcopy(default)
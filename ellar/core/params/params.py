@@ -1,4 +1,5 @@
 import copy
+import hashlib
 import re
 import sys
 import typing as t
@@ -7,6 +8,7 @@ from enum import Enum
 from pydantic.fields import FieldInfo, ModelField, Undefined
 
 from ellar.constants import MULTI_RESOLVER_KEY
+from ellar.core.datastructures import UploadFileOptions
 
 from .resolvers import (
     BodyParameterResolver,
@@ -202,6 +204,7 @@ class Body(Param):
         *,
         embed: bool = False,
         media_type: t.Optional[str] = None,
+        max_size: t.Optional[int] = None,
         alias: t.Optional[str] = None,
         title: t.Optional[str] = None,
         description: t.Optional[str] = None,
@@ -218,6 +221,8 @@ class Body(Param):
     ) -> None:
         self.embed = embed
         self.media_type = media_type or self.MEDIA_TYPE
+        # request body size limit in bytes
+        self.max_size = max_size
 
         super().__init__(
             default,
@@ -254,6 +259,7 @@ class Form(Body):
         default: t.Any,
         *,
         media_type: str = "application/x-www-form-urlencoded",
+        max_size: t.Optional[int] = None,
         alias: t.Optional[str] = None,
         title: t.Optional[str] = None,
         description: t.Optional[str] = None,
@@ -272,6 +278,7 @@ class Form(Body):
             default,
             embed=True,
             media_type=media_type,
+            max_size=max_size,
             alias=alias,
             title=title,
             description=description,
@@ -291,3 +298,55 @@ class Form(Body):
 class File(Form):
     resolver: t.Type[RouteParameterResolver] = FileParameterResolver
     MEDIA_TYPE: str = "multipart/form-data"
+
+    def __init__(
+        self,
+        default: t.Any,
+        *,
+        media_type: str = "multipart/form-data",
+        max_size: t.Optional[int] = None,
+        spool_max_size: t.Optional[int] = None,
+        spool_dir: t.Optional[str] = None,
+        hash_algorithm: t.Optional[str] = None,
+        alias: t.Optional[str] = None,
+        title: t.Optional[str] = None,
+        description: t.Optional[str] = None,
+        gt: t.Optional[float] = None,
+        ge: t.Optional[float] = None,
+        lt: t.Optional[float] = None,
+        le: t.Optional[float] = None,
+        min_length: t.Optional[int] = None,
+        max_length: t.Optional[int] = None,
+        regex: t.Optional[str] = None,
+        example: t.Any = Undefined,
+        examples: t.Optional[t.Dict[str, t.Any]] = None,
+        **extra: t.Any,
+    ):
+        if (
+            hash_algorithm is not None
+            and hash_algorithm not in hashlib.algorithms_available
+        ):
+            raise ValueError(f"Unsupported hash algorithm: {hash_algorithm}")
+        self.upload_file_options = UploadFileOptions(
+            spool_max_size=spool_max_size,
+            spool_dir=spool_dir,
+            hash_algorithm=hash_algorithm,
+        )
+        super().__init__(
+            default,
+            media_type=media_type,
+            max_size=max_size,
+            alias=alias,
+            title=title,
+            description=description,
+            gt=gt,
+            ge=ge,
+            lt=lt,
+            le=le,
+            min_length=min_length,
+            max_length=max_length,
+            regex=regex,
+            example=example,
+            examples=examples,
+            **extra,
+        )
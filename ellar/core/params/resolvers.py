@@ -1,32 +1,79 @@
-import copy
-import email
 import inspect
-import json
 import typing as t
 from abc import ABC, ABCMeta, abstractmethod
+from pathlib import Path
 
-import anyio
+from pydantic import BaseModel, ValidationError
 from pydantic.error_wrappers import ErrorWrapper
 from pydantic.errors import MissingError
-from pydantic.fields import ModelField, Undefined
+from pydantic.fields import ModelField
 from pydantic.utils import lenient_issubclass
-from starlette.datastructures import FormData, Headers, QueryParams
+from starlette.datastructures import (
+    FormData,
+    Headers,
+    QueryParams,
+    UploadFile as StarletteUploadFile,
+)
 from starlette.exceptions import HTTPException
 
 from ellar.constants import sequence_shape_to_type, sequence_shapes, sequence_types
+from ellar.core.codecs import BaseJSONCodec, is_json_content_type
 from ellar.core.context import IExecutionContext
-from ellar.core.datastructures import UploadFile
+from ellar.core.datastructures import UploadFile, UploadFileOptions
 from ellar.exceptions import RequestValidationError
 from ellar.logger import logger
 from ellar.types import T
 
+from .helpers import get_default_factory, get_scalar_validator
+
 if t.TYPE_CHECKING:  # pragma: no cover
     from .params import Param
 
 
+# values and errors of resolved parameters
+TResolvedParameters = t.Tuple[t.Dict, t.List]
+TParameterAccessor = t.Callable[[IExecutionContext], TResolvedParameters]
+
+
 class RouteParameterModelField(ModelField):
+    """
+    ModelField validating plain scalar values without going through
+    the general `ModelField.validate` machinery
+    """
+
+    __slots__ = ("scalar_validator",)
+
     field_info: "Param"
 
+    def prepare(self) -> None:
+        super().prepare()
+        self.scalar_validator = get_scalar_validator(self)
+
+    def validate(
+        self,
+        v: t.Any,
+        values: t.Dict[str, t.Any],
+        *,
+        loc: t.Any,
+        cls: t.Optional[t.Any] = None,
+    ) -> t.Tuple[t.Any, t.Any]:
+        if v is not None and self.scalar_validator is not None:
+            try:
+                return self.scalar_validator(v), None
+            except (ValueError, TypeError, AssertionError) as exc:
+                return v, ErrorWrapper(exc, loc)
+        return super().validate(v, values, loc=loc, cls=cls)
+
+
+def _uses_default_resolution(
+    resolver: "RouteParameterResolver", owner: t.Type["RouteParameterResolver"]
+) -> bool:
+    resolver_type = type(resolver)
+    return (
+        resolver_type.resolve is RouteParameterResolver.resolve
+        and resolver_type.resolve_handle is owner.resolve_handle
+    )
+
 
 class BaseRouteParameterResolver(ABC, metaclass=ABCMeta):
     @abstractmethod
@@ -40,6 +87,7 @@ class RouteParameterResolver(BaseRouteParameterResolver, ABC):
         self.model_field: RouteParameterModelField = t.cast(
             RouteParameterModelField, model_field
         )
+        self.get_default_value = get_default_factory(self.model_field)
 
     def assert_field_info(self) -> None:
         from . import params
@@ -62,6 +110,13 @@ class RouteParameterResolver(BaseRouteParameterResolver, ABC):
         value_ = await self.resolve_handle(*args, **kwargs)
         return value_
 
+    def create_accessor(self) -> t.Optional[TParameterAccessor]:
+        """
+        Returns a synchronous function resolving the parameter from the execution context.
+        Returns None when the parameter has to be resolved through `resolve`
+        """
+        return None
+
     @abstractmethod
     @t.no_type_check
     async def resolve_handle(self, *args: t.Any, **kwargs: t.Any) -> t.Tuple:
@@ -102,7 +157,7 @@ class HeaderParameterResolver(RouteParameterResolver):
                 ]
                 return {}, errors
             else:
-                values[self.model_field.name] = copy.deepcopy(self.model_field.default)
+                values[self.model_field.name] = self.get_default_value()
                 return values, []
 
         v_, errors_ = self.model_field.validate(
@@ -110,6 +165,39 @@ class HeaderParameterResolver(RouteParameterResolver):
         )
         return {self.model_field.name: v_}, self.validate_error_sequence(errors_)
 
+    def create_accessor(self) -> t.Optional[TParameterAccessor]:
+        if not _uses_default_resolution(self, HeaderParameterResolver):
+            return None
+
+        self.assert_field_info()
+        model_field = self.model_field
+        name, alias = model_field.name, model_field.alias
+        loc = (model_field.field_info.in_.value, alias)
+        is_sequence = (
+            model_field.shape in sequence_shapes or model_field.type_ in sequence_types
+        )
+        get_received_parameter = self.get_received_parameter
+        get_default_value = self.get_default_value
+        create_error = self.create_error
+        validate_error_sequence = self.validate_error_sequence
+
+        def accessor(ctx: IExecutionContext) -> TResolvedParameters:
+            received_params = get_received_parameter(ctx=ctx)
+            if is_sequence:
+                value = received_params.getlist(alias) or model_field.default
+            else:
+                value = received_params.get(alias)
+
+            if value is None:
+                if model_field.required:
+                    return {}, [create_error(loc=loc)]
+                return {name: get_default_value()}, []
+
+            v_, errors_ = model_field.validate(value, {}, loc=loc)
+            return {name: v_}, validate_error_sequence(errors_)
+
+        return accessor
+
 
 class QueryParameterResolver(HeaderParameterResolver):
     @classmethod
@@ -138,6 +226,24 @@ class PathParameterResolver(RouteParameterResolver):
         )
         return {self.model_field.name: v_}, self.validate_error_sequence(errors_)
 
+    def create_accessor(self) -> t.Optional[TParameterAccessor]:
+        if not _uses_default_resolution(self, PathParameterResolver):
+            return None
+
+        self.assert_field_info()
+        model_field = self.model_field
+        name, alias = model_field.name, str(model_field.alias)
+        loc = (model_field.field_info.in_.value, model_field.alias)
+        get_received_parameter = self.get_received_parameter
+        validate_error_sequence = self.validate_error_sequence
+
+        def accessor(ctx: IExecutionContext) -> TResolvedParameters:
+            value = get_received_parameter(ctx=ctx).get(alias)
+            v_, errors_ = model_field.validate(value, {}, loc=loc)
+            return {name: v_}, validate_error_sequence(errors_)
+
+        return accessor
+
 
 class CookieParameterResolver(PathParameterResolver):
     @classmethod
@@ -169,27 +275,32 @@ class BodyParameterResolver(WsBodyParameterResolver):
     def __init__(self, *args: t.Any, **kwargs: t.Any):
         super().__init__(*args, **kwargs)
 
+    def get_max_body_size(self) -> t.Optional[int]:
+        return t.cast(
+            t.Optional[int], getattr(self.model_field.field_info, "max_size", None)
+        )
+
     async def get_request_body(self, ctx: IExecutionContext) -> t.Any:
+        json_codec = t.cast(BaseJSONCodec, ctx.get_app().config.JSON_CODEC)
         try:
             request = ctx.switch_to_request()
+            request.max_body_size = self.get_max_body_size()
             body_bytes = await request.body()
             if body_bytes:
-                json_body: t.Any = Undefined
-                content_type_value = request.headers.get("content-type")
-                if not content_type_value:
-                    json_body = await request.json()
-                else:
-                    message = email.message.Message()
-                    message["content-type"] = content_type_value
-                    if message.get_content_maintype() == "application":
-                        subtype = message.get_content_subtype()
-                        if subtype == "json" or subtype.endswith("+json"):
-                            json_body = await request.json()
-                if json_body != Undefined:
-                    body_bytes = json_body
+                content_type: t.Optional[bytes] = None
+                for key, value in request.headers.raw:
+                    if key == b"content-type":
+                        content_type = value
+                        break
+                if is_json_content_type(content_type):
+                    body_bytes = json_codec.loads(body_bytes)
             return body_bytes
-        except json.JSONDecodeError as e:
-            raise RequestValidationError([ErrorWrapper(e, ("body", e.pos))])
+        except json_codec.decode_error as e:
+            raise RequestValidationError(
+                [ErrorWrapper(e, ("body", getattr(e, "pos", 0)))]
+            )
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=400, detail="There was an error parsing the body"
@@ -219,8 +330,11 @@ class FormParameterResolver(BodyParameterResolver):
     async def get_request_body(self, ctx: IExecutionContext) -> t.Any:
         try:
             request = ctx.switch_to_request()
+            request.max_body_size = self.get_max_body_size()
             body_bytes = await request.form()
             return body_bytes
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=400, detail="There was an error parsing the body"
@@ -262,49 +376,74 @@ class FormParameterResolver(BodyParameterResolver):
                     values=values, value=_body, loc=loc
                 )
             else:
-                values[self.model_field.name] = copy.deepcopy(self.model_field.default)
+                values[self.model_field.name] = self.get_default_value()
             return values, []
 
         return await self.process_and_validate(values=values, value=value, loc=loc)
 
 
 class FileParameterResolver(FormParameterResolver):
+    def get_upload_file_options(self) -> t.Optional[UploadFileOptions]:
+        return t.cast(
+            t.Optional[UploadFileOptions],
+            getattr(self.model_field.field_info, "upload_file_options", None),
+        )
+
+    async def get_upload_file_value(self, value: t.Any) -> t.Any:
+        if not isinstance(value, StarletteUploadFile):
+            return value
+        upload_file = value
+        if not isinstance(upload_file, UploadFile):
+            upload_file = await UploadFile.from_upload(
+                value, self.get_upload_file_options()
+            )
+        if lenient_issubclass(self.model_field.type_, bytes):
+            return await upload_file.read()
+        if lenient_issubclass(self.model_field.type_, Path):
+            path = await upload_file.get_path()
+            # the request form keeps the named file, so it lives until the form is closed
+            value.file = upload_file.file
+            return path
+        return upload_file
+
     async def process_and_validate(
         self, *, values: t.Dict, value: t.Any, loc: t.Tuple
     ) -> t.Tuple:
-        if lenient_issubclass(self.model_field.type_, bytes) and isinstance(
-            value, UploadFile
+        if self.model_field.shape in sequence_shapes and isinstance(
+            value, sequence_types
         ):
-            value = await value.read()
-        elif (
-            self.model_field.shape in sequence_shapes
-            and lenient_issubclass(self.model_field.type_, bytes)
-            and isinstance(value, sequence_types)
-        ):
-            results: t.List[t.Union[bytes, str]] = []
-
-            async def process_fn(
-                fn: t.Callable[[], t.Coroutine[t.Any, t.Any, t.Any]]
-            ) -> None:
-                result = await fn()
-                results.append(result)
-
-            async with anyio.create_task_group() as tg:
-                for sub_value in value:
-                    tg.start_soon(process_fn, sub_value.read)
+            # uploads are processed one after the other, so a single `bytes` copy is read at a time
+            results = [await self.get_upload_file_value(item) for item in value]
             value = sequence_shape_to_type[self.model_field.shape](results)
+        else:
+            value = await self.get_upload_file_value(value)
 
         v_, errors_ = self.model_field.validate(value, values, loc=loc)
         values[self.model_field.name] = v_
         return values, self.validate_error_sequence(errors_)
 
 
+def _iter_error_wrappers(errors: t.Sequence[t.Any]) -> t.Iterator[ErrorWrapper]:
+    for error in errors:
+        if isinstance(error, ErrorWrapper):
+            yield error
+        else:
+            yield from _iter_error_wrappers(error)
+
+
 class BulkParameterResolver(RouteParameterResolver):
+    """
+    Resolves a model parameter from its fields.
+    When all field resolvers have accessors, the raw values of all fields are extracted
+    and validated once through the model. Otherwise, each field is resolved on its own.
+    """
+
     def __init__(
         self, *args: t.Any, resolvers: t.List[RouteParameterResolver], **kwargs: t.Any
     ):
         super().__init__(*args, **kwargs)
         self._resolvers = resolvers or []
+        self._single_pass_accessor = self.create_accessor()
 
     @property
     def resolvers(self) -> t.List[RouteParameterResolver]:
@@ -313,9 +452,78 @@ class BulkParameterResolver(RouteParameterResolver):
     def get_model_fields(self) -> t.List[ModelField]:
         return [resolver.model_field for resolver in self._resolvers]
 
+    def create_accessor(self) -> t.Optional[TParameterAccessor]:
+        if not _uses_default_resolution(
+            self, BulkParameterResolver
+        ) or not lenient_issubclass(self.model_field.outer_type_, BaseModel):
+            return None
+
+        fields = []
+        for parameter_resolver in self._resolvers:
+            if (
+                not isinstance(
+                    parameter_resolver, (HeaderParameterResolver, PathParameterResolver)
+                )
+                or not parameter_resolver.create_accessor()
+            ):
+                return None
+            model_field = parameter_resolver.model_field
+            fields.append(
+                (
+                    parameter_resolver.get_received_parameter,
+                    model_field.name,
+                    model_field.alias,
+                    isinstance(parameter_resolver, HeaderParameterResolver)
+                    and (
+                        model_field.shape in sequence_shapes
+                        or model_field.type_ in sequence_types
+                    ),
+                )
+            )
+
+        self.assert_field_info()
+        model: t.Type[BaseModel] = self.model_field.outer_type_
+        name = self.model_field.name
+        in_ = self.model_field.field_info.in_.value
+        model_loc = (in_, self.model_field.alias)
+        # pydantic reports errors by model field alias, which is the sub field name
+        aliases: t.Dict[t.Union[int, str], str] = {
+            field_name: alias for _, field_name, alias, _ in fields
+        }
+
+        def accessor(ctx: IExecutionContext) -> TResolvedParameters:
+            raw_values: t.Dict[str, t.Any] = {}
+            for get_received_parameter, field_name, alias, is_sequence in fields:
+                received_params = get_received_parameter(ctx=ctx)
+                if is_sequence:
+                    value = t.cast(
+                        t.Union[QueryParams, Headers], received_params
+                    ).getlist(alias)
+                    if value:
+                        raw_values[field_name] = value
+                elif alias in received_params:
+                    raw_values[field_name] = received_params[alias]
+            try:
+                return {name: model(**raw_values)}, []
+            except ValidationError as ex:
+                errors = []
+                for error in _iter_error_wrappers(ex.raw_errors):
+                    loc = error.loc_tuple()
+                    if loc and loc[0] in aliases:
+                        loc = (in_, aliases[loc[0]]) + loc[1:]
+                    else:
+                        loc = model_loc + loc
+                    errors.append(ErrorWrapper(error.exc, loc=loc))
+                return raw_values, errors
+
+        return accessor
+
     async def resolve_handle(
         self, ctx: IExecutionContext, *args: t.Any, **kwargs: t.Any
     ) -> t.Tuple:
+        if self._single_pass_accessor is not None:
+            return self._single_pass_accessor(ctx)
+
         values: t.Dict[str, t.Any] = {}
         errors: t.List[ErrorWrapper] = []
 
@@ -424,7 +632,7 @@ class ParameterInjectable(NonFieldRouteParameterResolver):
             service_provider = ctx.get_service_provider()
             if not self.data:
                 raise Exception("ParameterInjectable not properly setup")
-            value = service_provider.get(self.data)
+            value = await service_provider.get_async(self.data)
             return {self.parameter_name: value}, []
         except Exception as ex:
             logger.error(f"Unable to resolve service {self.data} \nErrorMessage: {ex}")
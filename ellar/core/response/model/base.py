@@ -97,9 +97,7 @@ class BaseResponseModel(IResponseModel, ABC):
     ) -> Response:
         """Cant create custom responses, Please override this function to create a custom response"""
         response_args, headers = self.get_context_response(context=context)
-        serializer_filter: t.Optional[SerializerFilter] = reflect.get_metadata(
-            SERIALIZER_FILTER_KEY, context.get_handler()
-        )
+        serializer_filter = self.get_serializer_filter(context=context)
 
         response = self._response_type(
             **response_args,
@@ -110,6 +108,18 @@ class BaseResponseModel(IResponseModel, ABC):
         )
         return response
 
+    @classmethod
+    def get_serializer_filter(
+        cls, context: IExecutionContext
+    ) -> t.Optional[SerializerFilter]:
+        operation = context.get_operation()
+        if operation is not None:
+            return operation.route_metadata.serializer_filter
+        return t.cast(
+            t.Optional[SerializerFilter],
+            reflect.get_metadata(SERIALIZER_FILTER_KEY, context.get_handler()),
+        )
+
     @classmethod
     def get_context_response(
         cls, context: IExecutionContext, **kwargs: t.Any
@@ -1,27 +1,58 @@
 import typing as t
 from abc import ABC, abstractmethod
+from weakref import WeakKeyDictionary
 
+from injector import SingletonScope as InjectorSingletonScope
 from starlette.routing import Match
 
-from ellar.constants import GUARDS_KEY, SCOPE_API_VERSIONING_RESOLVER, VERSIONING_KEY
+from ellar.constants import (
+    CONTROLLER_CLASS_KEY,
+    GUARDS_KEY,
+    SCOPE_API_VERSIONING_RESOLVER,
+    SERIALIZER_FILTER_KEY,
+    VERSIONING_KEY,
+)
 from ellar.core.context import ExecutionContext
+from ellar.di import SingletonScope
+from ellar.di.service_config import get_scope
 from ellar.reflect import reflect
 from ellar.types import TReceive, TScope, TSend
 
 if t.TYPE_CHECKING:  # pragma: no cover
+    from ellar.core.controller import ControllerBase
     from ellar.core.guard import GuardCanActivate
+    from ellar.core.main import App
     from ellar.core.versioning.resolver import BaseAPIVersioningResolver
+    from ellar.di import EllarInjector
+    from ellar.serializer import SerializerFilter
+
+TGuard = t.Union[t.Type["GuardCanActivate"], "GuardCanActivate"]
 
 __all__ = [
+    "RouteMetadata",
     "RouteOperationBase",
     "WebsocketRouteOperationBase",
 ]
 
 
+class RouteMetadata(t.NamedTuple):
+    """Immutable snapshot of the metadata an operation reads on every request"""
+
+    guards: t.Tuple[TGuard, ...]
+    versions: t.FrozenSet[t.Union[int, float, str]]
+    serializer_filter: t.Optional["SerializerFilter"]
+    controller_type: t.Optional[t.Type["ControllerBase"]]
+
+
 class RouteOperationBase:
     path: str
     endpoint: t.Callable
     methods: t.Set[str]
+    _route_metadata: t.Optional[RouteMetadata] = None
+    # injector -> (route metadata snapshot, resolved guards)
+    _resolved_guards: t.Optional[
+        "WeakKeyDictionary[EllarInjector, t.Tuple[RouteMetadata, t.Tuple[TGuard, ...]]]"
+    ] = None
 
     @t.no_type_check
     def __call__(
@@ -34,20 +65,67 @@ class RouteOperationBase:
         """compute route models"""
 
     async def run_route_guards(self, context: ExecutionContext) -> None:
-        app = context.get_app()
-        _guards: t.Optional[
-            t.List[t.Union[t.Type["GuardCanActivate"], "GuardCanActivate"]]
-        ] = reflect.get_metadata(GUARDS_KEY, self.endpoint)
-        if not _guards:
-            _guards = app.get_guards()
-
-        if _guards:
-            for guard in _guards:
-                if isinstance(guard, type):
-                    guard = guard()
-                result = await guard.can_activate(context)
-                if not result:
-                    guard.raise_exception()
+        for guard in self.get_route_guards(context.get_app()):
+            if isinstance(guard, type):
+                # request scoped and transient guards
+                guard = context.get_service_provider().get(guard)
+            result = await guard.can_activate(context)
+            if not result:
+                guard.raise_exception()
+
+    def get_route_guards(self, app: "App") -> t.Tuple[TGuard, ...]:
+        """
+        Returns the route guards with singleton guard types replaced by their instances.
+        Guards are resolved once per injector and route metadata snapshot,
+        routes without guards use the application guards
+        """
+        route_metadata = self.route_metadata
+        if not route_metadata.guards:
+            return app.get_resolved_guards()
+
+        if self._resolved_guards is None:
+            self._resolved_guards = WeakKeyDictionary()
+
+        cached = self._resolved_guards.get(app.injector)
+        if cached is None or cached[0] is not route_metadata:
+            cached = (
+                route_metadata,
+                self.resolve_guards(app.injector, route_metadata.guards),
+            )
+            self._resolved_guards[app.injector] = cached
+        return cached[1]
+
+    @classmethod
+    def register_guards(
+        cls, injector: "EllarInjector", guards: t.Sequence[TGuard]
+    ) -> None:
+        """
+        Registers guard types that have no binding in the container
+        with their declared scope, or SingletonScope when none is declared
+        """
+        for guard in guards:
+            if (
+                isinstance(guard, type)
+                and injector.container.get_resolution_plan(guard) is None
+            ):
+                injector.container.register(
+                    guard, scope=get_scope(guard) or SingletonScope
+                )
+
+    @classmethod
+    def resolve_guards(
+        cls, injector: "EllarInjector", guards: t.Sequence[TGuard]
+    ) -> t.Tuple[TGuard, ...]:
+        # guards of routes added after the application is built are registered here
+        cls.register_guards(injector, guards)
+        resolved: t.List[TGuard] = []
+        for guard in guards:
+            if isinstance(guard, type):
+                plan = injector.container.get_resolution_plan(guard)
+                if plan is not None and isinstance(plan.scope, InjectorSingletonScope):
+                    guard = injector.get(guard)
+            resolved.append(guard)
+        return tuple(resolved)
 
     async def app(self, scope: TScope, receive: TReceive, send: TSend) -> None:
         context = ExecutionContext.create_context(
@@ -65,8 +143,34 @@ class RouteOperationBase:
         """Full operation initialization"""
 
     def get_allowed_version(self) -> t.Set[t.Union[int, float, str]]:
-        versions = reflect.get_metadata(VERSIONING_KEY, self.endpoint) or set()
-        return t.cast(t.Set[t.Union[int, float, str]], versions)
+        return t.cast(t.Set[t.Union[int, float, str]], self.route_metadata.versions)
+
+    @property
+    def route_metadata(self) -> RouteMetadata:
+        """Metadata snapshot taken when the operation was last built"""
+        if self._route_metadata is None:
+            return self.refresh_route_metadata()
+        return self._route_metadata
+
+    def refresh_route_metadata(self) -> RouteMetadata:
+        """
+        Re-reads the endpoint metadata. Call this after changing an endpoint's
+        metadata at runtime, requests keep using the old snapshot until then.
+        """
+        self._route_metadata = self.create_route_metadata()
+        return self._route_metadata
+
+    def create_route_metadata(self) -> RouteMetadata:
+        return RouteMetadata(
+            guards=tuple(reflect.get_metadata(GUARDS_KEY, self.endpoint) or ()),
+            versions=frozenset(
+                reflect.get_metadata(VERSIONING_KEY, self.endpoint) or ()
+            ),
+            serializer_filter=reflect.get_metadata(
+                SERIALIZER_FILTER_KEY, self.endpoint
+            ),
+            controller_type=reflect.get_metadata(CONTROLLER_CLASS_KEY, self.endpoint),
+        )
 
     @classmethod
     def get_methods(cls, methods: t.Optional[t.List[str]] = None) -> t.Set[str]:
@@ -79,8 +183,12 @@ class RouteOperationBase:
 
         return _methods
 
+    def matches_path(self, scope: TScope) -> t.Tuple[Match, TScope]:
+        """Matches scope path and method without checking route versions"""
+        return t.cast(t.Tuple[Match, TScope], super().matches(scope))  # type: ignore
+
     def matches(self, scope: TScope) -> t.Tuple[Match, TScope]:
-        match = super().matches(scope)  # type: ignore
+        match = self.matches_path(scope)
         if match[0] is not Match.NONE:
             version_scheme_resolver: "BaseAPIVersioningResolver" = t.cast(
                 "BaseAPIVersioningResolver", scope[SCOPE_API_VERSIONING_RESOLVER]
@@ -89,7 +197,7 @@ class RouteOperationBase:
                 route_versions=self.get_allowed_version()
             ):
                 return Match.NONE, {}
-        return match  # type: ignore
+        return match
 
     def __hash__(self) -> int:  # pragma: no cover
         return hash(self.endpoint)
@@ -1,25 +1,26 @@
 import typing as t
 
-from ellar.constants import CONTROLLER_CLASS_KEY
 from ellar.core.context import ExecutionContext
 from ellar.core.controller import ControllerBase
-from ellar.reflect import reflect
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from ..base import RouteMetadata
 
 
 class ControllerRouteOperationBase:
     endpoint: t.Callable
+    route_metadata: "RouteMetadata"
 
     def _get_controller_instance(self, ctx: ExecutionContext) -> ControllerBase:
-        controller_type: t.Optional[t.Type[ControllerBase]] = reflect.get_metadata(
-            CONTROLLER_CLASS_KEY, self.endpoint
-        )
+        controller_type: t.Optional[
+            t.Type[ControllerBase]
+        ] = self.route_metadata.controller_type
         if not controller_type:
             raise RuntimeError("Controller Type was not found")
 
         service_provider = ctx.get_service_provider()
 
         controller_instance: ControllerBase = service_provider.get(controller_type)
-        controller_instance.context = ctx
         return controller_instance
 
     @t.no_type_check
@@ -27,4 +28,8 @@ class ControllerRouteOperationBase:
         self, context: ExecutionContext, *args: t.Any, **kwargs: t.Any
     ) -> t.Any:
         controller_instance = self._get_controller_instance(ctx=context)
-        return self.endpoint(controller_instance, *args, **kwargs)
+        token = controller_instance.bind_context(context)
+        try:
+            return self.endpoint(controller_instance, *args, **kwargs)
+        finally:
+            controller_instance.unbind_context(token)
@@ -3,6 +3,7 @@ import typing as t
 from starlette.concurrency import run_in_threadpool
 
 from ellar.core.context import ExecutionContext
+from ellar.core.controller import ControllerBase
 from ellar.core.routing.route import RouteOperation
 from ellar.exceptions import RequestValidationError
 
@@ -14,7 +15,15 @@ class ControllerRouteOperation(ControllerRouteOperationBase, RouteOperation):
 
     async def _handle_request(self, context: ExecutionContext) -> t.Any:
         controller_instance = self._get_controller_instance(ctx=context)
-
+        token = controller_instance.bind_context(context)
+        try:
+            await self._handle_controller_request(context, controller_instance)
+        finally:
+            controller_instance.unbind_context(token)
+
+    async def _handle_controller_request(
+        self, context: ExecutionContext, controller_instance: ControllerBase
+    ) -> None:
         func_kwargs, errors = await self.endpoint_parameter_model.resolve_dependencies(
             ctx=context
         )
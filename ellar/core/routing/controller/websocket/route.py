@@ -3,6 +3,7 @@ import typing as t
 from starlette.status import WS_1008_POLICY_VIOLATION
 
 from ellar.core.context import ExecutionContext
+from ellar.core.controller import ControllerBase
 from ellar.exceptions import WebSocketRequestValidationError
 
 from ...websocket import WebsocketRouteOperation
@@ -21,6 +22,15 @@ class ControllerWebsocketRouteOperation(
 
     async def _handle_request(self, context: ExecutionContext) -> None:
         controller_instance = self._get_controller_instance(ctx=context)
+        token = controller_instance.bind_context(context)
+        try:
+            await self._handle_controller_request(context, controller_instance)
+        finally:
+            controller_instance.unbind_context(token)
+
+    async def _handle_controller_request(
+        self, context: ExecutionContext, controller_instance: ControllerBase
+    ) -> None:
         func_kwargs, errors = await self.endpoint_parameter_model.resolve_dependencies(
             ctx=context
         )
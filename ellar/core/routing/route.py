@@ -101,6 +101,7 @@ class RouteOperation(RouteOperationBase, StarletteRoute):
         self.include_in_schema = include_in_schema
         if name:
             self.name = f"{name}:{self.name}"
+        self.refresh_route_metadata()
 
     def _load_model(self) -> None:
         self.build_route_operation()
@@ -2,12 +2,25 @@ import typing as t
 from functools import wraps
 from types import FunctionType
 
-from starlette.routing import BaseRoute, Router as StarletteRouter
+from starlette.datastructures import URL, URLPath
+from starlette.responses import RedirectResponse
+from starlette.routing import (
+    BaseRoute,
+    Match,
+    NoMatchFound,
+    Router as StarletteRouter,
+)
 
-from ellar.constants import OPERATION_HANDLER_KEY, SCOPE_API_VERSIONING_RESOLVER
+from ellar.constants import (
+    OPERATION_HANDLER_KEY,
+    SCOPE_API_ROUTE_VERSION,
+    SCOPE_API_VERSIONING_RESOLVER,
+)
 from ellar.reflect import reflect
 from ellar.types import ASGIApp, TReceive, TScope, TSend
 
+from ..base import RouteOperationBase
+from .match_cache import RouteMatchCache
 from .route_collections import RouteCollection
 
 if t.TYPE_CHECKING:  # pragma: no cover
@@ -30,6 +43,28 @@ def router_default_decorator(func: ASGIApp) -> ASGIApp:
     return _wrap
 
 
+def _route_matches(route: BaseRoute, scope: TScope) -> t.Tuple[Match, TScope]:
+    if isinstance(route, RouteOperationBase):
+        # versions are already resolved by the selected route table
+        return route.matches_path(scope)
+    return route.matches(scope)
+
+
+def _get_match_cache_key(scope: TScope) -> t.Tuple[t.Any, ...]:
+    host = None
+    for key, value in scope.get("headers", ()):
+        if key == b"host":
+            host = value
+            break
+    return (
+        scope["type"],
+        scope.get("method"),
+        scope["path"],
+        host,
+        scope.get(SCOPE_API_ROUTE_VERSION),
+    )
+
+
 class ApplicationRouter(StarletteRouter):
     routes: RouteCollection  # type: ignore
 
@@ -41,6 +76,7 @@ class ApplicationRouter(StarletteRouter):
         on_startup: t.Sequence[t.Callable] = None,
         on_shutdown: t.Sequence[t.Callable] = None,
         lifespan: t.Callable[[t.Any], t.AsyncContextManager] = None,
+        match_cache_size: int = 0,
     ):
         super().__init__(
             routes=None,
@@ -50,8 +86,119 @@ class ApplicationRouter(StarletteRouter):
             on_shutdown=on_shutdown,
             lifespan=lifespan,
         )
-        self.default = router_default_decorator(self.default)
+        self.default: ASGIApp = router_default_decorator(self.default)
         self.routes: RouteCollection = RouteCollection(routes)
+        self.match_cache: t.Optional[RouteMatchCache] = (
+            RouteMatchCache(match_cache_size) if match_cache_size > 0 else None
+        )
+
+    async def __call__(self, scope: TScope, receive: TReceive, send: TSend) -> None:
+        assert scope["type"] in ("http", "websocket", "lifespan")
+
+        if "router" not in scope:
+            scope["router"] = self
+
+        if scope["type"] == "lifespan":
+            await self.lifespan(scope, receive, send)
+            return
+
+        route_version: t.Optional[str] = scope.get(SCOPE_API_ROUTE_VERSION)
+        partial = None
+        partial_scope: TScope = {}
+
+        match_cache_key = None
+        if self.match_cache is not None:
+            match_cache_key = _get_match_cache_key(scope)
+            cached = self.match_cache.get(match_cache_key, self.routes.revision)
+            if cached is not None:
+                route, route_path_params = cached
+                path_params = dict(scope.get("path_params", {}))
+                path_params.update(route_path_params)
+                # only operation routes are cached
+                endpoint = t.cast(RouteOperationBase, route).endpoint
+                scope.update(endpoint=endpoint, path_params=path_params)
+                await route.handle(scope, receive, send)
+                return
+
+        for route in self.routes.get_route_candidates(scope["path"], route_version):
+            # Determine if any route matches the incoming scope,
+            # and hand over to the matching route if found.
+            match, child_scope = _route_matches(route, scope)
+            if match == Match.FULL:
+                if match_cache_key is not None and isinstance(
+                    route, RouteOperationBase
+                ):
+                    self._cache_match(match_cache_key, route, child_scope)
+                scope.update(child_scope)
+                await route.handle(scope, receive, send)
+                return
+            elif match == Match.PARTIAL and partial is None:
+                partial = route
+                partial_scope = child_scope
+
+        if partial is not None:
+            # Handle partial matches. These are cases where an endpoint is
+            # able to handle the request, but is not a preferred option.
+            # We use this in particular to deal with "405 Method Not Allowed".
+            scope.update(partial_scope)
+            await partial.handle(scope, receive, send)
+            return
+
+        if scope["type"] == "http" and self.redirect_slashes and scope["path"] != "/":
+            redirect_scope = dict(scope)
+            if scope["path"].endswith("/"):
+                redirect_scope["path"] = redirect_scope["path"].rstrip("/")
+            else:
+                redirect_scope["path"] = redirect_scope["path"] + "/"
+
+            for route in self.routes.get_route_candidates(
+                redirect_scope["path"], route_version
+            ):
+                match, child_scope = _route_matches(route, redirect_scope)
+                if match != Match.NONE:
+                    redirect_url = URL(scope=redirect_scope)
+                    response = RedirectResponse(url=str(redirect_url))
+                    await response(scope, receive, send)
+                    return
+
+        if route_version is not None and self._matches_other_versions(scope):
+            version_scheme_resolver: "BaseAPIVersioningResolver" = t.cast(
+                "BaseAPIVersioningResolver", scope[SCOPE_API_VERSIONING_RESOLVER]
+            )
+            version_scheme_resolver.matched_any_route = True
+
+        await self.default(scope, receive, send)
+
+    def url_path_for(self, name: str, **path_params: t.Any) -> URLPath:
+        for route in self.routes.get_named_routes(name):
+            try:
+                return route.url_path_for(name, **path_params)
+            except NoMatchFound:
+                pass
+        # routes added to a mounted app after the name index was built
+        return super().url_path_for(name, **path_params)
+
+    def _cache_match(
+        self, key: t.Tuple[t.Any, ...], route: BaseRoute, child_scope: TScope
+    ) -> None:
+        # only operation routes are cached, their child scope is fully
+        # described by the endpoint and the converted path parameters
+        assert self.match_cache is not None
+        path_params = child_scope.get("path_params", {})
+        route_path_params = {
+            name: path_params[name]
+            for name in getattr(route, "param_convertors", {})
+            if name in path_params
+        }
+        self.match_cache.set(key, (route, route_path_params))
+
+    def _matches_other_versions(self, scope: TScope) -> bool:
+        """Checks if the request path is served by a route of another version"""
+        for route in self.routes.get_route_candidates(scope["path"]):
+            match, _ = _route_matches(route, scope)
+            if match != Match.NONE:
+                return True
+        return False
 
     def append(self, item: t.Union[BaseRoute, t.Callable]) -> None:
         _item: t.Any = item
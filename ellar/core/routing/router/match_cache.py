@@ -0,0 +1,35 @@
+import typing as t
+
+from starlette.routing import BaseRoute
+
+from ellar.helper.lru import LRUCache, LRUCacheInfo
+
+__all__ = ["RouteMatchCache", "RouteMatchCacheInfo"]
+
+TMatchCacheKey = t.Tuple[t.Any, ...]
+TMatchCacheValue = t.Tuple[BaseRoute, t.Dict[str, t.Any]]
+
+RouteMatchCacheInfo = LRUCacheInfo
+
+
+class RouteMatchCache(LRUCache[TMatchCacheKey, TMatchCacheValue]):
+    """
+    Size bounded LRU cache of full route matches.
+
+    Each entry holds the matched route and its converted path parameters.
+    Entries are dropped once the route collection `revision` changes.
+    """
+
+    __slots__ = ("_revision",)
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__(max_size)
+        self._revision: t.Optional[int] = None
+
+    def get(  # type: ignore
+        self, key: TMatchCacheKey, revision: int
+    ) -> t.Optional[TMatchCacheValue]:
+        if revision != self._revision:
+            self.clear()
+            self._revision = revision
+        return super().get(key)
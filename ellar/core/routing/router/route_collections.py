@@ -1,31 +1,51 @@
+import bisect
 import typing as t
 from collections import OrderedDict
 
 from starlette.routing import BaseRoute, Host, Mount
 
+from ellar.constants import NOT_SET
 from ellar.core.routing.route import RouteOperation
 from ellar.core.routing.websocket.route import WebsocketRouteOperation
 from ellar.helper import generate_controller_operation_unique_id
+from ellar.logger import logger
+
+from .route_tree import RouteTree
+
+
+def _get_route_names(route: BaseRoute) -> t.Iterator[str]:
+    name: t.Optional[str] = getattr(route, "name", None)
+    if name is not None:
+        yield name
+
+    if isinstance(route, (Mount, Host)):
+        prefix = "" if name is None else f"{name}:"
+        for child_route in route.routes or []:
+            for child_name in _get_route_names(child_route):
+                yield prefix + child_name
 
 
 class ModuleRouteCollection(t.Sequence[BaseRoute]):
-    __slots__ = ("_routes",)
+    __slots__ = ("_routes", "_route_list")
 
     def __init__(self, routes: t.Optional[t.Sequence[BaseRoute]] = None) -> None:
         self._routes: t.Dict[int, BaseRoute] = OrderedDict()
+        self._route_list: t.Optional[t.List[BaseRoute]] = None
         self.extend([] if routes is None else list(routes))
 
     @t.no_type_check
     def __getitem__(self, i: int) -> BaseRoute:
-        return list(self._routes.values()).__getitem__(i)
+        if self._route_list is None:
+            self._route_list = list(self._routes.values())
+        return self._route_list.__getitem__(i)
 
-    def _add_operation(
+    def _get_operation_hash(
         self, operation: t.Union[RouteOperation, WebsocketRouteOperation, BaseRoute]
-    ) -> None:
+    ) -> t.Optional[int]:
         if not isinstance(
             operation, (RouteOperation, WebsocketRouteOperation, BaseRoute)
         ):
-            return
+            return None
 
         _methods = getattr(operation, "methods", {"WS"})
         _versioning = list(
@@ -40,15 +60,30 @@ class ModuleRouteCollection(t.Sequence[BaseRoute]):
                 operation.__class__.__name__,
             }
 
-        _hash = generate_controller_operation_unique_id(
+        return generate_controller_operation_unique_id(
             path=operation.path,  # type: ignore
             methods=list(_methods),
             versioning=_versioning or ["no_versioning"],
         )
-        if _hash in self._routes:
-            # TODO
-            """TODO: log warning to user when operations with the same route is found"""
+
+    def _set_operation(self, _hash: int, operation: BaseRoute) -> t.Optional[BaseRoute]:
+        """Stores `operation` and returns the operation it replaced, if any"""
+        previous = self._routes.get(_hash)
+        if previous is not None and previous is not operation:
+            logger.warning(
+                f"Route operation {operation} at '{getattr(operation, 'path', '')}' "
+                f"replaces {previous} registered with the same path, methods and versions."
+            )
         self._routes[_hash] = operation
+        self._route_list = None
+        return previous
+
+    def _add_operation(
+        self, operation: t.Union[RouteOperation, WebsocketRouteOperation, BaseRoute]
+    ) -> None:
+        _hash = self._get_operation_hash(operation)
+        if _hash is not None:
+            self._set_operation(_hash, operation)
 
     def __setitem__(self, i: int, o: BaseRoute) -> None:
         self._add_operation(o)
@@ -68,21 +103,46 @@ class ModuleRouteCollection(t.Sequence[BaseRoute]):
         return self
 
 
+def _get_route_sort_key(route: BaseRoute) -> str:
+    return getattr(route, "path", getattr(route, "host", ""))
+
+
 class RouteCollection(ModuleRouteCollection):
-    __slots__ = ("_routes", "_served_routes")
+    """
+    Route collection served by the application router.
+
+    Served routes are kept sorted by path. `append` inserts with bisect
+    while `extend` adds all routes and sorts once.
+    """
+
+    __slots__ = (
+        "_routes",
+        "_served_routes",
+        "_sort_keys",
+        "_route_trees",
+        "_name_index",
+        "_revision",
+    )
 
     def __init__(self, routes: t.Optional[t.Sequence[BaseRoute]] = None) -> None:
-        super().__init__(routes)
         self._served_routes: t.List[BaseRoute] = []
-        self.sort_routes()
+        self._sort_keys: t.List[str] = []
+        self._route_trees: t.Optional[t.Dict[t.Any, RouteTree]] = None
+        self._name_index: t.Optional[t.Dict[str, t.List[BaseRoute]]] = None
+        self._revision = 0
+        super().__init__(routes)
+
+    @property
+    def revision(self) -> int:
+        """Increases every time the served routes change"""
+        return self._revision
 
     @t.no_type_check
     def __getitem__(self, i: int) -> BaseRoute:
         return self._served_routes.__getitem__(i)
 
     def __setitem__(self, i: int, o: BaseRoute) -> None:
-        super().__setitem__(i, o)
-        self.sort_routes()
+        self.append(o)
 
     def __len__(self) -> int:
         return len(self._routes)
@@ -91,8 +151,31 @@ class RouteCollection(ModuleRouteCollection):
         return iter(self._served_routes)
 
     def append(self, __item: t.Any) -> None:
-        super().append(__item)
-        self.sort_routes()
+        _hash = self._get_operation_hash(__item)
+        if _hash is None:
+            return
+
+        previous = self._set_operation(_hash, __item)
+        key = _get_route_sort_key(__item)
+        if previous is not None:
+            # the sort key of `previous` is stale if its path changed after it was sorted
+            index = next(
+                index
+                for index, route in enumerate(self._served_routes)
+                if route is previous
+            )
+            if self._sort_keys[index] == key:
+                # the replacement keeps its position
+                self._served_routes[index] = __item
+                self._routes_changed()
+                return
+            del self._served_routes[index]
+            del self._sort_keys[index]
+
+        index = bisect.bisect_right(self._sort_keys, key)
+        self._sort_keys.insert(index, key)
+        self._served_routes.insert(index, __item)
+        self._routes_changed()
 
     def get_routes(self) -> t.List[BaseRoute]:
         return self._served_routes.copy()
@@ -103,9 +186,74 @@ class RouteCollection(ModuleRouteCollection):
         self.sort_routes()
         return self
 
+    def get_route_candidates(
+        self, path: str, version: t.Optional[str] = None
+    ) -> t.List[BaseRoute]:
+        """
+        Returns served routes that may match `path`, in the served order.
+
+        `version` selects the route table of routes declaring that version.
+        `None` selects the table of all routes, regardless of their versions.
+        Route tables are compiled on first lookup after the collection changes.
+        """
+        if self._route_trees is None:
+            self._route_trees = self._build_route_trees()
+        route_tree = self._route_trees.get(version)
+        if route_tree is None:
+            # no route declares this version
+            route_tree = self._route_trees[NOT_SET]
+        return route_tree.get_candidates(path)
+
+    def _build_route_trees(self) -> t.Dict[t.Any, RouteTree]:
+        # routes without version check, e.g `Mount` and `Host`, belong to every table
+        route_versions: t.List[t.Tuple[BaseRoute, t.Optional[t.Set[t.Any]]]] = [
+            (
+                route,
+                set(route.get_allowed_version())  # type: ignore
+                if hasattr(route, "get_allowed_version")
+                else None,
+            )
+            for route in self._served_routes
+        ]
+        versions: t.Set[t.Any] = {NOT_SET}
+        for _, _versions in route_versions:
+            versions.update(_versions or [])
+
+        route_trees: t.Dict[t.Any, RouteTree] = {None: RouteTree(self._served_routes)}
+        for version in versions:
+            route_trees[version] = RouteTree(
+                [
+                    route
+                    for route, _versions in route_versions
+                    if _versions is None or version in _versions
+                ]
+            )
+        return route_trees
+
+    def get_named_routes(self, name: str) -> t.List[BaseRoute]:
+        """
+        Returns served routes that can build a url for `name`, in the served order.
+
+        Names of routes under a `Mount` or `Host` are indexed with the
+        `<mount_name>:` prefix used by their `url_path_for`.
+        """
+        if self._name_index is None:
+            self._name_index = self._build_name_index()
+        return self._name_index.get(name, [])
+
+    def _build_name_index(self) -> t.Dict[str, t.List[BaseRoute]]:
+        name_index: t.Dict[str, t.List[BaseRoute]] = {}
+        for route in self._served_routes:
+            for name in set(_get_route_names(route)):
+                name_index.setdefault(name, []).append(route)
+        return name_index
+
     def sort_routes(self) -> None:
-        # TODO: flatten the routes for faster look up
-        self._served_routes = list(self._routes.values())
-        self._served_routes.sort(
-            key=lambda e: getattr(e, "path", getattr(e, "host", ""))
-        )
+        self._served_routes = sorted(self._routes.values(), key=_get_route_sort_key)
+        self._sort_keys = [_get_route_sort_key(route) for route in self._served_routes]
+        self._routes_changed()
+
+    def _routes_changed(self) -> None:
+        self._route_trees = None
+        self._name_index = None
+        self._revision += 1
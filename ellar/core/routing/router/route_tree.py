@@ -0,0 +1,131 @@
+import re
+import typing as t
+
+from starlette.convertors import (
+    Convertor,
+    FloatConvertor,
+    IntegerConvertor,
+    StringConvertor,
+    UUIDConvertor,
+)
+from starlette.routing import BaseRoute
+
+__all__ = ["RouteTree"]
+
+# convertors whose regex can never match across a `/`
+SINGLE_SEGMENT_CONVERTORS = (
+    StringConvertor,
+    IntegerConvertor,
+    FloatConvertor,
+    UUIDConvertor,
+)
+PARAM_REGEX = re.compile("{([a-zA-Z_][a-zA-Z0-9_]*)}")
+
+TIndexedRoute = t.Tuple[int, BaseRoute]
+
+
+class _RouteTreeNode:
+    __slots__ = ("static_children", "param_child", "routes", "catch_all_routes")
+
+    def __init__(self) -> None:
+        self.static_children: t.Dict[str, "_RouteTreeNode"] = {}
+        self.param_child: t.Optional["_RouteTreeNode"] = None
+        # routes whose path ends exactly at this node
+        self.routes: t.List[TIndexedRoute] = []
+        # routes that can match any path below this node, e.g `/{path:path}` or Mount
+        self.catch_all_routes: t.List[TIndexedRoute] = []
+
+    def get_static_child(self, segment: str) -> "_RouteTreeNode":
+        child = self.static_children.get(segment)
+        if child is None:
+            child = self.static_children[segment] = _RouteTreeNode()
+        return child
+
+    def get_param_child(self) -> "_RouteTreeNode":
+        if self.param_child is None:
+            self.param_child = _RouteTreeNode()
+        return self.param_child
+
+
+class RouteTree:
+    """
+    Compiled prefix tree of routes keyed by path segments.
+
+    The tree does not replace the routes' own matching. It narrows the routes
+    that could possibly match a path, and returns them in their original
+    order, so that `route.matches(scope)` is only computed for those routes.
+    Fully static paths are resolved with a single dictionary lookup.
+    """
+
+    __slots__ = ("_root", "_static_routes", "_unbound_routes")
+
+    def __init__(self, routes: t.Sequence[BaseRoute]) -> None:
+        self._root = _RouteTreeNode()
+        self._static_routes: t.Dict[str, t.List[TIndexedRoute]] = {}
+        # routes that can not be placed on the tree, e.g `Host`
+        self._unbound_routes: t.List[TIndexedRoute] = []
+
+        for index, route in enumerate(routes):
+            self._add_route(index, route)
+
+    def _add_route(self, index: int, route: BaseRoute) -> None:
+        item = (index, route)
+        path_format = getattr(route, "path_format", None)
+        param_convertors: t.Dict[str, Convertor] = (
+            getattr(route, "param_convertors", None) or {}
+        )
+        if not isinstance(path_format, str) or not path_format.startswith("/"):
+            self._unbound_routes.append(item)
+            return
+
+        if "{" not in path_format:
+            self._static_routes.setdefault(path_format, []).append(item)
+            return
+
+        node = self._root
+        for segment in path_format[1:].split("/"):
+            params = PARAM_REGEX.findall(segment)
+            if not params:
+                node = node.get_static_child(segment)
+                continue
+
+            if not all(
+                isinstance(param_convertors.get(param), SINGLE_SEGMENT_CONVERTORS)
+                for param in params
+            ):
+                node.catch_all_routes.append(item)
+                return
+            node = node.get_param_child()
+        node.routes.append(item)
+
+    def get_candidates(self, path: str) -> t.List[BaseRoute]:
+        """
+        Returns routes that may match `path` in the order they were added.
+        """
+        candidates: t.List[TIndexedRoute] = list(self._unbound_routes)
+        candidates.extend(self._static_routes.get(path, ()))
+        if path.startswith("/"):
+            self._collect(self._root, path[1:].split("/"), 0, candidates)
+
+        if len(candidates) > 1:
+            candidates.sort(key=lambda item: item[0])
+        return [route for _, route in candidates]
+
+    def _collect(
+        self,
+        node: _RouteTreeNode,
+        segments: t.List[str],
+        position: int,
+        candidates: t.List[TIndexedRoute],
+    ) -> None:
+        candidates.extend(node.catch_all_routes)
+        if position == len(segments):
+            candidates.extend(node.routes)
+            return
+
+        segment = segments[position]
+        static_child = node.static_children.get(segment)
+        if static_child is not None:
+            self._collect(static_child, segments, position + 1, candidates)
+        if node.param_child is not None and segment:
+            self._collect(node.param_child, segments, position + 1, candidates)
@@ -1,4 +1,3 @@
-import json
 import typing as t
 
 from starlette import status
@@ -8,6 +7,7 @@ from ellar.core.params import WebsocketEndpointArgsModel
 from ellar.exceptions import WebSocketRequestValidationError
 
 if t.TYPE_CHECKING:  # pragma: no cover
+    from ellar.core.codecs import BaseJSONCodec
     from ellar.core.connection import WebSocket
     from ellar.core.context import ExecutionContext
 
@@ -140,9 +140,10 @@ class WebSocketExtraHandler:
             else:
                 text = message["bytes"].decode("utf-8")
 
+            json_codec: "BaseJSONCodec" = websocket.app.config.JSON_CODEC
             try:
-                return json.loads(text)
-            except json.decoder.JSONDecodeError:
+                return json_codec.loads(text)
+            except json_codec.decode_error:
                 await websocket.send_json(
                     dict(
                         code=status.WS_1003_UNSUPPORTED_DATA,
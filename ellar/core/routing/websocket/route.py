@@ -139,6 +139,7 @@ class WebsocketRouteOperation(
             self.endpoint_parameter_model.build_model()
         if name:
             self.name = f"{name}:{self.name}"
+        self.refresh_route_metadata()
 
         if not self._use_extra_handler and self.endpoint_parameter_model.body_resolver:
             raise ImproperConfiguration(
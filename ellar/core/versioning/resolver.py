@@ -34,19 +34,25 @@ class BaseAPIVersioningResolver:
     def raise_exception(self) -> None:
         """raise exception defined by the resolver"""
 
-    def can_activate(self, route_versions: t.Set[t.Union[int, float, str]]) -> bool:
-        self.matched_any_route = True
-
+    def get_route_version(self) -> t.Optional[str]:
+        """
+        Returns the version a route must declare to handle the request.
+        `None` when every route can handle the request regardless of its versions.
+        """
         version = self.resolve()
 
         if str(version) == str(NOT_SET):
-            return True
+            return None
 
-        return (
-            version is not None
-            and version == str(self.default_version)
-            or version in route_versions
-        )
+        if version is not None and version == str(self.default_version):
+            return None
+        return version
+
+    def can_activate(self, route_versions: t.Set[t.Union[int, float, str]]) -> bool:
+        self.matched_any_route = True
+
+        version = self.get_route_version()
+        return version is None or version in route_versions
 
 
 class DefaultAPIVersionResolver(BaseAPIVersioningResolver):
@@ -1,8 +1,11 @@
 from .injector import Container, EllarInjector, RequestServiceProvider
+from .providers import Lazy
 from .scopes import (
+    PooledScope,
     RequestScope,
     SingletonScope,
     TransientScope,
+    pooled_scope,
     request_scope,
     singleton_scope,
     transient_scope,
@@ -19,10 +22,13 @@ __all__ = [
     "Container",
     "RequestServiceProvider",
     "EllarInjector",
+    "Lazy",
     "RequestScope",
+    "PooledScope",
     "SingletonScope",
     "TransientScope",
     "request_scope",
+    "pooled_scope",
     "singleton_scope",
     "transient_scope",
     "ProviderConfig",
@@ -8,6 +8,7 @@ from injector import (
 )
 
 __all__ = [
+    "AsyncResolutionRequired",
     "CallError",
     "CircularDependency",
     "Error",
@@ -16,3 +17,7 @@ __all__ = [
     "UnknownProvider",
     "UnsatisfiedRequirement",
 ]
+
+
+class AsyncResolutionRequired(Error):
+    """Raised when a service provided by an async factory is requested synchronously before it is resolved"""
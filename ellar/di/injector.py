@@ -1,24 +1,40 @@
+import time
 import typing as t
 from collections import OrderedDict, defaultdict
-from inspect import isabstract
+from inspect import isabstract, isawaitable, iscoroutinefunction
 
+import anyio
 from injector import (
     Binder as InjectorBinder,
     Binding,
+    CallError,
     Injector,
     Module as InjectorModule,
+    Scope,
+    SingletonScope as InjectorSingletonScope,
+    get_bindings,
+    inject,
+    reraise,
 )
 
-from ellar.compatible import asynccontextmanager
+from ellar.compatible import ContextVar, asynccontextmanager
 from ellar.constants import MODULE_REF_TYPES
 from ellar.helper import get_name
 from ellar.logger import logger as log
+from ellar.shortcuts import fail_silently
 from ellar.types import T
 
-from .providers import InstanceProvider, Provider
+from .providers import (
+    AsyncFactoryProvider,
+    ClassProvider,
+    InstanceProvider,
+    Lazy,
+    Provider,
+)
 from .scopes import (
     DIScope,
     RequestScope,
+    ScopeContext,
     ScopeDecorator,
     SingletonScope,
     TransientScope,
@@ -29,23 +45,139 @@ if t.TYPE_CHECKING:  # pragma: no cover
     from ellar.core.modules import ModuleBase, ModuleRefBase, ModuleTemplateRef
 
 
+# creates the request service provider of the request being handled
+current_service_provider_factory: ContextVar[
+    t.Optional["RequestServiceProviderFactory"]
+] = ContextVar("current_service_provider_factory", default=None)
+
+
+def get_current_service_provider() -> t.Optional["RequestServiceProvider"]:
+    """Returns the request service provider of the request being handled, if any"""
+    factory = current_service_provider_factory.get()
+    return factory() if factory is not None else None
+
+
+class LazyProvider(Provider):
+    """
+    Provides `Lazy[T]` objects, resolving `T` with the request service provider
+    current on access, when available.
+    Resolved instances are cached in that request context, so a `Lazy` held by a
+    singleton resolves request scoped services again for every request
+    """
+
+    def __init__(self, interface: t.Type) -> None:
+        self._interface = interface
+
+    def get(self, injector: Injector) -> Lazy:
+        def resolve(interface: t.Type[T]) -> T:
+            service_provider = get_current_service_provider() or injector
+            return service_provider.get(interface)
+
+        def get_context() -> t.Optional[ScopeContext]:
+            service_provider = get_current_service_provider()
+            return service_provider.context if service_provider is not None else None
+
+        return Lazy(self._interface, resolve, get_context)
+
+
+class PlannedClassProvider(ClassProvider):
+    """
+    ClassProvider with the dependencies of the class `__init__` computed once,
+    instead of inspecting `__init__` signature for every instance
+    """
+
+    def __init__(self, cls: t.Type[T], dependencies: t.Dict[str, t.Type]) -> None:
+        super().__init__(cls)
+        self._dependencies = dependencies
+
+    def get(self, injector: Injector) -> T:
+        kwargs: t.Dict[str, t.Any] = {}
+        if self._dependencies:
+            kwargs = injector.args_to_inject(
+                function=self._cls.__init__,
+                bindings=self._dependencies,
+                owner_key=self._cls,
+            )
+        try:
+            return self._cls(**kwargs)
+        except TypeError as e:
+            # same as `Injector.create_object`, only errors of the call itself are wrapped
+            reraise(e, CallError(None, self._cls, (), kwargs, e, injector._stack))
+            raise
+
+
+class ResolutionPlan(t.NamedTuple):
+    binding: Binding
+    # scope instance the binding is resolved in
+    scope: DIScope
+    provider: Provider
+
+
+TRequestContextTemplate = t.Mapping[t.Type, t.Callable[[t.Any], t.Any]]
+
+
 class RequestServiceProvider(InjectorBinder):
-    __slots__ = ("_bindings", "_log_prefix", "_context")
+    """
+    Request overlay on the application container.
+    Services in `context_template` are produced from `context_source` when requested,
+    so no binding is created per request for them.
+    """
+
+    # InjectorBinder declares no __slots__, instances still get a __dict__
+    __slots__ = (
+        "_bindings",
+        "_log_prefix",
+        "_context",
+        "_context_template",
+        "_context_source",
+    )
+
+    parent: "Container"
 
-    def __init__(self, container: "Container", auto_bind: bool = False) -> None:
+    def __init__(
+        self,
+        container: "Container",
+        auto_bind: bool = False,
+        context_template: t.Optional[TRequestContextTemplate] = None,
+        context_source: t.Any = None,
+    ) -> None:
         super(RequestServiceProvider, self).__init__(
             injector=container.injector, parent=container, auto_bind=auto_bind
         )
-        self._context: t.Dict = {}
+        self._context = ScopeContext()
         self._log_prefix = container.injector._log_prefix
+        self._context_template = context_template or {}
+        self._context_source = context_source
+
+    @property
+    def context(self) -> ScopeContext:
+        """Services cached for the request"""
+        return self._context
 
     def get(self, interface: t.Type[T]) -> T:
+        if interface not in self._bindings:
+            factory = self._context_template.get(interface)
+            if factory is not None:
+                return t.cast(T, factory(self._context_source))
+
+            plan = self.parent.get_resolution_plan(interface)
+            if plan is not None:
+                return t.cast(
+                    T,
+                    plan.scope.get(interface, plan.provider, context=self._context).get(
+                        self.injector
+                    ),
+                )
+
         binding, binder = self.get_binding(interface)
         scope = binding.scope
         if isinstance(scope, ScopeDecorator):
             scope = scope.scope
         # Fetch the corresponding Scope instance from the Binder.
-        scope_binding, _ = binder.get_binding(scope)
+        # Scopes are bound on the container, so they are not rebound for every request
+        scope_binding, _ = (binder if binder is not self else self.parent).get_binding(
+            scope
+        )
         scope_instance = t.cast(DIScope, scope_binding.provider.get(self))
 
         log.debug(
@@ -61,6 +193,16 @@ class RequestServiceProvider(InjectorBinder):
         log.debug("%s -> %r", self._log_prefix, result)
         return t.cast(T, result)
 
+    async def get_async(self, interface: t.Type[T]) -> T:
+        """Resolves `interface`, awaiting async factory providers"""
+        if interface not in self._bindings and interface not in self._context_template:
+            plan = self.parent.get_resolution_plan(interface)
+            if plan is not None and isinstance(plan.scope, DIScope):
+                return await plan.scope.get_async(
+                    interface, plan.provider, context=self._context
+                )
+        return self.get(interface)
+
     def update_context(self, interface: t.Type[T], value: T) -> None:
         assert not isinstance(value, type), f"value must be an object of {interface}"
         _context = {
@@ -71,16 +213,122 @@ class RequestServiceProvider(InjectorBinder):
         self._bindings.update(_context)
 
     def dispose(self) -> None:
+        self._context.dispose()
         del self._context
         del self.parent
         del self.injector
+        self._context_source = None
+
+
+class RequestServiceProviderFactory:
+    """
+    Creates the `RequestServiceProvider` of a request on first call,
+    so requests that resolve no service do not create one
+    """
+
+    __slots__ = (
+        "_container",
+        "_context_template",
+        "_context_source",
+        "_request_provider",
+    )
+
+    def __init__(
+        self,
+        container: "Container",
+        context_template: t.Optional[TRequestContextTemplate] = None,
+        context_source: t.Any = None,
+    ) -> None:
+        self._container = container
+        self._context_template = context_template
+        self._context_source = context_source
+        self._request_provider: t.Optional[RequestServiceProvider] = None
+
+    @property
+    def is_created(self) -> bool:
+        return self._request_provider is not None
+
+    def __call__(self) -> RequestServiceProvider:
+        if self._request_provider is None:
+            self._request_provider = RequestServiceProvider(
+                self._container,
+                context_template=self._context_template,
+                context_source=self._context_source,
+            )
+        return self._request_provider
+
+    def dispose(self) -> None:
+        if self._request_provider is not None:
+            self._request_provider.dispose()
+            self._request_provider = None
+        self._context_source = None
 
 
 class Container(InjectorBinder):
-    __slots__ = ("injector", "_auto_bind", "_bindings", "parent")
+    __slots__ = ("injector", "_auto_bind", "_bindings", "parent", "_plans")
 
     injector: "EllarInjector"
 
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        self._plans: t.Dict[t.Type, ResolutionPlan] = {}
+        super().__init__(*args, **kwargs)
+
+    def bind(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().bind(*args, **kwargs)
+        self._plans.clear()
+
+    def get_binding(self, interface: t.Type) -> t.Tuple[Binding, InjectorBinder]:
+        if getattr(interface, "__origin__", None) is Lazy:
+            binding = self._bindings.get(interface)
+            if binding is None:
+                binding = Binding(
+                    interface, LazyProvider(interface.__args__[0]), TransientScope
+                )
+                self._bindings[interface] = binding
+            return binding, self
+        return super().get_binding(interface)
+
+    def create_resolution_plan(self, interface: t.Type) -> ResolutionPlan:
+        binding, binder = self._get_binding(interface)
+        scope = binding.scope
+        if isinstance(scope, ScopeDecorator):
+            scope = scope.scope
+        scope_binding, _ = binder.get_binding(scope)
+        scope_instance = t.cast(DIScope, scope_binding.provider.get(self.injector))
+
+        provider = binding.provider
+        if type(provider) is ClassProvider:
+            cls = getattr(provider, "_cls")
+            try:
+                dependencies = get_bindings(cls.__init__)
+            except Exception:  # pragma: no cover
+                # unresolved type hints, left to the injector
+                dependencies = None
+            if dependencies is not None:
+                provider = PlannedClassProvider(cls, dependencies)
+        return ResolutionPlan(binding=binding, scope=scope_instance, provider=provider)
+
+    def get_resolution_plan(self, interface: t.Type) -> t.Optional[ResolutionPlan]:
+        """
+        Returns the cached resolution plan of a bound interface.
+        Returns None for interfaces without binding
+        """
+        try:
+            return self._plans[interface]
+        except KeyError:
+            pass
+        try:
+            plan = self.create_resolution_plan(interface)
+        except KeyError:
+            return None
+        self._plans[interface] = plan
+        return plan
+
+    def compile_resolution_plans(self) -> None:
+        """Computes the resolution plan of every registered binding"""
+        for interface in list(self._bindings):
+            self.get_resolution_plan(interface)
+
     @t.no_type_check
     def create_binding(
         self,
@@ -96,6 +344,7 @@ class Container(InjectorBinder):
 
     def register_binding(self, interface: t.Type, binding: Binding) -> None:
         self._bindings[interface] = binding
+        self._plans.clear()
 
     @t.no_type_check
     def register(
@@ -120,6 +369,25 @@ class Container(InjectorBinder):
             _scope = scope.scope
         self.register_binding(base_type, Binding(base_type, provider, _scope))
 
+    def register_async_factory(
+        self,
+        base_type: t.Type[T],
+        factory: t.Callable[..., t.Awaitable[T]],
+        scope: t.Optional[t.Union[t.Type[DIScope], ScopeDecorator]] = None,
+    ) -> None:
+        """
+        Registers an async factory for `base_type`, it's instances are resolved with `get_async`.
+        The factory arguments annotated with `@inject` or `Inject` are resolved from the container
+        """
+        assert iscoroutinefunction(factory), "factory must be an async function"
+        fail_silently(inject, constructor_or_class=factory)
+        _scope: t.Any = scope or get_scope(base_type) or SingletonScope
+        if isinstance(_scope, ScopeDecorator):
+            _scope = _scope.scope
+        self.register_binding(
+            base_type, Binding(base_type, AsyncFactoryProvider(factory), _scope)
+        )
+
     def register_instance(self, instance: T, concrete_type: t.Type[T] = None) -> None:
         assert not isinstance(instance, type)
         _concrete_type = instance.__class__ if not concrete_type else concrete_type
@@ -235,6 +503,17 @@ class EllarInjector(Injector):
         self._modules[MODULE_REF_TYPES.TEMPLATE] = OrderedDict()
         self._modules[MODULE_REF_TYPES.PLAIN] = OrderedDict()
 
+    def get(
+        self,
+        interface: t.Type[T],
+        scope: t.Union[ScopeDecorator, t.Type[Scope], None] = None,
+    ) -> T:
+        plan = self.container.get_resolution_plan(interface) if scope is None else None
+        if plan is None:
+            return super().get(interface, scope=scope)
+        instance: T = plan.scope.get(interface, plan.provider).get(self)
+        return instance
+
     def get_modules(
         self,
     ) -> t.Dict[t.Type["ModuleBase"], "ModuleRefBase"]:
@@ -271,12 +550,120 @@ class EllarInjector(Injector):
     def binder(self, value: t.Any) -> None:
         """Nothing happens"""
 
+    async def get_async(self, interface: t.Type[T]) -> T:
+        """Resolves `interface`, awaiting async factory providers"""
+        plan = self.container.get_resolution_plan(interface)
+        if plan is not None and isinstance(plan.scope, DIScope):
+            return await plan.scope.get_async(interface, plan.provider)
+        return self.get(interface)
+
+    def _get_singleton_dependency_levels(self) -> t.List[t.List[t.Type]]:
+        dependencies: t.Dict[t.Type, t.Set[t.Type]] = {}
+        for interface, binding in list(self.container._bindings.items()):
+            scope = binding.scope
+            if isinstance(scope, ScopeDecorator):
+                scope = scope.scope
+            if not (
+                isinstance(scope, type) and issubclass(scope, InjectorSingletonScope)
+            ) or isinstance(binding.provider, InstanceProvider):
+                continue
+            plan = self.container.get_resolution_plan(interface)
+            provider = plan.provider if plan else binding.provider
+            if isinstance(provider, AsyncFactoryProvider):
+                dependencies[interface] = set(provider.get_dependencies().values())
+            else:
+                dependencies[interface] = set(
+                    getattr(provider, "_dependencies", {}).values()
+                )
+
+        levels: t.List[t.List[t.Type]] = []
+        pending = {
+            interface: {dep for dep in deps if dep in dependencies and dep != interface}
+            for interface, deps in dependencies.items()
+        }
+        while pending:
+            level = [interface for interface, deps in pending.items() if not deps]
+            if not level:
+                # circular dependencies are reported by the injector on `get`
+                level = list(pending)
+            for interface in level:
+                del pending[interface]
+            for deps in pending.values():
+                deps.difference_update(level)
+            levels.append(level)
+        return levels
+
+    async def warm_up_singletons(
+        self, run_sync_in_threads: bool = False
+    ) -> t.Dict[t.Type, float]:
+        """
+        Instantiates all singleton services and awaits their `on_init` hook, when defined.
+        A service is initialized after the singletons it depends on,
+        independent services are initialized concurrently.
+        Synchronous constructors run on the event loop one after the other,
+        unless `run_sync_in_threads` builds them in worker threads.
+        Returns the initialization time of each service in seconds
+        """
+        init_times: t.Dict[t.Type, float] = {}
+        initialized: t.Set[int] = set()
+
+        async def _init_service(interface: t.Type) -> None:
+            start = time.perf_counter()
+            plan = self.container.get_resolution_plan(interface)
+            if run_sync_in_threads and plan and isinstance(plan.scope, SingletonScope):
+                instance = await plan.scope.get_async(
+                    interface, plan.provider, run_sync_in_thread=True
+                )
+            else:
+                instance = await self.get_async(interface)
+            on_init = getattr(instance, "on_init", None)
+            if id(instance) not in initialized and callable(on_init):
+                initialized.add(id(instance))
+                result = on_init()
+                if isawaitable(result):
+                    await result
+            init_times[interface] = time.perf_counter() - start
+            log.info(
+                "%s initialized in %.2fms",
+                get_name(interface),
+                init_times[interface] * 1000,
+            )
+
+        for level in self._get_singleton_dependency_levels():
+            async with anyio.create_task_group() as tg:
+                for interface in level:
+                    tg.start_soon(_init_service, interface)
+        return init_times
+
     @asynccontextmanager
     async def create_request_service_provider(
         self,
+        context_template: t.Optional[TRequestContextTemplate] = None,
+        context_source: t.Any = None,
     ) -> t.AsyncGenerator[RequestServiceProvider, None]:
-        request_provider = RequestServiceProvider(self.container)
+        async with self.create_request_service_provider_factory(
+            context_template=context_template, context_source=context_source
+        ) as request_provider_factory:
+            yield request_provider_factory()
+
+    @asynccontextmanager
+    async def create_request_service_provider_factory(
+        self,
+        context_template: t.Optional[TRequestContextTemplate] = None,
+        context_source: t.Any = None,
+    ) -> t.AsyncGenerator[RequestServiceProviderFactory, None]:
+        """
+        Sets up the request service provider of a request, created on first use.
+        The provider is disposed, if it was created, when the context exits
+        """
+        request_provider_factory = RequestServiceProviderFactory(
+            self.container,
+            context_template=context_template,
+            context_source=context_source,
+        )
+        token = current_service_provider_factory.set(request_provider_factory)
         try:
-            yield request_provider
+            yield request_provider_factory
         finally:
-            request_provider.dispose()
+            current_service_provider_factory.reset(token)
+            request_provider_factory.dispose()
@@ -6,12 +6,17 @@ from injector import (
     InstanceProvider as InstanceProvider,
     Provider as Provider,
     UnknownProvider as UnknownProvider,
+    get_bindings,
     provider as provider_decorator,
 )
 
+from .exceptions import AsyncResolutionRequired
+
 if t.TYPE_CHECKING:  # pragma: no cover
     from injector import Injector
 
+    from .injector import EllarInjector
+
 T = t.TypeVar("T")
 
 __all__ = [
@@ -22,6 +27,8 @@ __all__ = [
     "Provider",
     "provider_decorator",
     "ModuleProvider",
+    "AsyncFactoryProvider",
+    "Lazy",
 ]
 
 
@@ -32,3 +39,83 @@ class ModuleProvider(ClassProvider):
 
     def get(self, injector: "Injector") -> T:
         return injector.create_object(self._cls, additional_kwargs=self._init_kwargs)
+
+
+class AsyncFactoryProvider(Provider):
+    """
+    Provides instances from an async factory.
+    Instances are resolved with `get_async` and cached by the binding scope
+    """
+
+    def __init__(self, factory: t.Callable[..., t.Awaitable[T]]) -> None:
+        self._factory = factory
+
+    def get(self, injector: "Injector") -> T:
+        raise AsyncResolutionRequired(
+            f"{self._factory} is an async factory, its service must be resolved with `get_async`"
+        )
+
+    def get_dependencies(self) -> t.Dict[str, t.Type]:
+        """Services injected into the factory arguments, keyed by argument name"""
+        return get_bindings(self._factory)
+
+    async def get_async(self, injector: "EllarInjector") -> T:
+        kwargs = {}
+        for name, interface in self.get_dependencies().items():
+            kwargs[name] = await injector.get_async(interface)
+        return await self._factory(**kwargs)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._factory!r})"
+
+
+class Lazy(t.Generic[T]):
+    """
+    Dependency resolved on first access.
+    Annotate an injected argument with `Lazy[Service]`, then call `get()`
+    or access `Service` attributes directly on the lazy object.
+
+    The resolved instance is not kept on the lazy object, it is cached in the
+    `get_context()` mapping, the services context of the current request.
+    Without a context, the service is resolved on every `get()`.
+    """
+
+    __slots__ = ("_interface", "_resolve", "_get_context")
+
+    def __init__(
+        self,
+        interface: t.Type[T],
+        resolve: t.Callable[[t.Type[T]], T],
+        get_context: t.Optional[
+            t.Callable[[], t.Optional[t.MutableMapping[t.Any, Provider]]]
+        ] = None,
+    ):
+        self._interface = interface
+        self._resolve = resolve
+        self._get_context = get_context
+
+    def _context(self) -> t.Optional[t.MutableMapping[t.Any, Provider]]:
+        return self._get_context() if self._get_context is not None else None
+
+    @property
+    def is_resolved(self) -> bool:
+        context = self._context()
+        return context is not None and self in context
+
+    def get(self) -> T:
+        context = self._context()
+        if context is None:
+            return self._resolve(self._interface)
+        try:
+            provider = context[self]
+        except KeyError:
+            provider = context[self] = InstanceProvider(self._resolve(self._interface))
+        return t.cast(T, provider.get(None))  # type: ignore
+
+    def __getattr__(self, name: str) -> t.Any:
+        if name in Lazy.__slots__:
+            raise AttributeError(name)
+        return getattr(self.get(), name)
+
+    def __repr__(self) -> str:
+        return f"Lazy[{getattr(self._interface, '__name__', self._interface)}]"
@@ -1,6 +1,7 @@
 import typing as t
 from abc import abstractmethod
 
+import anyio
 from injector import (
     NoScope as InjectorNoScope,
     Scope as InjectorScope,
@@ -8,9 +9,115 @@ from injector import (
     SingletonScope as InjectorSingletonScope,
 )
 
+from ellar.logger import logger
 from ellar.types import T
 
-from .providers import InstanceProvider, Provider
+from .exceptions import AsyncResolutionRequired
+from .providers import AsyncFactoryProvider, InstanceProvider, Provider
+
+# returned to waiters when the instance creation they waited for was cancelled
+_RETRY_RESOLUTION = object()
+
+
+class _PendingProvider(Provider):
+    """Placeholder cached by a scope while an async factory instance is being created"""
+
+    def __init__(self) -> None:
+        self._event = anyio.Event()
+        self._instance: t.Any = None
+        self._error: t.Optional[Exception] = None
+
+    def get(self, injector: t.Any) -> t.Any:
+        raise AsyncResolutionRequired(
+            "Service is being resolved asynchronously, use `get_async`"
+        )
+
+    def set_result(
+        self, instance: t.Any = None, error: t.Optional[Exception] = None
+    ) -> None:
+        self._instance = instance
+        self._error = error
+        self._event.set()
+
+    def cancel(self) -> None:
+        """Wakes waiters up, so they retry the instance creation"""
+        self.set_result(_RETRY_RESOLUTION)
+
+    async def wait(self) -> t.Any:
+        await self._event.wait()
+        if self._error is not None:
+            raise self._error
+        return self._instance
+
+
+async def get_provider_instance(
+    provider: Provider[T], injector: t.Any, run_sync_in_thread: bool = False
+) -> T:
+    if isinstance(provider, AsyncFactoryProvider):
+        return t.cast(T, await provider.get_async(injector))
+    if run_sync_in_thread:
+        return t.cast(T, await anyio.to_thread.run_sync(provider.get, injector))
+    return provider.get(injector)
+
+
+async def get_cached_instance(
+    context: t.Dict[type, Provider],
+    key: t.Type[T],
+    provider: Provider[T],
+    injector: t.Any,
+    run_sync_in_thread: bool = False,
+) -> T:
+    """
+    Resolves `key` instance once for `context`.
+    Concurrent resolutions of the same key wait for the first one.
+    Its errors are shared with them, but not its cancellation: they retry instead
+    """
+    while True:
+        cached = context.get(key)
+        if isinstance(cached, _PendingProvider):
+            instance = await cached.wait()
+            if instance is _RETRY_RESOLUTION:
+                continue
+            return t.cast(T, instance)
+        if cached is not None:
+            return t.cast(T, cached.get(injector))
+
+        pending = _PendingProvider()
+        context[key] = pending
+        try:
+            instance = await get_provider_instance(
+                provider, injector, run_sync_in_thread=run_sync_in_thread
+            )
+        except Exception as ex:
+            del context[key]
+            pending.set_result(error=ex)
+            raise
+        except BaseException:
+            del context[key]
+            pending.cancel()
+            raise
+        context[key] = InstanceProvider(instance)
+        pending.set_result(instance)
+        return t.cast(T, instance)
+
+
+class ScopeContext(dict):
+    """Services cached for a request, with callbacks run when the request is disposed"""
+
+    __slots__ = ("_dispose_callbacks",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._dispose_callbacks: t.List[t.Callable[[], None]] = []
+
+    def add_dispose_callback(self, callback: t.Callable[[], None]) -> None:
+        self._dispose_callbacks.append(callback)
+
+    def dispose(self) -> None:
+        callbacks, self._dispose_callbacks = self._dispose_callbacks, []
+        for callback in reversed(callbacks):
+            callback()
+        self.clear()
 
 
 class DIScope(InjectorScope):
@@ -30,6 +137,17 @@ class DIScope(InjectorScope):
         """
         raise NotImplementedError  # pragma: no cover
 
+    async def get_async(
+        self,
+        key: t.Type[T],
+        provider: Provider[T],
+        context: t.Optional[t.Dict[type, Provider]] = None,
+    ) -> T:
+        """Resolves an instance of key, awaiting async factory providers"""
+        return await get_provider_instance(
+            self.get(key, provider, context=context), self.injector
+        )
+
 
 class RequestScope(DIScope):
     def get(
@@ -50,6 +168,16 @@ class RequestScope(DIScope):
             context[key] = provider
             return provider
 
+    async def get_async(
+        self,
+        key: t.Type[T],
+        provider: Provider[T],
+        context: t.Optional[t.Dict[type, Provider]] = None,
+    ) -> T:
+        if context is None:
+            return await get_provider_instance(provider, self.injector)
+        return await get_cached_instance(context, key, provider, self.injector)
+
 
 class SingletonScope(InjectorSingletonScope, DIScope):
     def get(
@@ -60,6 +188,22 @@ class SingletonScope(InjectorSingletonScope, DIScope):
     ) -> Provider[T]:
         return super().get(key, provider)
 
+    async def get_async(
+        self,
+        key: t.Type[T],
+        provider: Provider[T],
+        context: t.Optional[t.Dict[type, Provider]] = None,
+        run_sync_in_thread: bool = False,
+    ) -> T:
+        """`run_sync_in_thread` builds instances of synchronous providers in a worker thread"""
+        return await get_cached_instance(
+            self._context,
+            key,
+            provider,
+            self.injector,
+            run_sync_in_thread=run_sync_in_thread,
+        )
+
 
 class TransientScope(InjectorNoScope, DIScope):
     def get(
@@ -71,6 +215,218 @@ class TransientScope(InjectorNoScope, DIScope):
         return provider
 
 
+# handed to a waiter instead of an instance, it may create a pooled instance
+_POOL_CAPACITY = object()
+
+
+class PoolStats(t.NamedTuple):
+    max_size: int
+    # pooled instances created, idle and lent
+    size: int
+    idle: int
+    in_use: int
+    # requests waiting for an instance
+    waiting: int
+    borrowed: int
+    waits: int
+    # instances created beyond max_size, they are discarded when released
+    overflow: int
+
+
+class _Pool:
+    __slots__ = ("idle", "size", "waiters", "borrowed", "waits", "overflow")
+
+    def __init__(self) -> None:
+        self.idle: t.List[t.Any] = []
+        self.size = 0
+        self.waiters: t.List[t.Tuple[anyio.Event, t.List[t.Any]]] = []
+        self.borrowed = 0
+        self.waits = 0
+        self.overflow = 0
+
+
+class PooledScope(DIScope):
+    """
+    Lends an instance from a bounded pool to each request.
+    The instance is returned to the pool when the request service provider is disposed,
+    after calling its `reset` method when defined.
+
+    When the pool is exhausted, `get_async` waits for a released instance if `wait` is True.
+    Otherwise, and always for synchronous resolution, an overflow instance is created.
+    Outside a request, instances are not pooled.
+
+    Use `PooledScope.with_options` for a pool with different options.
+    """
+
+    max_size: int = 10
+    wait: bool = False
+    reset: bool = True
+
+    _pools: t.Dict[t.Type, _Pool]
+
+    @classmethod
+    def with_options(
+        cls, *, max_size: int = 10, wait: bool = False, reset: bool = True
+    ) -> t.Type["PooledScope"]:
+        assert max_size > 0, "max_size must be greater than 0"
+        return t.cast(
+            t.Type["PooledScope"],
+            type(cls.__name__, (cls,), dict(max_size=max_size, wait=wait, reset=reset)),
+        )
+
+    def configure(self) -> None:
+        self._pools = {}
+
+    def get_pool(self, key: t.Type) -> _Pool:
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _Pool()
+        return pool
+
+    def stats(self, key: t.Type) -> PoolStats:
+        pool = self.get_pool(key)
+        return PoolStats(
+            max_size=self.max_size,
+            size=pool.size,
+            idle=len(pool.idle),
+            in_use=pool.size - len(pool.idle),
+            waiting=len(pool.waiters),
+            borrowed=pool.borrowed,
+            waits=pool.waits,
+            overflow=pool.overflow,
+        )
+
+    def _lend(
+        self, context: t.Dict[type, Provider], key: t.Type[T], instance: T, pooled: bool
+    ) -> Provider[T]:
+        instance_provider = InstanceProvider(instance)
+        context[key] = instance_provider
+        self.get_pool(key).borrowed += 1
+        add_dispose_callback = getattr(context, "add_dispose_callback", None)
+        if add_dispose_callback is not None and pooled:
+            add_dispose_callback(lambda: self.release(key, instance))
+        return instance_provider
+
+    def _take_idle(self, pool: _Pool) -> t.Tuple[t.Any, bool]:
+        """Returns an idle instance and whether a pooled instance can be created"""
+        if pool.idle:
+            return pool.idle.pop(), False
+        if pool.size < self.max_size:
+            pool.size += 1
+            return None, True
+        return None, False
+
+    def get(
+        self,
+        key: t.Type[T],
+        provider: Provider[T],
+        context: t.Optional[t.Dict[type, Provider]] = None,
+    ) -> Provider[T]:
+        if context is None:
+            return provider
+        try:
+            return context[key]
+        except KeyError:
+            pass
+
+        pool = self.get_pool(key)
+        instance, create = self._take_idle(pool)
+        if instance is not None:
+            return self._lend(context, key, instance, pooled=True)
+        if not create:
+            pool.overflow += 1
+            return self._lend(context, key, provider.get(self.injector), pooled=False)
+        try:
+            instance = provider.get(self.injector)
+        except BaseException:
+            self._free_capacity(pool)
+            raise
+        return self._lend(context, key, instance, pooled=True)
+
+    async def get_async(
+        self,
+        key: t.Type[T],
+        provider: Provider[T],
+        context: t.Optional[t.Dict[type, Provider]] = None,
+    ) -> T:
+        if context is None:
+            return await get_provider_instance(provider, self.injector)
+        if key in context:
+            return t.cast(T, context[key].get(self.injector))
+
+        pool = self.get_pool(key)
+        instance, create = self._take_idle(pool)
+        if instance is None and not create:
+            if not self.wait:
+                pool.overflow += 1
+                instance = await get_provider_instance(provider, self.injector)
+                return t.cast(
+                    T,
+                    self._lend(context, key, instance, pooled=False).get(self.injector),
+                )
+            instance = await self._wait_for_instance(pool)
+            create = instance is _POOL_CAPACITY
+        if create:
+            try:
+                instance = await get_provider_instance(provider, self.injector)
+            except BaseException:
+                self._free_capacity(pool)
+                raise
+        return t.cast(
+            T, self._lend(context, key, instance, pooled=True).get(self.injector)
+        )
+
+    def _free_capacity(self, pool: _Pool) -> None:
+        """
+        Called when a pooled instance is discarded or could not be created.
+        The capacity is handed to the first waiter, which creates a new instance
+        """
+        if pool.waiters:
+            event, slot = pool.waiters.pop(0)
+            slot.append(_POOL_CAPACITY)
+            event.set()
+            return
+        pool.size -= 1
+
+    async def _wait_for_instance(self, pool: _Pool) -> t.Any:
+        pool.waits += 1
+        event = anyio.Event()
+        slot: t.List[t.Any] = []
+        waiter = (event, slot)
+        pool.waiters.append(waiter)
+        try:
+            await event.wait()
+        except BaseException:
+            if waiter in pool.waiters:
+                pool.waiters.remove(waiter)
+            elif slot and slot[0] is _POOL_CAPACITY:
+                self._free_capacity(pool)
+            elif slot:
+                # instance was handed over while being cancelled
+                pool.idle.append(slot[0])
+            raise
+        return slot[0]
+
+    def release(self, key: t.Type, instance: t.Any) -> None:
+        """Returns a lent instance to the pool"""
+        pool = self.get_pool(key)
+        reset = getattr(instance, "reset", None)
+        if self.reset and callable(reset):
+            try:
+                reset()
+            except Exception as ex:
+                logger.warning(f"Discarding pooled {key} instance, reset failed: {ex}")
+                self._free_capacity(pool)
+                return
+        if pool.waiters:
+            event, slot = pool.waiters.pop(0)
+            slot.append(instance)
+            event.set()
+            return
+        pool.idle.append(instance)
+
+
 transient_scope = ScopeDecorator(TransientScope)
 singleton_scope = ScopeDecorator(SingletonScope)
 request_scope = ScopeDecorator(RequestScope)
+pooled_scope = ScopeDecorator(PooledScope)
@@ -26,23 +26,26 @@ __all__ = (
 
 
 class ProviderConfig(t.Generic[T]):
-    __slots__ = ("base_type", "use_value", "use_class")
+    __slots__ = ("base_type", "use_value", "use_class", "use_factory")
 
     def __init__(
         self,
         base_type: t.Union[t.Type[T], t.Type],
         *,
         use_value: T = None,
-        use_class: t.Type[T] = None
+        use_class: t.Type[T] = None,
+        use_factory: t.Callable[..., t.Awaitable[T]] = None
     ):
-        if use_value and use_class:
+        if len([item for item in (use_value, use_class, use_factory) if item]) > 1:
             raise ImproperConfiguration(
-                "`use_class` and `use_value` can not be used at the same time."
+                "`use_class`, `use_value` and `use_factory` can not be used at the same time."
             )
 
         self.base_type = base_type
         self.use_value = use_value
         self.use_class = use_class
+        # async function creating the service, resolved with `get_async`
+        self.use_factory = use_factory
 
     def register(self, container: "Container") -> None:
         scope = get_scope(self.base_type) or SingletonScope
@@ -55,6 +58,10 @@ class ProviderConfig(t.Generic[T]):
             container.register_singleton(
                 base_type=self.base_type, concrete_type=self.use_value
             )
+        elif self.use_factory:
+            container.register_async_factory(
+                base_type=self.base_type, factory=self.use_factory, scope=scope
+            )
         else:
             container.register(base_type=self.base_type, scope=scope)
 
@@ -0,0 +1,100 @@
+import typing as t
+from collections import OrderedDict
+
+__all__ = ["LRUCache", "LRUCacheInfo"]
+
+K = t.TypeVar("K")
+V = t.TypeVar("V")
+
+
+class LRUCacheInfo(t.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    max_size: int
+    current_size: int
+
+
+class LRUCache(t.Generic[K, V]):
+    """
+    Size bounded mapping dropping its least recently used entries first.
+    `get` returns None for missing keys, so None values are not stored.
+
+    `is_stale` tells whether a stored value can no longer be returned, stale entries
+    are removed on lookup and counted as misses.
+    `on_evict` is called with the key and value of every entry removed from the cache.
+    """
+
+    __slots__ = (
+        "max_size",
+        "hits",
+        "misses",
+        "evictions",
+        "on_evict",
+        "is_stale",
+        "_cache",
+    )
+
+    def __init__(
+        self,
+        max_size: int,
+        on_evict: t.Optional[t.Callable[[K, V], None]] = None,
+        is_stale: t.Optional[t.Callable[[V], bool]] = None,
+    ) -> None:
+        assert max_size > 0, "max_size must be greater than 0"
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.on_evict = on_evict
+        self.is_stale = is_stale
+        self._cache: "OrderedDict[K, V]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._cache
+
+    def get(self, key: K) -> t.Optional[V]:
+        value = self._cache.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        if self.is_stale is not None and self.is_stale(value):
+            self.pop(key)
+            self.misses += 1
+            return None
+
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.max_size:
+            self.pop(next(iter(self._cache)))
+            self.evictions += 1
+
+    def pop(self, key: K) -> None:
+        value = self._cache.pop(key)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def clear(self) -> None:
+        if self.on_evict is None:
+            self._cache.clear()
+            return
+        for key in list(self._cache):
+            self.pop(key)
+
+    def info(self) -> LRUCacheInfo:
+        return LRUCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            max_size=self.max_size,
+            current_size=len(self._cache),
+        )
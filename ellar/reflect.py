@@ -19,13 +19,68 @@ def _get_actual_target(
         return t.cast(t.Union[t.Type, t.Callable], reflect_type)
 
 
-class _Reflect:
-    __slots__ = ("_meta_data",)
+class _MetadataLayer:
+    """
+    Copy-on-write metadata storage.
+    Reads fall through to the parent layer, a target's metadata is copied into
+    this layer the first time it is written.
+    """
 
-    def __init__(self) -> None:
-        self._meta_data: t.MutableMapping[
+    __slots__ = ("_data", "_parent")
+
+    def __init__(self, parent: t.Optional["_MetadataLayer"] = None) -> None:
+        self._data: t.MutableMapping[
             t.Union[t.Type, t.Callable], AttributeDict
         ] = WeakKeyDictionary()
+        self._parent = parent
+
+    def get(self, target: t.Union[t.Type, t.Callable]) -> t.Optional[AttributeDict]:
+        layer: t.Optional[_MetadataLayer] = self
+        while layer is not None:
+            if target in layer._data:
+                return layer._data[target]
+            layer = layer._parent
+        return None
+
+    def get_writable(
+        self, target: t.Union[t.Type, t.Callable], create: bool = False
+    ) -> t.Optional[AttributeDict]:
+        if target in self._data:
+            return self._data[target]
+
+        inherited = self._parent.get(target) if self._parent else None
+        if inherited is None and not create:
+            return None
+        target_metadata = self._data[target] = AttributeDict(inherited or {})
+        return target_metadata
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class _Reflect:
+    __slots__ = ("_meta_data", "_change_listeners")
+
+    def __init__(self) -> None:
+        self._meta_data = _MetadataLayer()
+        self._change_listeners: t.List[
+            t.Callable[[t.Optional[t.Union[t.Type, t.Callable]]], None]
+        ] = []
+
+    def add_change_listener(
+        self, listener: t.Callable[[t.Optional[t.Union[t.Type, t.Callable]]], None]
+    ) -> None:
+        """
+        Registers `listener` to be called with the target whose metadata changed.
+        `None` is passed when all metadata is swapped out, e.g. by `reflect.context()`
+        """
+        self._change_listeners.append(listener)
+
+    def _notify_change(
+        self, target: t.Optional[t.Union[t.Type, t.Callable]] = None
+    ) -> None:
+        for listener in self._change_listeners:
+            listener(target)
 
     def define_metadata(
         self,
@@ -41,7 +96,7 @@ class _Reflect:
         ):
             raise Exception("`target` is not a valid type")
 
-        target_metadata = self._get_or_create_metadata(target, create=True)
+        target_metadata = self._get_writable_metadata(target, create=True)
         if target_metadata is not None:
             target_metadata.setdefault(metadata_key, default_value)
 
@@ -60,14 +115,16 @@ class _Reflect:
                     _meta_values.extend(existing)
                     _meta_values = type(existing)(_meta_values)
                 elif isinstance(existing, dict):
-                    existing.update(dict(metadata_value))
+                    # never update `existing` in place, it may belong to a parent layer
                     _meta_values = type(existing)(existing)
+                    _meta_values.update(dict(metadata_value))
                 else:
                     # if existing item is not a Collection, And we are trying to set same key again,
                     _meta_values = metadata_value
             else:
                 _meta_values = metadata_value
             target_metadata[metadata_key] = _meta_values
+            self._notify_change(_get_actual_target(target))
 
     def metadata(self, metadata_key: str, metadata_value: t.Any) -> t.Any:
         def _wrapper(target: t.Union[t.Type, t.Callable]) -> t.Any:
@@ -109,41 +166,34 @@ class _Reflect:
     def delete_metadata(
         self, metadata_key: str, target: t.Union[t.Type, t.Callable]
     ) -> None:
-        target_metadata = self._get_or_create_metadata(target)
-        if target_metadata and metadata_key in target_metadata:
+        if self.has_metadata(metadata_key, target):
+            target_metadata = t.cast(AttributeDict, self._get_writable_metadata(target))
             target_metadata.pop(metadata_key)
+            self._notify_change(_get_actual_target(target))
 
     def _get_or_create_metadata(
         self, target: t.Union[t.Type, t.Callable], create: bool = False
     ) -> t.Optional[AttributeDict]:
-        _target = _get_actual_target(target)
-        if _target in self._meta_data:
-            return self._meta_data[_target]
-
         if create:
-            self._meta_data[_target] = AttributeDict()
-            return self._meta_data[_target]
-        return None
+            return self._get_writable_metadata(target, create=True)
+        return self._meta_data.get(_get_actual_target(target))
 
-    def _clone_meta_data(
-        self,
-    ) -> t.MutableMapping[t.Union[t.Type, t.Callable], AttributeDict]:
-        _meta_data: t.MutableMapping[
-            t.Union[t.Type, t.Callable], AttributeDict
-        ] = WeakKeyDictionary()
-        for k, v in self._meta_data.items():
-            _meta_data[k] = AttributeDict(v)
-        return _meta_data
+    def _get_writable_metadata(
+        self, target: t.Union[t.Type, t.Callable], create: bool = False
+    ) -> t.Optional[AttributeDict]:
+        return self._meta_data.get_writable(_get_actual_target(target), create=create)
 
     @asynccontextmanager
     async def async_context(self) -> t.AsyncGenerator[None, None]:
         cached_meta_data = self._meta_data
         try:
-            self._meta_data = self._clone_meta_data()
+            self._meta_data = _MetadataLayer(parent=cached_meta_data)
+            self._notify_change()
             yield
         finally:
             self._meta_data.clear()
             self._meta_data = cached_meta_data
+            self._notify_change()
 
     @contextmanager
     def context(
@@ -151,11 +201,13 @@ class _Reflect:
     ) -> t.Generator:
         cached_meta_data = self._meta_data
         try:
-            self._meta_data = self._clone_meta_data()
+            self._meta_data = _MetadataLayer(parent=cached_meta_data)
+            self._notify_change()
             yield
         finally:
             self._meta_data.clear()
             self._meta_data = cached_meta_data
+            self._notify_change()
 
 
 reflect = _Reflect()
@@ -1,6 +1,75 @@
 import typing as t
 
-from ellar.reflect import reflect
+from ellar.helper.lru import LRUCache
+from ellar.reflect import _get_actual_target, reflect
+
+_TTarget = t.Union[t.Type, t.Callable]
+_TCacheKey = t.Tuple[str, str, t.Tuple[_TTarget, ...]]
+
+_NOT_CACHED = object()
+
+
+class _ReflectorCache:
+    """
+    Size bounded LRU cache of Reflector results per (method, metadata_key, targets).
+    Entries are dropped whenever `reflect` changes the metadata of one of their targets.
+    Targets are only referenced by cached entries, so evicted targets can be collected.
+    """
+
+    __slots__ = ("_results", "_keys_by_target")
+
+    def __init__(self, max_size: int) -> None:
+        # results are stored in a 1-tuple, so None results are cached too
+        self._results: LRUCache[_TCacheKey, t.Tuple[t.Any]] = LRUCache(
+            max_size, on_evict=self._on_evict
+        )
+        self._keys_by_target: t.Dict[_TTarget, t.Set[_TCacheKey]] = {}
+
+    def get(self, key: _TCacheKey) -> t.Any:
+        cached = self._results.get(key)
+        return _NOT_CACHED if cached is None else cached[0]
+
+    def set(self, key: _TCacheKey, value: t.Any) -> None:
+        for target in key[2]:
+            self._keys_by_target.setdefault(_get_actual_target(target), set()).add(key)
+        self._results.set(key, (value,))
+
+    def invalidate(self, target: t.Optional[_TTarget] = None) -> None:
+        if target is None:
+            self._results.clear()
+            return
+
+        for key in list(self._keys_by_target.get(target, ())):
+            self._results.pop(key)
+
+    def _on_evict(self, key: _TCacheKey, value: t.Tuple[t.Any]) -> None:
+        for target in key[2]:
+            target = _get_actual_target(target)
+            keys = self._keys_by_target.get(target)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_target[target]
+
+
+_cache = _ReflectorCache(max_size=1024)
+reflect.add_change_listener(_cache.invalidate)
+
+
+def _copy(value: t.Any) -> t.Any:
+    if isinstance(value, (list, set, tuple, dict)):
+        return type(value)(value)
+    return value
+
+
+def _merge(left: t.Any, right: t.Any) -> t.Any:
+    if isinstance(left, (list, tuple, set)):
+        return list(left) + (
+            list(right) if isinstance(right, (list, tuple, set)) else [right]
+        )
+    if isinstance(left, dict) and isinstance(right, dict):
+        return dict(left, **right)
+    return [left, right]
 
 
 class Reflector:
@@ -12,14 +81,51 @@ class Reflector:
     def get_all(
         self, metadata_key: str, *targets: t.Union[t.Type, t.Callable]
     ) -> t.List[t.Any]:
-        pass
+        """Returns `metadata_key` value of each target, in order"""
+        key = ("get_all", metadata_key, targets)
+        result = _cache.get(key)
+        if result is _NOT_CACHED:
+            result = [reflect.get_metadata(metadata_key, target) for target in targets]
+            _cache.set(key, result)
+        return [_copy(item) for item in result]
 
     def get_all_and_merge(
         self, metadata_key: str, *targets: t.Union[t.Type, t.Callable]
     ) -> t.List[t.Any]:
-        pass
+        """
+        Merges `metadata_key` values of all targets.
+        Lists are concatenated, dicts are merged and other values are collected into a list.
+        """
+        key = ("get_all_and_merge", metadata_key, targets)
+        result = _cache.get(key)
+        if result is _NOT_CACHED:
+            values = [
+                item
+                for item in self.get_all(metadata_key, *targets)
+                if item is not None
+            ]
+            result = values
+            if values:
+                result = values[0]
+                if not isinstance(result, dict):
+                    # a single value is returned in a list, like merged values
+                    result = _merge([], result)
+                for item in values[1:]:
+                    result = _merge(result, item)
+            _cache.set(key, result)
+        return t.cast(t.List[t.Any], _copy(result))
 
     def get_all_and_override(
         self, metadata_key: str, *targets: t.Union[t.Type, t.Callable]
-    ) -> t.List[t.Any]:
-        pass
+    ) -> t.Any:
+        """Returns the first `metadata_key` value found following the order of targets, or None"""
+        key = ("get_all_and_override", metadata_key, targets)
+        result = _cache.get(key)
+        if result is _NOT_CACHED:
+            result = None
+            for item in self.get_all(metadata_key, *targets):
+                if item is not None:
+                    result = item
+                    break
+            _cache.set(key, result)
+        return _copy(result)
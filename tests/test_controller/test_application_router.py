@@ -0,0 +1,193 @@
+import pytest
+from starlette.routing import Host, Mount, NoMatchFound
+
+from ellar.common import ModuleRouter
+from ellar.core import App, Config, TestClientFactory
+from ellar.core.routing import RouteOperation
+from ellar.core.routing.router import RouteCollection
+from ellar.core.routing.router.match_cache import RouteMatchCache
+from ellar.core.routing.router.route_tree import RouteTree
+from ellar.di import EllarInjector
+
+
+def endpoint():
+    pass
+
+
+def create_route(path, methods=("get",)):
+    return RouteOperation(
+        path=path, methods=list(methods), endpoint=endpoint, response={}
+    )
+
+
+def test_route_tree_static_routes_are_resolved_by_path():
+    routes = [create_route(f"/items/static-{i}") for i in range(100)]
+    tree = RouteTree(routes)
+    assert tree.get_candidates("/items/static-50") == [routes[50]]
+    assert tree.get_candidates("/items/static-100") == []
+
+
+def test_route_tree_keeps_route_order():
+    routes = [
+        create_route("/items/me"),
+        create_route("/items/{item_id:int}"),
+        create_route("/items/{name}"),
+        create_route("/items/{item_id}/detail"),
+    ]
+    tree = RouteTree(routes)
+    assert tree.get_candidates("/items/me") == routes[:3]
+    assert tree.get_candidates("/items/2") == routes[1:3]
+    assert tree.get_candidates("/items/2/detail") == [routes[3]]
+    assert tree.get_candidates("/items/") == []
+    assert tree.get_candidates("/items/2/3/detail") == []
+
+
+def test_route_tree_multi_segment_routes():
+    file_route = create_route("/files/{file_path:path}")
+    mount = Mount("/static", app=endpoint, name="static")
+    host = Host("{subdomain}.example.org", app=endpoint)
+    tree = RouteTree([file_route, mount, host])
+
+    assert tree.get_candidates("/files/a/b/c.txt") == [file_route, host]
+    assert tree.get_candidates("/static/css/main.css") == [mount, host]
+    assert tree.get_candidates("/others") == [host]
+
+
+mr = ModuleRouter("/items")
+
+
+@mr.get("/me")
+def get_me():
+    return dict(item="me")
+
+
+@mr.get("/{item_id:int}")
+def get_item(item_id: int):
+    return dict(item_id=item_id)
+
+
+@mr.get("/{item_id:int}/{file_path:path}")
+def get_item_file(item_id: int, file_path: str):
+    return dict(item_id=item_id, file_path=file_path)
+
+
+@mr.post("/{item_id:int}")
+def create_item(item_id: int):
+    return dict(item_id=item_id)
+
+
+for i in range(200):
+    mr.get(f"/static/{i}", name=f"static_{i}")(get_me)
+
+tm = TestClientFactory.create_test_module(routers=(mr,))
+
+
+def test_application_router_dispatch():
+    client = tm.get_client()
+
+    response = client.get("/items/me")
+    assert response.status_code == 200
+    assert response.json() == dict(item="me")
+
+    response = client.get("/items/199")
+    assert response.json() == dict(item_id=199)
+
+    response = client.get("/items/static/199")
+    assert response.json() == dict(item="me")
+
+    response = client.get("/items/2/some/file.txt")
+    assert response.json() == dict(item_id=2, file_path="some/file.txt")
+
+    response = client.put("/items/2")
+    assert response.status_code == 405
+
+    response = client.get("/items/not-found")
+    assert response.status_code == 404
+
+
+def test_application_router_route_tree_is_rebuilt_on_append():
+    client = tm.get_client()
+    response = client.get("/added")
+    assert response.status_code == 404
+
+    @mr.get("/added")
+    def added():
+        return dict(added=True)
+
+    tm.app.router.append(added)
+    response = client.get("/added")
+    assert response.status_code == 200
+    assert response.json() == dict(added=True)
+
+
+cached_tm = TestClientFactory.create_test_module(routers=(mr,))
+cached_tm.app.router.match_cache = RouteMatchCache(2)
+
+
+def test_application_router_match_cache_is_configurable():
+    app = App(config=Config(ROUTE_MATCH_CACHE_SIZE=10), injector=EllarInjector())
+    assert app.router.match_cache.max_size == 10
+
+
+def test_application_router_match_cache():
+    match_cache = cached_tm.app.router.match_cache
+    assert tm.app.router.match_cache is None
+    assert match_cache.info().max_size == 2
+
+    client = cached_tm.get_client()
+    for _ in range(2):
+        response = client.get("/items/2/some/file.txt")
+        assert response.json() == dict(item_id=2, file_path="some/file.txt")
+    assert match_cache.info()[:2] == (1, 1)
+
+    response = client.post("/items/2")
+    assert response.json() == dict(item_id=2)
+    response = client.put("/items/2")
+    assert response.status_code == 405
+    response = client.get("/items/3")
+    assert response.json() == dict(item_id=3)
+
+    info = match_cache.info()
+    assert info.evictions == 1
+    assert info.current_size == 2
+
+
+def test_application_router_match_cache_is_cleared_on_route_change():
+    client = cached_tm.get_client()
+    client.get("/items/me")
+    assert cached_tm.app.router.match_cache.info().current_size > 0
+
+    @mr.get("/cache-added")
+    def cache_added():
+        return dict(added=True)
+
+    cached_tm.app.router.append(cache_added)
+    response = client.get("/items/me")
+    assert response.json() == dict(item="me")
+    assert cached_tm.app.router.match_cache.info().current_size == 1
+
+
+def test_route_collection_name_index():
+    route = create_route("/items/{item_id:int}")
+    route.name = "get_item"
+    nested = Mount("/nested", routes=[route], name="nested")
+    unnamed = Mount("/unnamed", routes=[Mount("/inner", routes=[route], name="inner")])
+    collection = RouteCollection([route, nested, unnamed])
+
+    assert collection.get_named_routes("get_item") == [route]
+    assert collection.get_named_routes("nested:get_item") == [nested]
+    assert collection.get_named_routes("inner:get_item") == [unnamed]
+    assert collection.get_named_routes("missing") == []
+
+
+def test_application_router_url_path_for():
+    router = tm.app.router
+    assert router.url_path_for("get_item", item_id=2) == "/items/2"
+    assert router.url_path_for("static_199") == "/items/static/199"
+    assert tm.app.url_path_for("get_item_file", item_id=2, file_path="a/b") == (
+        "/items/2/a/b"
+    )
+    with pytest.raises(NoMatchFound):
+        router.url_path_for("get_item", file_path="a/b")
+    with pytest.raises(NoMatchFound):
+        router.url_path_for("missing")
@@ -0,0 +1,104 @@
+import anyio
+import pytest
+
+from ellar.common import Controller, get
+from ellar.core import ControllerBase, TestClientFactory
+from ellar.di import SingletonScope
+
+instances = []
+request_instances = []
+
+
+@Controller("/singleton", scope=SingletonScope)
+class SingletonController(ControllerBase):
+    def __init__(self):
+        instances.append(self)
+
+    @get("/")
+    async def index(self, delay: float):
+        request = self.context.switch_to_request()
+        await anyio.sleep(delay)
+        # context is not overridden by concurrent requests
+        assert self.context.switch_to_request() is request
+        return {"id": id(self), "delay": float(request.query_params["delay"])}
+
+
+@Controller("/request")
+class RequestController(ControllerBase):
+    def __init__(self):
+        request_instances.append(self)
+
+    @get("/")
+    def index(self):
+        return self.context is not None
+
+
+tm = TestClientFactory.create_test_module(
+    controllers=(SingletonController, RequestController)
+)
+client = tm.get_client()
+
+
+def test_singleton_controller_is_created_once():
+    results = []
+
+    async def call(delay):
+        results.append(
+            await anyio.to_thread.run_sync(
+                lambda: client.get("/singleton/", params={"delay": delay}).json()
+            )
+        )
+
+    async def main():
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(call, 0.05)
+            tg.start_soon(call, 0)
+
+    anyio.run(main)
+    assert sorted(result["delay"] for result in results) == [0, 0.05]
+    assert len(instances) == 1
+    assert {result["id"] for result in results} == {id(instances[0])}
+    assert instances[0].context is None
+
+
+def test_request_controller_is_created_per_request():
+    assert client.get("/request/").json() is True
+    assert client.get("/request/").json() is True
+    assert len(request_instances) == 2
+
+
+def test_controller_context_storage():
+    context = object()
+    singleton = SingletonController.__new__(SingletonController)
+    token = singleton.bind_context(context)
+    assert SingletonController._context_var.get() is context
+    assert singleton.context is context
+    singleton.unbind_context(token)
+    assert singleton.context is None
+
+    with pytest.raises(AttributeError, match="bind_context"):
+        singleton.context = context
+
+    request_controller = RequestController.__new__(RequestController)
+    assert RequestController._context_var is None
+    assert request_controller.bind_context(context) is None
+    assert request_controller.context is context
+
+
+def test_controller_context_var_is_kept_per_controller_class():
+    @Controller("/other", scope=SingletonScope)
+    class OtherSingletonController(ControllerBase):
+        pass
+
+    context, other_context = object(), object()
+    singleton = SingletonController.__new__(SingletonController)
+    other = OtherSingletonController.__new__(OtherSingletonController)
+
+    token = singleton.bind_context(context)
+    other_token = other.bind_context(other_context)
+    # a controller calling another one keeps its own context
+    assert singleton.context is context
+    assert other.context is other_context
+    other.unbind_context(other_token)
+    singleton.unbind_context(token)
+    assert singleton.context is None and other.context is None
@@ -1,7 +1,12 @@
 import pytest
+from starlette.routing import Mount
 
-from ellar.constants import OPENAPI_KEY
+from ellar.common import Controller, get
+from ellar.constants import GUARDS_KEY, OPENAPI_KEY, VERSIONING_KEY
+from ellar.core import TestClientFactory
+from ellar.core.guard import GuardCanActivate
 from ellar.core.routing import ModuleRouter
+from ellar.core.versioning import VERSIONING
 from ellar.reflect import reflect
 
 from .sample import router
@@ -96,3 +101,39 @@ def test_flatten_name_module_route_build():
 
     new_router.get_flatten_routes()
     assert "has_name" not in new_router.routes[0].name
+
+
+class DenyGuard(GuardCanActivate):
+    async def can_activate(self, context) -> bool:
+        return context.switch_to_http_connection().query_params.get("allow")
+
+
+@Controller("/flat", version="1", guards=[DenyGuard], tag="flat_tag")
+class FlatController:
+    @get("/items/{item_id:int}")
+    def get_item(self, item_id: int):
+        return dict(item_id=item_id)
+
+
+def test_controller_routes_are_dispatched_without_module_mount():
+    tm = TestClientFactory.create_test_module(controllers=(FlatController,))
+    tm.app.enable_versioning(VERSIONING.URL)
+
+    assert not any(isinstance(route, Mount) for route in tm.app.routes)
+    (route,) = tm.app.routes
+    assert route.path == "/flat/items/{item_id:int}"
+    assert route.name == "flat:get_item"
+    assert reflect.get_metadata(VERSIONING_KEY, route.endpoint) == {"1"}
+    assert reflect.get_metadata(GUARDS_KEY, route.endpoint) == [DenyGuard]
+    assert reflect.get_metadata(OPENAPI_KEY, route.endpoint).tags == ["flat_tag"]
+
+    client = tm.get_client()
+    response = client.get("/v1/flat/items/2")
+    assert response.status_code == 403
+
+    response = client.get("/v1/flat/items/2?allow=true")
+    assert response.status_code == 200
+    assert response.json() == dict(item_id=2)
+
+    response = client.get("/v2/flat/items/2?allow=true")
+    assert response.status_code == 404
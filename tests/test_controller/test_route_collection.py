@@ -188,3 +188,75 @@ def test_module_route_collection_for_same_path_different_method(
     response = client.post("/sample")
     assert response.status_code == 200
     assert response.json() == {"path": "/sample", "methods": ["POST"], "versioning": []}
+
+
+def test_route_collection_version_route_tables():
+    unversioned = MockRouteOperation("/sample", methods=["get"], versions=[])
+    version_1 = MockRouteOperation("/sample", methods=["post"], versions=["1"])
+    version_1_2 = MockRouteOperation("/sample", methods=["put"], versions=["1", "2"])
+    mount = MockMountRouteOperation("/mount")
+    mount.path_format, mount.param_convertors = "/mount/{path}", {}
+
+    routes = RouteCollection([unversioned, version_1, version_1_2, mount])
+    assert routes.get_route_candidates("/sample") == [
+        unversioned,
+        version_1,
+        version_1_2,
+    ]
+    assert routes.get_route_candidates("/sample", "1") == [version_1, version_1_2]
+    assert routes.get_route_candidates("/sample", "2") == [version_1_2]
+    assert routes.get_route_candidates("/sample", "3") == []
+    assert routes.get_route_candidates("/mount/a", "3") == [mount]
+
+
+def test_route_collection_version_route_tables_are_rebuilt_on_change():
+    routes = RouteCollection(
+        [MockRouteOperation("/sample", methods=["get"], versions=["1"])]
+    )
+    assert len(routes.get_route_candidates("/sample", "2")) == 0
+
+    version_2 = MockRouteOperation("/sample", methods=["post"], versions=["2"])
+    routes.append(version_2)
+    assert routes.get_route_candidates("/sample", "2") == [version_2]
+
+
+def test_route_collection_append_keeps_routes_sorted(caplog):
+    paths = ["/c", "/a", "/b/{id}", "/a", "/b", "/a/b"]
+    appended = RouteCollection()
+    for index, path in enumerate(paths):
+        appended.append(
+            MockRouteOperation(path, methods=["get"], versions=[str(index)])
+        )
+    extended = RouteCollection(
+        [
+            MockRouteOperation(path, methods=["get"], versions=[str(index)])
+            for index, path in enumerate(paths)
+        ]
+    )
+    assert [route.path for route in appended] == [route.path for route in extended]
+    assert [route.get_allowed_version() for route in appended] == [
+        route.get_allowed_version() for route in extended
+    ]
+    assert appended[0].path == "/a"
+    assert appended[-1].path == "/c"
+
+    replacement = MockRouteOperation("/a", methods=["get"], versions=["1"])
+    appended.append(replacement)
+    assert len(appended) == len(paths)
+    assert appended[0] is replacement
+    assert "replaces" in caplog.text
+
+
+def test_route_collection_replaces_route_with_stale_sort_key():
+    moved = MockRouteOperation("/m", methods=["get"])
+    routes = RouteCollection([moved, MockRouteOperation("/b", methods=["get"])])
+    # path changed after the route was added, then routes are sorted again
+    moved.path = "/a"
+    routes.extend([])
+    assert [route.path for route in routes] == ["/a", "/b"]
+
+    replacement = MockRouteOperation("/m", methods=["get"])
+    routes.append(replacement)
+    assert len(routes) == 2
+    assert [route.path for route in routes] == ["/b", "/m"]
+    assert routes[1] is replacement
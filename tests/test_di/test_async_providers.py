@@ -0,0 +1,157 @@
+import anyio
+import pytest
+from injector import Inject
+
+from ellar.common import Provide, get
+from ellar.core import TestClientFactory
+from ellar.di import EllarInjector, ProviderConfig
+from ellar.di.exceptions import AsyncResolutionRequired
+from ellar.di.scopes import RequestScope, TransientScope
+from ellar.exceptions import ImproperConfiguration
+
+
+class ConnectionPool:
+    def __init__(self, size: int):
+        self.size = size
+
+
+class Session:
+    def __init__(self, pool: ConnectionPool):
+        self.pool = pool
+
+
+calls = []
+
+
+async def create_pool() -> ConnectionPool:
+    calls.append("pool")
+    await anyio.sleep(0.01)
+    return ConnectionPool(size=10)
+
+
+async def create_session(pool: Inject[ConnectionPool]) -> Session:
+    calls.append("session")
+    return Session(pool)
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    calls.clear()
+    yield
+
+
+@pytest.mark.asyncio
+async def test_async_singleton_shares_in_flight_construction():
+    injector = EllarInjector()
+    injector.container.register_async_factory(ConnectionPool, create_pool)
+
+    with pytest.raises(AsyncResolutionRequired):
+        injector.get(ConnectionPool)
+
+    results = []
+
+    async def resolve():
+        results.append(await injector.get_async(ConnectionPool))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(resolve)
+
+    assert calls == ["pool"]
+    assert results[0] is results[1] is results[2]
+    # once resolved, the instance is available synchronously
+    assert injector.get(ConnectionPool) is results[0]
+
+
+@pytest.mark.asyncio
+async def test_async_request_scoped_factory():
+    injector = EllarInjector()
+    injector.container.register_async_factory(ConnectionPool, create_pool)
+    injector.container.register_async_factory(
+        Session, create_session, scope=RequestScope
+    )
+
+    async with injector.create_request_service_provider() as request_provider:
+        session = await request_provider.get_async(Session)
+        assert await request_provider.get_async(Session) is session
+        assert session.pool is await injector.get_async(ConnectionPool)
+
+    async with injector.create_request_service_provider() as request_provider:
+        assert await request_provider.get_async(Session) is not session
+    assert calls == ["pool", "session", "session"]
+
+
+@pytest.mark.asyncio
+async def test_async_factory_error_is_not_cached():
+    attempts = []
+
+    async def failing_factory() -> ConnectionPool:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("connection refused")
+        return ConnectionPool(size=1)
+
+    injector = EllarInjector()
+    injector.container.register_async_factory(ConnectionPool, failing_factory)
+    with pytest.raises(RuntimeError, match="connection refused"):
+        await injector.get_async(ConnectionPool)
+    assert (await injector.get_async(ConnectionPool)).size == 1
+
+
+@pytest.mark.asyncio
+async def test_async_transient_factory():
+    injector = EllarInjector()
+    injector.container.register_async_factory(
+        ConnectionPool, create_pool, scope=TransientScope
+    )
+    assert await injector.get_async(ConnectionPool) is not await injector.get_async(
+        ConnectionPool
+    )
+
+
+def test_provider_config_use_factory():
+    with pytest.raises(ImproperConfiguration):
+        ProviderConfig(
+            ConnectionPool, use_class=ConnectionPool, use_factory=create_pool
+        )
+
+    @get("/pool")
+    def pool_size(pool: ConnectionPool = Provide()):
+        return pool.size
+
+    tm = TestClientFactory.create_test_module(
+        services=[ProviderConfig(ConnectionPool, use_factory=create_pool)]
+    )
+    tm.app.router.append(pool_size)
+    client = tm.get_client()
+    assert client.get("/pool").json() == 10
+    assert client.get("/pool").json() == 10
+    assert calls == ["pool"]
+
+
+@pytest.mark.asyncio
+async def test_async_factory_cancellation_is_not_shared():
+    async def slow_factory() -> ConnectionPool:
+        calls.append("pool")
+        await anyio.sleep(0.02)
+        return ConnectionPool(size=len(calls))
+
+    injector = EllarInjector()
+    injector.container.register_async_factory(ConnectionPool, slow_factory)
+    results = []
+
+    async def first():
+        with anyio.move_on_after(0.005):
+            await injector.get_async(ConnectionPool)
+
+    async def second():
+        await anyio.sleep(0.001)
+        results.append(await injector.get_async(ConnectionPool))
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(first)
+        tg.start_soon(second)
+
+    # the waiting resolution retried the construction instead of being cancelled
+    assert calls == ["pool", "pool"]
+    assert results[0].size == 2
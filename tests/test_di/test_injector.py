@@ -1,12 +1,20 @@
 import pytest
-from injector import Binder, Injector, UnsatisfiedRequirement
+from injector import (
+    Binder,
+    CallError,
+    CircularDependency,
+    Injector,
+    UnsatisfiedRequirement,
+)
 
 from ellar.common import Module
 from ellar.core import ModuleBase
 from ellar.di import Container, EllarInjector
+from ellar.di.injector import PlannedClassProvider
 from ellar.di.providers import ClassProvider, InstanceProvider
+from ellar.di.scopes import RequestScope
 
-from .examples import Foo, Foo1, Foo2
+from .examples import CircularDependencyType, Foo, Foo1, Foo2
 
 
 def test_container_install_module():
@@ -83,3 +91,71 @@ async def test_request_service_provider():
             injector.get(Foo)
 
     assert_attributes(request_provider, False)
+
+
+@pytest.mark.asyncio
+async def test_request_service_provider_context_template():
+    injector = EllarInjector(auto_bind=False)
+    foo = Foo()
+    context_template = {Foo: lambda source: source, Foo1: lambda source: Foo1()}
+
+    async with injector.create_request_service_provider(
+        context_template=context_template, context_source=foo
+    ) as request_provider:
+        assert request_provider.get(Foo) is foo
+        assert isinstance(request_provider.get(Foo1), Foo1)
+        # template services don't create request bindings
+        assert request_provider._bindings == {}
+
+        foo1 = Foo1()
+        request_provider.update_context(Foo1, foo1)
+        assert request_provider.get(Foo1) is foo1
+        # scopes are bound once on the container
+        assert RequestScope not in request_provider._bindings
+
+        with pytest.raises(UnsatisfiedRequirement):
+            request_provider.get(Foo2)
+
+
+def test_container_resolution_plans():
+    injector = EllarInjector(auto_bind=False)
+    injector.container.register_exact_transient(Foo1)
+    injector.container.register_exact_transient(Foo2)
+    injector.container.compile_resolution_plans()
+
+    plan = injector.container.get_resolution_plan(Foo2)
+    assert isinstance(plan.provider, PlannedClassProvider)
+    assert plan.provider._dependencies == {"one": Foo1}
+
+    foo2 = injector.get(Foo2)
+    assert isinstance(foo2, Foo2) and isinstance(foo2.one, Foo1)
+    assert injector.get(Foo2) is not foo2
+    assert injector.container.get_resolution_plan(Foo) is None
+
+    # plans are invalidated when bindings change
+    foo1 = Foo1()
+    injector.container.register_instance(foo1)
+    assert injector.container.get_resolution_plan(Foo2) is not plan
+    assert injector.get(Foo2).one is foo1
+
+
+def test_resolution_plan_wraps_constructor_call_errors():
+    class NeedsValue:
+        def __init__(self, value):
+            self.value = value
+
+    injector = EllarInjector(auto_bind=False)
+    injector.container.register_exact_transient(NeedsValue)
+    injector.container.compile_resolution_plans()
+
+    plan = injector.container.get_resolution_plan(NeedsValue)
+    assert isinstance(plan.provider, PlannedClassProvider)
+    with pytest.raises(CallError, match="Call to NeedsValue()"):
+        injector.get(NeedsValue)
+
+
+def test_resolution_plan_detects_circular_dependency():
+    injector = EllarInjector()
+    injector.container.register_exact_transient(CircularDependencyType)
+    with pytest.raises(CircularDependency):
+        injector.get(CircularDependencyType)
@@ -0,0 +1,106 @@
+import pytest
+
+from ellar.common import Controller, Provide, get
+from ellar.core import ControllerBase, TestClientFactory
+from ellar.di import EllarInjector, Lazy, injectable
+from ellar.di.scopes import RequestScope, SingletonScope, TransientScope
+
+built = []
+counter = []
+
+
+@injectable(RequestScope)
+class ReportService:
+    def __init__(self):
+        built.append("report")
+
+    def name(self):
+        return "report"
+
+
+@injectable(TransientScope)
+class MailService:
+    def __init__(self):
+        built.append("mail")
+
+
+@Controller("/lazy")
+class LazyController(ControllerBase):
+    def __init__(self, report: Lazy[ReportService], mail: Lazy[MailService]):
+        self.report = report
+        self.mail = mail
+
+    @get("/report")
+    def get_report(self, report: ReportService = Provide()):
+        return {
+            "name": self.report.name(),
+            "same_instance": self.report.get() is report,
+            "mail_resolved": self.mail.is_resolved,
+        }
+
+    @get("/noop")
+    def noop(self):
+        return self.report.is_resolved
+
+
+@injectable(RequestScope)
+class RequestCounter:
+    def __init__(self):
+        counter.append(self)
+        self.value = len(counter)
+
+
+@Controller("/singleton-lazy", scope=SingletonScope)
+class SingletonLazyController(ControllerBase):
+    def __init__(self, request_counter: Lazy[RequestCounter]):
+        self.request_counter = request_counter
+
+    @get("/")
+    def index(self, request_counter: RequestCounter = Provide()):
+        assert self.request_counter.get() is request_counter
+        return self.request_counter.value
+
+
+tm = TestClientFactory.create_test_module(
+    controllers=(LazyController, SingletonLazyController),
+    services=(ReportService, MailService, RequestCounter),
+)
+client = tm.get_client()
+
+
+@pytest.fixture(autouse=True)
+def clear_built():
+    built.clear()
+    yield
+
+
+def test_lazy_dependency_is_resolved_on_first_access():
+    response = client.get("/lazy/report")
+    assert response.json() == {
+        "name": "report",
+        "same_instance": True,
+        "mail_resolved": False,
+    }
+    assert built == ["report"]
+
+
+def test_unused_lazy_dependencies_are_not_built():
+    assert client.get("/lazy/noop").json() is False
+    assert built == []
+
+
+def test_lazy_outside_request():
+    injector = EllarInjector()
+    injector.container.register(MailService)
+    lazy = injector.get(Lazy[MailService])
+    assert isinstance(lazy, Lazy) and not lazy.is_resolved
+    assert isinstance(lazy.get(), MailService)
+    # without a request, nothing is cached and the service scope applies
+    assert lazy.get() is not lazy.get()
+    assert not lazy.is_resolved
+    assert built == ["mail", "mail", "mail"]
+
+
+def test_lazy_on_singleton_controller_resolves_per_request():
+    counter.clear()
+    assert [client.get("/singleton-lazy/").json() for _ in range(3)] == [1, 2, 3]
@@ -2,12 +2,18 @@ import json
 
 import pytest
 
+from ellar.common import get
 from ellar.constants import SCOPE_SERVICE_PROVIDER
+from ellar.core import TestClientFactory
 from ellar.core.connection import HTTPConnection, Request, WebSocket
 from ellar.core.context import IExecutionContext
 from ellar.core.middleware import RequestServiceProviderMiddleware
 from ellar.core.response import Response
 from ellar.di import EllarInjector
+from ellar.di.injector import (
+    RequestServiceProviderFactory,
+    current_service_provider_factory,
+)
 
 from ..injector_module import Configuration, DummyModule
 
@@ -96,3 +102,53 @@ def test_di_middleware_execution_context_initialization(test_client_factory):
     assert response.status_code == 200
     data = response.json()
     assert data["message"] == "execution context work"
+
+
+def test_di_middleware_creates_service_provider_on_first_access(test_client_factory):
+    factories = []
+
+    async def app(scope, receive, send):
+        factory = current_service_provider_factory.get()
+        factories.append(factory)
+        assert not factory.is_created
+        if scope["path"] == "/services":
+            assert SCOPE_SERVICE_PROVIDER in scope
+            assert scope.get(SCOPE_SERVICE_PROVIDER) is factory()
+            assert scope[SCOPE_SERVICE_PROVIDER] is factory()
+            assert factory.is_created
+        await Response(content=b"ok")(scope, receive, send)
+
+    asgi_app = RequestServiceProviderMiddleware(
+        app, debug=False, injector=EllarInjector()
+    )
+    client = test_client_factory(asgi_app)
+    assert client.get("/").text == "ok"
+    assert client.get("/services").text == "ok"
+    # providers are disposed with the request
+    assert [factory.is_created for factory in factories] == [False, False]
+
+
+def test_route_operation_does_not_create_service_provider(monkeypatch):
+    factories = []
+    created = []
+    factory_call = RequestServiceProviderFactory.__call__
+
+    def spy_factory_call(self):
+        created.append(self)
+        return factory_call(self)
+
+    monkeypatch.setattr(RequestServiceProviderFactory, "__call__", spy_factory_call)
+
+    @get("/health")
+    async def health():
+        factories.append(current_service_provider_factory.get())
+        return {"status": "ok"}
+
+    test_module = TestClientFactory.create_test_module()
+    test_module.app.router.append(health)
+    client = test_module.get_client()
+
+    response = client.get("/health")
+    assert response.json() == {"status": "ok"}
+    assert len(factories) == 1 and factories[0] is not None
+    assert created == []
@@ -0,0 +1,116 @@
+import anyio
+import pytest
+
+from ellar.di import EllarInjector, PooledScope, get_scope, injectable
+
+
+@injectable(PooledScope.with_options(max_size=2))
+class Parser:
+    def __init__(self):
+        self.buffer = []
+
+    def reset(self):
+        self.buffer.clear()
+
+
+WaitingPool = PooledScope.with_options(max_size=1, wait=True)
+
+
+@injectable(WaitingPool)
+class Session:
+    pass
+
+
+def get_scope_instance(injector, scope_type):
+    return injector.container.get_binding(scope_type)[0].provider.get(injector)
+
+
+@pytest.mark.asyncio
+async def test_pooled_scope_lends_and_resets_instances():
+    injector = EllarInjector()
+    injector.container.register(Parser)
+
+    async with injector.create_request_service_provider() as request_provider:
+        parser = request_provider.get(Parser)
+        parser.buffer.append("data")
+        # one instance per request
+        assert request_provider.get(Parser) is parser
+
+    scope = get_scope_instance(injector, get_scope(Parser))
+    assert scope.stats(Parser).idle == 1
+    assert parser.buffer == []
+
+    async with injector.create_request_service_provider() as first:
+        assert first.get(Parser) is parser
+        async with injector.create_request_service_provider() as second:
+            other = second.get(Parser)
+            assert other is not parser
+            async with injector.create_request_service_provider() as third:
+                # pool is exhausted, an overflow instance is created
+                assert third.get(Parser) not in (parser, other)
+                stats = scope.stats(Parser)
+                assert stats.in_use == 2
+                assert stats.overflow == 1
+
+    stats = scope.stats(Parser)
+    assert (stats.size, stats.idle, stats.in_use) == (2, 2, 0)
+    assert stats.borrowed == 4
+
+    # outside a request, instances are not pooled
+    assert injector.get(Parser) not in (parser, other)
+
+
+@pytest.mark.asyncio
+async def test_pooled_scope_waits_for_released_instance():
+    injector = EllarInjector()
+    injector.container.register(Session)
+    results = []
+
+    async def use_session(delay):
+        async with injector.create_request_service_provider() as request_provider:
+            session = await request_provider.get_async(Session)
+            results.append(session)
+            await anyio.sleep(delay)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(use_session, 0.02)
+        await anyio.sleep(0.005)
+        tg.start_soon(use_session, 0)
+        await anyio.sleep(0.005)
+        assert get_scope_instance(injector, WaitingPool).stats(Session).waiting == 1
+
+    assert results[0] is results[1]
+    stats = get_scope_instance(injector, WaitingPool).stats(Session)
+    assert (stats.size, stats.waits, stats.waiting) == (1, 1, 0)
+
+
+BrokenPool = PooledScope.with_options(max_size=1, wait=True)
+
+
+@injectable(BrokenPool)
+class BrokenSession:
+    def reset(self):
+        raise RuntimeError("reset failed")
+
+
+@pytest.mark.asyncio
+async def test_pooled_scope_waiter_is_woken_when_reset_fails():
+    injector = EllarInjector()
+    injector.container.register(BrokenSession)
+    results = []
+
+    async def use_session(delay):
+        async with injector.create_request_service_provider() as request_provider:
+            results.append(await request_provider.get_async(BrokenSession))
+            await anyio.sleep(delay)
+
+    with anyio.fail_after(1):
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(use_session, 0.02)
+            await anyio.sleep(0.005)
+            tg.start_soon(use_session, 0)
+
+    # the discarded instance capacity was handed to the waiting request
+    assert results[0] is not results[1]
+    stats = get_scope_instance(injector, BrokenPool).stats(BrokenSession)
+    assert (stats.size, stats.waits, stats.waiting, stats.overflow) == (0, 1, 0, 0)
@@ -0,0 +1,152 @@
+import sys
+import threading
+
+import anyio
+import pytest
+from injector import Inject
+
+from ellar.compatible import asynccontextmanager
+from ellar.core import AppFactory
+from ellar.core.testclient import TestClient
+from ellar.di import EllarInjector, injectable
+from ellar.di.scopes import SingletonScope, TransientScope
+
+# read by AppFactory through `config_module=__name__`
+INJECTOR_WARM_UP_SINGLETONS = True
+
+events = []
+
+
+@injectable
+class Database:
+    def __init__(self):
+        self.connected = False
+
+    async def on_init(self):
+        events.append("database:start")
+        await anyio.sleep(0.01)
+        self.connected = True
+        events.append("database:end")
+
+
+@injectable
+class Cache:
+    async def on_init(self):
+        events.append("cache:start")
+        await anyio.sleep(0.01)
+        events.append("cache:end")
+
+
+@injectable
+class UserRepository:
+    def __init__(self, database: Database):
+        self.database = database
+
+    def on_init(self):
+        assert self.database.connected
+        events.append("repository")
+
+
+@injectable(TransientScope)
+class Transient:
+    def on_init(self):  # pragma: no cover
+        events.append("transient")
+
+
+class Report:
+    def __init__(self, database: Database):
+        self.database = database
+
+
+async def create_report(database: Inject[Database]) -> Report:
+    assert database.connected
+    events.append("report")
+    return Report(database)
+
+
+@pytest.fixture(autouse=True)
+def clear_events():
+    events.clear()
+    yield
+
+
+@pytest.mark.asyncio
+async def test_warm_up_singletons():
+    injector = EllarInjector()
+    for service in (UserRepository, Database, Cache, Transient):
+        injector.container.register(service)
+
+    init_times = await injector.warm_up_singletons()
+
+    assert set(init_times) == {UserRepository, Database, Cache}
+    assert all(value > 0 for value in init_times.values())
+    # independent services are initialized concurrently
+    assert events[:2] == ["database:start", "cache:start"]
+    # dependents are initialized after their dependencies
+    assert events[-1] == "repository"
+    assert injector.get(UserRepository).database is injector.get(Database)
+
+
+def test_warm_up_singletons_on_startup():
+    app = AppFactory.create_app(
+        providers=[Database, Cache, UserRepository], config_module=__name__
+    )
+    with TestClient(app):
+        assert "repository" in events
+        assert app.injector.get(Database).connected
+
+    events.clear()
+    app = AppFactory.create_app(providers=[Database])
+    with TestClient(app):
+        assert events == []
+
+
+@pytest.mark.asyncio
+async def test_warm_up_singletons_orders_async_factory_dependencies():
+    injector = EllarInjector()
+    injector.container.register(Database)
+    injector.container.register_async_factory(Report, create_report)
+
+    await injector.warm_up_singletons()
+    assert events == ["database:start", "database:end", "report"]
+    assert (await injector.get_async(Report)).database is injector.get(Database)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_singletons_in_threads():
+    barrier = threading.Barrier(2, timeout=5)
+    threads = []
+
+    class First:
+        def __init__(self):
+            threads.append(threading.get_ident())
+            # returns once both constructors are running
+            barrier.wait()
+
+    class Second(First):
+        pass
+
+    injector = EllarInjector()
+    injector.container.register(First, scope=SingletonScope)
+    injector.container.register(Second, scope=SingletonScope)
+
+    await injector.warm_up_singletons(run_sync_in_threads=True)
+    assert threading.get_ident() not in threads
+    assert isinstance(injector.get(Second), Second)
+
+
+def test_warm_up_singletons_with_lifespan_handler(monkeypatch):
+    @asynccontextmanager
+    async def lifespan(app):
+        events.append("lifespan")
+        yield
+
+    monkeypatch.setattr(
+        sys.modules[__name__], "DEFAULT_LIFESPAN_HANDLER", lifespan, raising=False
+    )
+    app = AppFactory.create_app(
+        providers=[Database, Cache, UserRepository], config_module=__name__
+    )
+    with TestClient(app):
+        # singletons are ready before the lifespan handler runs
+        assert events[-2:] == ["repository", "lifespan"]
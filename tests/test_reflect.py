@@ -2,6 +2,7 @@ import pytest
 
 from ellar.constants import REFLECT_TYPE
 from ellar.reflect import reflect
+from ellar.services.reflector import _NOT_CACHED, Reflector, _ReflectorCache
 
 
 def test_define_metadata_creates_attribute_dict(random_type):
@@ -147,3 +148,132 @@ async def test_reflect_async_context_works():
 
     assert reflect.has_metadata("defined_key_c", function_new) is False
     assert reflect.has_metadata("defined_key_d", function_new) is False
+
+
+def test_reflector_get_all_merge_and_override():
+    class Controller:
+        def handler(self):
+            pass
+
+    reflector = Reflector()
+    reflect.define_metadata("roles", ["admin"], Controller, default_value=[])
+    reflect.define_metadata("roles", ["user"], Controller.handler, default_value=[])
+    reflect.define_metadata("limits", {"rate": 10}, Controller)
+    reflect.define_metadata("limits", {"burst": 2}, Controller.handler)
+
+    assert reflector.get_all("roles", Controller.handler, Controller) == [
+        ["user"],
+        ["admin"],
+    ]
+    assert reflector.get_all_and_merge("roles", Controller.handler, Controller) == [
+        "user",
+        "admin",
+    ]
+    assert reflector.get_all_and_merge("limits", Controller, Controller.handler) == {
+        "rate": 10,
+        "burst": 2,
+    }
+    assert reflector.get_all_and_merge("missing", Controller) == []
+    reflect.define_metadata("version", "1", Controller)
+    assert reflector.get_all_and_merge("version", Controller) == ["1"]
+    assert reflector.get_all_and_merge("version", Controller.handler, Controller) == [
+        "1"
+    ]
+    assert reflector.get_all_and_override("roles", Controller.handler, Controller) == [
+        "user"
+    ]
+    assert reflector.get_all_and_override("missing", Controller) is None
+
+
+def test_reflector_cache_is_invalidated_by_reflect_changes():
+    class Controller:
+        def handler(self):
+            pass
+
+    reflector = Reflector()
+    reflect.define_metadata("roles", ["admin"], Controller, default_value=[])
+    merged = reflector.get_all_and_merge("roles", Controller.handler, Controller)
+    assert merged == ["admin"]
+
+    # cached results are copies
+    merged.append("user")
+    assert reflector.get_all_and_merge("roles", Controller.handler, Controller) == [
+        "admin"
+    ]
+
+    reflect.define_metadata("roles", ["user"], Controller.handler, default_value=[])
+    assert reflector.get_all_and_merge("roles", Controller.handler, Controller) == [
+        "user",
+        "admin",
+    ]
+
+    with reflect.context():
+        reflect.define_metadata("roles", ["guest"], Controller, default_value=[])
+        assert reflector.get_all_and_override("roles", Controller) == [
+            "guest",
+            "admin",
+        ]
+    assert reflector.get_all_and_override("roles", Controller) == ["admin"]
+
+    reflect.delete_metadata("roles", Controller)
+    assert reflector.get_all_and_merge("roles", Controller.handler, Controller) == [
+        "user"
+    ]
+
+
+def test_reflector_cache_is_bounded():
+    class Controller:
+        pass
+
+    def handler():
+        pass
+
+    cache = _ReflectorCache(max_size=2)
+    cache.set(("get_all", "roles", (Controller,)), 1)
+    cache.set(("get_all", "roles", (handler, Controller)), 2)
+    assert cache.get(("get_all", "roles", (Controller,))) == 1
+    cache.set(("get_all", "limits", (Controller,)), 3)
+    # least recently used entry is evicted with its target index
+    assert cache.get(("get_all", "roles", (handler, Controller))) is _NOT_CACHED
+    assert handler not in cache._keys_by_target
+
+    cache.invalidate(Controller)
+    assert cache._keys_by_target == {}
+    assert len(cache._results) == 0
+
+    # None results are cached
+    cache.set(("get_all_and_override", "roles", (Controller,)), None)
+    assert cache.get(("get_all_and_override", "roles", (Controller,))) is None
+    cache.invalidate()
+    assert cache._keys_by_target == {}
+
+
+def test_reflect_context_is_copy_on_write(random_type):
+    reflect.define_metadata("roles", ["admin"], random_type, default_value=[])
+    reflect.define_metadata("options", {"a": 1}, random_type)
+    reflect.define_metadata("name", "ellar", random_type)
+
+    with reflect.context():
+        # nothing is copied until a target is written to
+        assert reflect.get_metadata("roles", random_type) == ["admin"]
+        assert random_type not in reflect._meta_data._data
+
+        reflect.define_metadata("roles", ["user"], random_type)
+        reflect.define_metadata("options", {"b": 2}, random_type)
+        reflect.delete_metadata("name", random_type)
+
+        with reflect.context():
+            reflect.define_metadata("roles", ["guest"], random_type)
+            assert reflect.get_metadata("roles", random_type) == [
+                "guest",
+                "user",
+                "admin",
+            ]
+
+        assert reflect.get_metadata("roles", random_type) == ["user", "admin"]
+        assert reflect.get_metadata("options", random_type) == {"a": 1, "b": 2}
+        assert reflect.has_metadata("name", random_type) is False
+
+    assert reflect.get_metadata("roles", random_type) == ["admin"]
+    assert reflect.get_metadata("options", random_type) == {"a": 1}
+    assert reflect.get_metadata("name", random_type) == "ellar"
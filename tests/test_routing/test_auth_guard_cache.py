@@ -0,0 +1,149 @@
+import time
+
+import anyio
+import pytest
+
+from ellar.common import get, guards
+from ellar.core import TestClientFactory
+from ellar.core.guard import APIKeyHeader, HttpBearerAuth
+from ellar.core.guard.base import HTTPAuthorizationCredentials
+from ellar.core.guard.cache import AuthResultCache
+
+calls = []
+
+
+class BearerGuard(HttpBearerAuth):
+    auth_cache_ttl = 60
+    auth_cache_negative_ttl = 0.05
+
+    async def authenticate(self, connection, credentials):
+        calls.append(credentials.credentials)
+        if credentials.credentials == "valid":
+            return {"user": "ellar"}
+
+
+class HeaderKeyGuard(APIKeyHeader):
+    parameter_name = "X-API-Key"
+
+    async def authenticate(self, connection, key):
+        calls.append(key)
+        return key == "valid"
+
+
+@get("/bearer")
+@guards(BearerGuard)
+def bearer():
+    return "ok"
+
+
+@get("/key")
+@guards(HeaderKeyGuard)
+def header_key():
+    return "ok"
+
+
+tm = TestClientFactory.create_test_module()
+tm.app.router.extend([bearer, header_key])
+client = tm.get_client()
+
+
+class SlowBearerGuard(HttpBearerAuth):
+    auth_cache_ttl = 60
+
+    async def authenticate(self, connection, credentials):
+        calls.append(credentials.credentials)
+        await anyio.sleep(0.01)
+        return {"user": credentials.credentials}
+
+
+def get_guard(path):
+    (route,) = [route for route in tm.app.routes if route.path == path]
+    (guard,) = route.get_route_guards(tm.app)
+    return guard
+
+
+def setup_function():
+    calls.clear()
+    get_guard("/bearer").clear_auth_cache()
+
+
+def test_bearer_auth_results_are_cached():
+    headers = {"Authorization": "Bearer valid"}
+    for _ in range(3):
+        assert client.get("/bearer", headers=headers).json() == "ok"
+    assert calls == ["valid"]
+
+    guard = get_guard("/bearer")
+    info = guard.get_auth_cache().info()
+    assert (info.hits, info.misses, info.current_size) == (2, 1, 1)
+
+    guard.invalidate_credentials(
+        HTTPAuthorizationCredentials(scheme="Bearer", credentials="valid")
+    )
+    assert client.get("/bearer", headers=headers).json() == "ok"
+    assert calls == ["valid", "valid"]
+
+
+def test_failed_authentication_is_cached_briefly():
+    headers = {"Authorization": "Bearer invalid"}
+    assert client.get("/bearer", headers=headers).status_code == 403
+    assert client.get("/bearer", headers=headers).status_code == 403
+    assert calls == ["invalid"]
+
+    time.sleep(0.06)
+    assert client.get("/bearer", headers=headers).status_code == 403
+    assert calls == ["invalid", "invalid"]
+
+
+def test_auth_cache_is_opt_in():
+    for _ in range(2):
+        assert client.get("/key", headers={"X-API-Key": "valid"}).json() == "ok"
+    assert calls == ["valid", "valid"]
+    assert get_guard("/key").get_auth_cache() is None
+
+
+def test_auth_result_cache_evicts_least_recently_used():
+    evicted = []
+    cache = AuthResultCache(
+        max_size=2, ttl=60, on_evict=lambda key, identity: evicted.append(key)
+    )
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == (True, 1)
+    cache.set("c", 3)
+    assert evicted == ["b"]
+    assert cache.get("b") == (False, None)
+
+    # negative results are not cached without negative ttl
+    cache.set("d", None)
+    assert cache.get("d") == (False, None)
+
+    cache.clear()
+    assert evicted == ["b", "a", "c"]
+    assert cache.info().evictions == 1
+
+
+def test_auth_cache_is_shared_by_guard_instances():
+    assert BearerGuard().get_auth_cache() is get_guard("/bearer").get_auth_cache()
+    # subclasses have their own cache
+    assert SlowBearerGuard.get_auth_cache() is not BearerGuard.get_auth_cache()
+    assert HttpBearerAuth.get_auth_cache() is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_auth_cache_misses_authenticate_once():
+    guard = SlowBearerGuard()
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+    results = []
+
+    async def run():
+        results.append(
+            await guard.run_authentication(guard.authenticate, None, credentials)
+        )
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(run)
+
+    assert calls == ["token"]
+    assert results == [{"user": "token"}] * 3
@@ -0,0 +1,92 @@
+from ellar.common import Body, File, Form, post
+from ellar.core import TestClientFactory
+from ellar.core.datastructures import UploadFile
+
+tm = TestClientFactory.create_test_module()
+
+
+@post("/limited")
+def limited_body(item: dict = Body(max_size=20)):
+    return item
+
+
+@post("/unlimited")
+def unlimited_body(item: dict = Body()):
+    return item
+
+
+@post("/form")
+def limited_form(name: str = Form(max_size=20)):
+    return name
+
+
+@post("/file")
+async def limited_file(file: UploadFile = File(max_size=1000)):
+    return len(await file.read())
+
+
+@post("/multiple")
+def multiple_body(
+    item: dict = Body(max_size=100), other: dict = Body(max_size=30, embed=True)
+):
+    return dict(item=item, other=other)
+
+
+tm.app.router.extend(
+    [limited_body, unlimited_body, limited_form, limited_file, multiple_body]
+)
+client = tm.get_client()
+
+
+def test_body_size_limit_with_content_length():
+    response = client.post("/limited", json={"a": 1})
+    assert response.status_code == 200
+    assert response.json() == {"a": 1}
+
+    response = client.post("/limited", json={"a": "x" * 20})
+    assert response.status_code == 413
+
+
+def test_body_size_limit_while_streaming():
+    def chunks():
+        yield b'{"a": "'
+        yield b"x" * 20
+        yield b'"}'
+
+    response = client.post(
+        "/limited", data=chunks(), headers={"content-type": "application/json"}
+    )
+    assert response.status_code == 413
+
+
+def test_form_and_file_size_limit():
+    response = client.post("/form", data={"name": "ellar"})
+    assert response.status_code == 200
+    response = client.post("/form", data={"name": "x" * 30})
+    assert response.status_code == 413
+
+    response = client.post("/file", files={"file": ("a.txt", b"x" * 10)})
+    assert response.json() == 10
+    response = client.post("/file", files={"file": ("a.txt", b"x" * 2000)})
+    assert response.status_code == 413
+
+
+def test_multiple_body_params_use_smallest_limit():
+    response = client.post("/multiple", json={"item": {}, "other": {"a": "x" * 30}})
+    assert response.status_code == 413
+
+
+def test_global_body_size_limit():
+    tm.app.config.MAX_REQUEST_BODY_SIZE = 10
+    try:
+        response = client.post("/unlimited", json={"a": "x" * 20})
+        assert response.status_code == 413
+
+        # operation limit takes precedence over the global limit
+        response = client.post("/limited", json={"a": "x"})
+        assert response.status_code == 200
+    finally:
+        tm.app.config.MAX_REQUEST_BODY_SIZE = None
+
+    response = client.post("/unlimited", json={"a": "x" * 20})
+    assert response.status_code == 200
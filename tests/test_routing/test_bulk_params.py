@@ -0,0 +1,113 @@
+import pytest
+from pydantic import BaseModel, Field
+
+from ellar.common import Header, Query, get
+from ellar.constants import OPERATION_HANDLER_KEY
+from ellar.core import TestClientFactory
+from ellar.core.params import params
+from ellar.core.params.resolvers import BulkParameterResolver
+from ellar.reflect import reflect
+
+tm = TestClientFactory.create_test_module()
+
+
+class SearchFilter(BaseModel):
+    name: str
+    page: int = 1
+    size: int = Field(10, alias="per_page")
+
+
+class TokenHeaders(BaseModel):
+    x_token: int
+    x_scope: str = "read"
+
+
+@get("/search")
+def search(filters: SearchFilter = Query()):
+    return filters.dict()
+
+
+@get("/headers")
+def headers(data: TokenHeaders = Header()):
+    return data.dict()
+
+
+class PerFieldBulkParameterResolver(BulkParameterResolver):
+    def create_accessor(self):
+        # resolves each field on its own
+        return None
+
+
+class PerFieldQuery(params.Query):
+    bulk_resolver = PerFieldBulkParameterResolver
+
+
+class PerFieldHeader(params.Header):
+    bulk_resolver = PerFieldBulkParameterResolver
+
+
+@get("/per-field/search")
+def per_field_search(filters: SearchFilter = PerFieldQuery(...)):
+    return filters.dict()
+
+
+@get("/per-field/headers")
+def per_field_headers(data: TokenHeaders = PerFieldHeader(...)):
+    return data.dict()
+
+
+tm.app.router.extend([search, headers, per_field_search, per_field_headers])
+client = tm.get_client()
+
+
+def get_bulk_resolver(endpoint):
+    operation = reflect.get_metadata(OPERATION_HANDLER_KEY, endpoint)
+    for resolver in operation.endpoint_parameter_model.get_all_models():
+        if isinstance(resolver, BulkParameterResolver):
+            return resolver
+
+
+@pytest.fixture(params=["", "/per-field"], ids=["single_pass", "per_field"])
+def prefix(request):
+    return request.param
+
+
+def test_single_pass_accessor_is_created():
+    assert get_bulk_resolver(search)._single_pass_accessor is not None
+    assert get_bulk_resolver(headers)._single_pass_accessor is not None
+    assert get_bulk_resolver(per_field_search)._single_pass_accessor is None
+    assert get_bulk_resolver(per_field_headers)._single_pass_accessor is None
+
+
+def test_bulk_query_values(prefix):
+    response = client.get(f"{prefix}/search?name=ellar&per_page=5")
+    assert response.json() == {"name": "ellar", "page": 1, "size": 5}
+
+
+def test_bulk_query_errors():
+    response = client.get("/search?per_page=a&page=b")
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [
+        ["query", "name"],
+        ["query", "page"],
+        ["query", "per_page"],
+    ]
+
+
+def test_per_field_bulk_query_errors():
+    # fields are validated before the model, the model is not validated with invalid fields
+    response = client.get("/per-field/search?per_page=a&page=b")
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [
+        ["query", "page"],
+        ["query", "per_page"],
+    ]
+
+
+def test_bulk_header_values_and_errors(prefix):
+    response = client.get(f"{prefix}/headers", headers={"x-token": "3"})
+    assert response.json() == {"x_token": 3, "x_scope": "read"}
+
+    response = client.get(f"{prefix}/headers", headers={"x-token": "a"})
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["header", "x-token"]
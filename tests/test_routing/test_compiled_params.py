@@ -0,0 +1,191 @@
+from datetime import datetime
+from enum import Enum, IntEnum
+from typing import Any, List, Union
+from uuid import UUID
+
+import pytest
+
+from ellar.common import Cookie, Header, Provide, Query, get
+from ellar.constants import OPERATION_HANDLER_KEY
+from ellar.core import TestClientFactory
+from ellar.core.connection import Request
+from ellar.core.context import IExecutionContext
+from ellar.core.params.args import get_parameter_field
+from ellar.core.params.helpers import get_default_factory
+from ellar.core.params.resolvers import QueryParameterResolver
+from ellar.helper.modelfield import create_model_field
+from ellar.reflect import reflect
+
+tm = TestClientFactory.create_test_module()
+
+
+@get("/items/{item_id:int}")
+def read_item(
+    item_id: int,
+    request: Request,
+    q: int = Query(),
+    x_token: int = Header(),
+    session: str = Cookie("anonymous"),
+    ctx: IExecutionContext = Provide(),
+):
+    return {
+        "item_id": item_id,
+        "q": q,
+        "x_token": x_token,
+        "session": session,
+        "has_request": isinstance(request, Request),
+        "has_context": isinstance(ctx, IExecutionContext),
+    }
+
+
+tm.app.router.append(read_item)
+client = tm.get_client()
+
+
+def test_route_models_are_compiled_to_accessors():
+    operation = reflect.get_metadata(OPERATION_HANDLER_KEY, read_item)
+    endpoint_parameter_model = operation.endpoint_parameter_model
+    assert len(endpoint_parameter_model._route_accessors) == 4
+    assert len(endpoint_parameter_model._awaited_route_models) == 2
+
+
+def test_compiled_route_models_resolve_values():
+    response = client.get(
+        "/items/2?q=3", headers={"x-token": "4"}, cookies={"session": "abc"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "item_id": 2,
+        "q": 3,
+        "x_token": 4,
+        "session": "abc",
+        "has_request": True,
+        "has_context": True,
+    }
+
+
+def test_compiled_route_models_error_order():
+    response = client.get(
+        "/items/2?q=a", headers={"x-token": "b"}, cookies={"session": "abc"}
+    )
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [
+        ["header", "x-token"],
+        ["query", "q"],
+    ]
+
+
+class CustomQueryParameterResolver(QueryParameterResolver):
+    async def resolve_handle(self, ctx, *args, **kwargs):
+        return {self.model_field.name: "custom"}, []
+
+
+def test_overridden_resolver_is_not_compiled():
+    model_field = create_model_field(
+        name="q", type_=int, field_info=Query(), alias="q", required=True
+    )
+    assert QueryParameterResolver(model_field).create_accessor() is not None
+    assert CustomQueryParameterResolver(model_field).create_accessor() is None
+
+
+class Color(str, Enum):
+    red = "red"
+
+
+class Level(IntEnum):
+    low = 1
+
+
+@pytest.mark.parametrize(
+    "type_, value",
+    [
+        (int, 2),
+        (int, "2"),
+        (int, "a"),
+        (int, True),
+        (float, "2.5"),
+        (bool, "yes"),
+        (bool, "maybe"),
+        (str, "value"),
+        (str, 2),
+        (UUID, "2b5ea8e1-5c1f-4c5b-a8a4-3b1b3f0c2f6c"),
+        (UUID, "not-uuid"),
+        (Color, "red"),
+        (Color, "blue"),
+        (Level, "1"),
+        (Level, 3),
+    ],
+)
+def test_scalar_validator_matches_model_field_validate(type_, value):
+    field = get_parameter_field(
+        param_default=Query(), param_annotation=type_, param_name="q"
+    )
+    assert field.scalar_validator is not None
+    field_value, field_errors = field.validate(value, {}, loc=("query", "q"))
+    field.scalar_validator = None
+    expected_value, expected_errors = field.validate(value, {}, loc=("query", "q"))
+
+    assert field_value == expected_value
+    assert repr(field_errors) == repr(expected_errors)
+
+
+@pytest.mark.parametrize(
+    "param_default, param_annotation",
+    [
+        (Query(gt=2), int),
+        (Query(max_length=2), str),
+        (Query(), List[int]),
+        (Query(), Union[int, str]),
+        (Query(), datetime),
+    ],
+)
+def test_scalar_validator_is_not_used_for_complex_fields(
+    param_default, param_annotation
+):
+    field = get_parameter_field(
+        param_default=param_default, param_annotation=param_annotation, param_name="q"
+    )
+    assert field.scalar_validator is None
+
+
+@pytest.mark.parametrize(
+    "default, is_copied",
+    [
+        (20, False),
+        ("asc", False),
+        (None, False),
+        ((1, "a"), False),
+        (Color.red, False),
+        ([], True),
+        (["a", "b"], True),
+        ({"a": 1}, True),
+        ([{"a": 1}], True),
+    ],
+)
+def test_default_factory(default, is_copied):
+    field = get_parameter_field(
+        param_default=Query(default), param_annotation=Any, param_name="q"
+    )
+    value = get_default_factory(field)()
+    assert value == default
+    assert (value is not default) == is_copied
+
+
+def test_default_factory_copies_nested_mutable_values():
+    default = [{"a": []}]
+    field = get_parameter_field(
+        param_default=Query(default), param_annotation=Any, param_name="q"
+    )
+    value = get_default_factory(field)()
+    assert value[0] is not default[0]
+
+
+def test_missing_optional_parameter_receives_fresh_default():
+    @get("/tags")
+    def read_tags(tags: List[str] = Query([])):
+        tags.append("mutated")
+        return tags
+
+    tm.app.router.append(read_tags)
+    assert client.get("/tags").json() == ["mutated"]
+    assert client.get("/tags").json() == ["mutated"]
@@ -0,0 +1,99 @@
+from types import SimpleNamespace
+
+import pytest
+
+from ellar.common import Body, post
+from ellar.core import TestClientFactory
+from ellar.core.codecs import JSONCodec, ORJSONCodec, is_json_content_type
+from ellar.core.exception_handlers import get_json_response_type
+from ellar.core.response import JSONResponse, ORJSONResponse, UJSONResponse
+from ellar.core.routing.websocket.handler import WebSocketExtraHandler
+
+tm = TestClientFactory.create_test_module()
+
+
+@post("/items")
+def create_item(item: dict = Body()):
+    return item
+
+
+tm.app.router.append(create_item)
+client = tm.get_client()
+
+
+@pytest.mark.parametrize(
+    "content_type, expected",
+    [
+        (None, True),
+        (b"", True),
+        (b"application/json", True),
+        (b"Application/JSON; charset=utf-8", True),
+        (b"application/problem+json", True),
+        (b"application/xml", False),
+        (b"text/json", False),
+        (b"invalid", False),
+    ],
+)
+def test_is_json_content_type(content_type, expected):
+    assert is_json_content_type(content_type) is expected
+
+
+@pytest.mark.parametrize("json_codec", [JSONCodec(), ORJSONCodec()])
+def test_request_body_is_decoded_with_json_codec(json_codec):
+    tm.app.config.JSON_CODEC = json_codec
+    try:
+        response = client.post("/items", json={"name": "item"})
+        assert response.status_code == 200
+        assert response.json() == {"name": "item"}
+
+        response = client.post(
+            "/items",
+            data=b'{"name": ',
+            headers={"content-type": "application/json"},
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][0] == "body"
+    finally:
+        tm.app.config.JSON_CODEC = JSONCodec()
+
+
+def test_exception_handlers_use_json_codec_response_class():
+    tm.app.config.JSON_CODEC = ORJSONCodec()
+    tm.app.config.DEFAULT_JSON_CLASS = UJSONResponse
+    try:
+        # the codec response class is opt-in
+        assert get_json_response_type(tm.app) is UJSONResponse
+        tm.app.config.JSON_CODEC_EXCEPTION_RESPONSES = True
+        assert get_json_response_type(tm.app) is ORJSONResponse
+    finally:
+        tm.app.config.JSON_CODEC = JSONCodec()
+        tm.app.config.DEFAULT_JSON_CLASS = JSONResponse
+        tm.app.config.JSON_CODEC_EXCEPTION_RESPONSES = False
+    assert get_json_response_type(tm.app) is JSONResponse
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("json_codec", [JSONCodec(), ORJSONCodec()])
+async def test_websocket_messages_are_decoded_with_json_codec(json_codec):
+    sent = []
+
+    async def send_json(data):
+        sent.append(data)
+
+    async def close(code):
+        sent.append(code)
+
+    websocket = SimpleNamespace(
+        app=SimpleNamespace(config=SimpleNamespace(JSON_CODEC=json_codec)),
+        send_json=send_json,
+        close=close,
+    )
+    handler = WebSocketExtraHandler(
+        lambda: None, route_parameter_model=None, encoding="json"
+    )
+    data = await handler.decode(websocket, {"text": '{"name": "item"}'})
+    assert data == {"name": "item"}
+
+    with pytest.raises(RuntimeError, match="Malformed JSON"):
+        await handler.decode(websocket, {"bytes": b"{"})
+    assert sent[-1] == 1003
@@ -0,0 +1,105 @@
+from ellar.common import Controller, get, guards
+from ellar.core import TestClientFactory
+from ellar.core.guard import GuardCanActivate
+from ellar.di import injectable
+from ellar.di.scopes import RequestScope
+
+created = []
+
+
+@injectable
+class KeyStore:
+    def __init__(self):
+        created.append("key_store")
+        self.keys = {"secret"}
+
+
+@injectable
+class KeyGuard(GuardCanActivate):
+    def __init__(self, key_store: KeyStore):
+        created.append("key_guard")
+        self.key_store = key_store
+
+    async def can_activate(self, context) -> bool:
+        key = context.switch_to_http_connection().query_params.get("key")
+        return key in self.key_store.keys
+
+
+class PlainGuard(GuardCanActivate):
+    def __init__(self):
+        created.append("plain_guard")
+
+    async def can_activate(self, context) -> bool:
+        return True
+
+
+@injectable(RequestScope)
+class RequestGuard(GuardCanActivate):
+    def __init__(self):
+        created.append("request_guard")
+
+    async def can_activate(self, context) -> bool:
+        return True
+
+
+@get("/protected")
+@guards(KeyGuard, PlainGuard, RequestGuard)
+def protected():
+    return "ok"
+
+
+tm = TestClientFactory.create_test_module(services=(KeyStore,))
+tm.app.router.append(protected)
+client = tm.get_client()
+
+
+def test_guards_are_resolved_through_di():
+    assert client.get("/protected?key=secret").json() == "ok"
+    assert client.get("/protected?key=invalid").status_code == 403
+    assert client.get("/protected?key=secret").json() == "ok"
+    # singleton guards and their dependencies are built once,
+    # request scoped guard is built for every request that reaches it
+    assert created == [
+        "key_store",
+        "key_guard",
+        "plain_guard",
+        "request_guard",
+        "request_guard",
+    ]
+
+    (route,) = [route for route in tm.app.routes if route.path == "/protected"]
+    key_guard, plain_guard, request_guard = route.get_route_guards(tm.app)
+    assert isinstance(key_guard, KeyGuard)
+    assert key_guard is tm.app.injector.get(KeyGuard)
+    assert isinstance(plain_guard, PlainGuard)
+    assert request_guard is RequestGuard
+
+
+class BuildGuard(GuardCanActivate):
+    def __init__(self):
+        created.append("build_guard")
+
+    async def can_activate(self, context) -> bool:
+        return True
+
+
+@Controller("/build")
+class BuildController:
+    @get("/")
+    @guards(BuildGuard)
+    def index(self):
+        return "ok"
+
+
+def test_guards_are_resolved_when_app_is_built():
+    created.clear()
+    build_tm = TestClientFactory.create_test_module(controllers=(BuildController,))
+    assert created == ["build_guard"]
+
+    container = build_tm.app.injector.container
+    plan = container.get_resolution_plan(BuildGuard)
+    assert plan is not None
+    assert build_tm.get_client().get("/build/").json() == "ok"
+    # dispatching does not register guards, resolution plans are kept
+    assert container.get_resolution_plan(BuildGuard) is plan
+    assert created == ["build_guard"]
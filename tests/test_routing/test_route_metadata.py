@@ -0,0 +1,70 @@
+import typing as t
+
+from pydantic import BaseModel
+
+from ellar.common import Controller, get, guards, serializer_filter
+from ellar.constants import GUARDS_KEY, SERIALIZER_FILTER_KEY
+from ellar.core import TestClientFactory
+from ellar.core.guard import GuardCanActivate
+from ellar.core.routing.base import RouteMetadata
+from ellar.reflect import reflect
+from ellar.serializer import SerializerFilter
+
+
+class Item(BaseModel):
+    name: str
+    description: t.Optional[str] = None
+
+
+class DenyGuard(GuardCanActivate):
+    async def can_activate(self, context) -> bool:
+        return False
+
+
+@Controller("/metadata", version="1")
+class MetadataController:
+    @get("/item", response=Item)
+    @serializer_filter(exclude_none=True)
+    def get_item(self):
+        return dict(name="item", description=None)
+
+
+tm = TestClientFactory.create_test_module(controllers=(MetadataController,))
+client = tm.get_client()
+
+
+def get_route():
+    (route,) = [route for route in tm.app.routes if route.path == "/metadata/item"]
+    return route
+
+
+def test_route_metadata_is_frozen_when_route_is_built():
+    route = get_route()
+    assert isinstance(route.route_metadata, RouteMetadata)
+    assert route.route_metadata.controller_type is MetadataController
+    assert route.route_metadata.versions == frozenset({"1"})
+    assert route.route_metadata.guards == ()
+    assert route.route_metadata.serializer_filter.exclude_none is True
+    assert client.get("/metadata/item").json() == dict(name="item")
+
+
+def test_route_metadata_refresh():
+    route = get_route()
+    snapshot = route.route_metadata
+    guards(DenyGuard)(route.endpoint)
+    reflect.define_metadata(SERIALIZER_FILTER_KEY, SerializerFilter(), route.endpoint)
+    try:
+        # runtime changes are ignored until the snapshot is refreshed
+        assert route.route_metadata is snapshot
+        assert client.get("/metadata/item").status_code == 200
+
+        refreshed = route.refresh_route_metadata()
+        assert refreshed.guards == (DenyGuard,)
+        assert route.route_metadata is refreshed
+        assert client.get("/metadata/item").status_code == 403
+    finally:
+        reflect.delete_metadata(GUARDS_KEY, route.endpoint)
+        serializer_filter(exclude_none=True)(route.endpoint)
+        route.refresh_route_metadata()
+
+    assert client.get("/metadata/item").json() == dict(name="item")
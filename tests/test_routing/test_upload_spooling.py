@@ -0,0 +1,116 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from ellar.common import File, Form, post
+from ellar.core import TestClientFactory
+from ellar.core.datastructures import UploadFile, UploadFileOptions
+
+tm = TestClientFactory.create_test_module()
+content = b"ellar" * 100
+
+
+@post("/spooled")
+async def spooled_file(
+    file: UploadFile = File(spool_max_size=10, hash_algorithm="sha256"),
+):
+    # a rolled over temporary file is named by its file descriptor
+    on_disk = isinstance(file.file.name, int)
+    return {
+        "on_disk": on_disk,
+        "sha256": file.hexdigest(),
+        "size": len(file.memory_view()),
+        "path": os.path.exists(await file.get_path()),
+    }
+
+
+@post("/in-memory")
+async def in_memory_file(file: UploadFile = File(hash_algorithm="md5")):
+    return {
+        "path": file.path,
+        "md5": file.hexdigest(),
+        "content": file.memory_view().tobytes().decode(),
+    }
+
+
+@post("/path")
+def file_path(file: Path = File(), name: str = Form()):
+    return {"name": name, "content": file.read_text()}
+
+
+@post("/paths")
+def file_paths(files: List[Path] = File()):
+    return [path.read_text() for path in files]
+
+
+@post("/bytes")
+def file_bytes(files: List[bytes] = File()):
+    return [content.decode() for content in files]
+
+
+tm.app.router.extend([spooled_file, in_memory_file, file_path, file_paths, file_bytes])
+client = tm.get_client()
+
+
+def test_upload_is_spooled_to_disk_and_hashed():
+    response = client.post("/spooled", files={"file": ("a.txt", content)})
+    assert response.status_code == 200
+    assert response.json() == {
+        "on_disk": True,
+        "sha256": hashlib.sha256(content).hexdigest(),
+        "size": len(content),
+        "path": True,
+    }
+
+
+def test_upload_stays_in_memory_below_threshold():
+    response = client.post("/in-memory", files={"file": ("a.txt", b"ellar")})
+    assert response.json() == {
+        "path": None,
+        "md5": hashlib.md5(b"ellar").hexdigest(),
+        "content": "ellar",
+    }
+
+
+def test_upload_file_path_parameter():
+    response = client.post(
+        "/path", files={"file": ("a.txt", b"ellar")}, data={"name": "upload"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"name": "upload", "content": "ellar"}
+
+
+def test_upload_file_list_parameters():
+    files = [("files", ("a.txt", b"ellar")), ("files", ("b.txt", b"python"))]
+    response = client.post("/paths", files=files)
+    assert response.status_code == 200
+    assert response.json() == ["ellar", "python"]
+
+    response = client.post("/bytes", files=files)
+    assert response.status_code == 200
+    assert response.json() == ["ellar", "python"]
+
+
+@pytest.mark.asyncio
+async def test_upload_file_spool_dir(tmp_path):
+    upload = UploadFile(
+        "a.txt", options=UploadFileOptions(spool_max_size=1, spool_dir=str(tmp_path))
+    )
+    assert upload.path is None
+    assert upload.memory_view().tobytes() == b""
+
+    await upload.write(b"ellar")
+    assert os.path.dirname(await upload.get_path()) == str(tmp_path)
+    with upload.memory_view() as view:
+        assert view.tobytes() == b"ellar"
+        assert view.readonly
+    assert upload.hexdigest() is None
+    await upload.close()
+
+
+def test_unsupported_hash_algorithm():
+    with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+        File(hash_algorithm="unknown")
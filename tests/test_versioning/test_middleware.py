@@ -2,7 +2,7 @@ import json
 
 import pytest
 
-from ellar.constants import SCOPE_API_VERSIONING_RESOLVER
+from ellar.constants import SCOPE_API_ROUTE_VERSION, SCOPE_API_VERSIONING_RESOLVER
 from ellar.core import Config, TestClient
 from ellar.core.middleware import RequestVersioningMiddleware
 from ellar.core.versioning import (
@@ -28,6 +28,7 @@ async def assert_version_middleware_app(scope, receive, send):
 
     version_resolver = scope[SCOPE_API_VERSIONING_RESOLVER]
     assert isinstance(version_resolver, config.VERSION_RESOLVER_TYPE)
+    assert scope[SCOPE_API_ROUTE_VERSION] == version_resolver.get_route_version()
 
     await send(
         {
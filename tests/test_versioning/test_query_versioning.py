@@ -2,7 +2,9 @@ import pytest
 
 from ellar.constants import NOT_SET
 from ellar.core import TestClientFactory
+from ellar.core.routing import RouteOperationBase
 from ellar.core.versioning import VERSIONING
+from ellar.core.versioning.resolver import BaseAPIVersioningResolver
 
 from .operations import mr
 
@@ -97,3 +99,21 @@ def test_query_route_versioning_not_found(path):
     response = client.get(path)
     assert response.status_code == 404
     assert response.json() == {"detail": "Invalid version in query parameter."}
+
+
+def test_query_route_versioning_does_not_check_route_versions_per_request(
+    monkeypatch,
+):
+    tm.app.enable_versioning(VERSIONING.QUERY, version_parameter="v")
+    client = tm.get_client()
+    assert client.get("/version?v=2").json() == dict(version="v2")
+
+    def _raise(*args, **kwargs):
+        raise AssertionError("route versions must be resolved by route table")
+
+    monkeypatch.setattr(RouteOperationBase, "get_allowed_version", _raise)
+    monkeypatch.setattr(BaseAPIVersioningResolver, "can_activate", _raise)
+
+    assert client.get("/version?v=3").json() == dict(version="v3")
+    assert client.get("/version").json() == dict(version="default")
+    assert client.get("/version?v=4").status_code == 404